@@ -1,605 +1,668 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
+import bisect
+import re
+import functools
 import hashlib
+import html
 import os
-from datetime import datetime, timedelta
+import random
+import time
+from datetime import datetime
 import json
-from pdf_parser import process_pdf_files, process_pdf_to_json, preview_json_data
-
-# LangChain imports
-from langchain_openai import ChatOpenAI
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-from langchain.schema import HumanMessage, SystemMessage
-import os
 from dotenv import load_dotenv
 
+# LLM JSON 응답 파싱 가속 (orjson 미설치 환경에서는 표준 json으로 동작)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables
 load_dotenv()
 
-# Initialize LangChain model
-def get_llm():
-    """LangChain 모델 초기화"""
+# Initialize OpenAI client
+@st.cache_resource(show_spinner=False)
+def get_llm(api_key=None):
+    """OpenAI 클라이언트 초기화 (프로세스당 1회 생성 후 재사용)"""
     try:
-        api_key = os.getenv('OPENAI_API_KEY')
+        # AI 경로를 쓰지 않는 세션에서는 SDK 임포트 비용을 내지 않도록 지연 임포트
+        from openai import OpenAI
+
+        api_key = api_key or os.getenv('OPENAI_API_KEY')
         if api_key:
-            return ChatOpenAI(
-                model_name="gpt-4o-mini",
-                temperature=0.7,
-                openai_api_key=api_key
-            )
+            return OpenAI(api_key=api_key)
         else:
             return None
     except Exception as e:
-        st.warning(f"LangChain 모델 초기화 실패: {e}")
+        st.warning(f"OpenAI 클라이언트 초기화 실패: {e}")
         return None
 
-def generate_credit_guidance(data):
-    """사용자 데이터 기반 신용 관리 가이드 생성"""
-    llm = get_llm()
-    if not llm:
-        return get_default_credit_guidance(data)
-    
-    try:
-        # 신용 관리 가이드 프롬프트
-        credit_prompt = PromptTemplate(
-            input_variables=["income", "expense", "credit_score", "assets"],
-            template="""
-            사용자의 재무 상황을 분석하여 맞춤형 신용 관리 가이드를 제공해주세요.
-            
-            사용자 정보:
-            - 월 수입: {income:,}원
-            - 월 지출: {expense:,}원
-            - 신용점수: {credit_score}점
-            - 총 자산: {assets:,}원
-            
-            다음 형식으로 답변해주세요:
-            
-            ## 신용점수 향상 팁
-            - 구체적이고 실행 가능한 팁 3-4개
-            
-            ## 주의할 점
-            - 신용점수에 부정적 영향을 주는 행동 2-3개
-            
-            ## 맞춤형 권장사항
-            - 사용자의 현재 상황에 특화된 권장사항 2-3개
-            
-            답변은 한국어로 작성하고, 구체적이고 실용적인 내용으로 작성해주세요.
-            """
-        )
-        
-        # 최신 LangChain 문법 사용
-        chain = credit_prompt | llm
-        
-        result = chain.invoke({
-            "income": data['income'],
-            "expense": data['expense'],
-            "credit_score": data['credit_score'],
-            "assets": sum(data['assets'].values())
-        })
-        
-        return result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
-        st.warning(f"AI 가이드 생성 실패: {e}")
-        return get_default_credit_guidance(data)
+@functools.lru_cache(maxsize=4096)
+def _won(x):
+    """정수 금액의 천 단위 콤마 문자열 (같은 값 반복 포맷 시 캐시 적중)"""
+    return format(x, ",")
 
-def generate_financial_recommendations(data):
-    """사용자 데이터 기반 금융 상품 추천 생성"""
-    llm = get_llm()
-    if not llm:
-        return get_default_financial_recommendations(data)
-    
-    try:
-        # 금융 상품 추천 프롬프트 (더 구체적이고 실용적인 내용)
-        recommendation_prompt = PromptTemplate(
-            input_variables=["income", "credit_score", "assets", "savings", "expense"],
-            template="""
-            사용자의 재무 상황을 분석하여 구체적이고 실용적인 금융 상품을 추천해주세요.
-            
-            사용자 정보:
-            - 월 수입: {income:,}원
-            - 월 지출: {expense:,}원
-            - 신용점수: {credit_score}점
-            - 총 자산: {assets:,}원
-            - 월 저축: {savings:,}원
-            
-            다음 형식으로 구체적으로 답변해주세요:
-            
-            ## 💳 추천 신용카드 (실제 카드명 포함)
-            - 신용점수와 소득을 고려한 구체적인 카드 상품 3-4개
-            - 각 카드의 주요 혜택과 연회비, 발급 조건 명시
-            - 사용자 상황에 맞는 카드 선택 이유 설명
-            
-            ## 🏦 추천 대출 상품 (구체적인 상품명과 조건)
-            - 신용점수와 소득을 고려한 구체적인 대출 상품 2-3개
-            - 각 상품의 대출 한도, 금리, 상환 기간 명시
-            - 사용자 상황에 맞는 대출 상품 선택 이유 설명
-            
-            ## 💰 추천 적금/투자 상품 (구체적인 상품명과 수익률)
-            - 자산 상황과 위험 성향을 고려한 적금/투자 상품 3-4개
-            - 각 상품의 금리, 가입 기간, 최소 가입 금액 명시
-            - 사용자 상황에 맞는 상품 선택 이유와 투자 전략 설명
-            
-            ## 📊 신용점수별 금융 상품 이용 가능성
-            - 현재 신용점수로 이용 가능한 상품과 제한사항
-            - 신용점수 향상 시 추가로 이용 가능한 상품
-            - 신용점수 관리 전략과 목표 설정
-            
-            답변은 한국어로 작성하고, 실제 금융 상품처럼 구체적이고 실용적으로 작성해주세요.
-            각 상품마다 구체적인 조건, 혜택, 주의사항을 포함해주세요.
-            """
-        )
-        
-        # 최신 LangChain 문법 사용
-        chain = recommendation_prompt | llm
-        
-        result = chain.invoke({
-            "income": data['income'],
-            "credit_score": data['credit_score'],
-            "assets": sum(data['assets'].values()),
-            "savings": data['savings'],
-            "expense": data['expense']
-        })
-        
-        return result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
-        st.warning(f"금융 상품 추천 생성 실패: {e}")
-        return get_default_financial_recommendations(data)
+def _assets_total(data):
+    """총 자산을 정수 하나로 정규화 (캐시 키·프롬프트·파생 수치가 같은 값을 공유)"""
+    # 정상 경로는 단일 dict 조회 — isinstance 분기는 _normalize_data 한 곳에만 있다
+    total = data.get('assets_total')
+    if total is not None:
+        return total
+    return _normalize_data(data)['assets_total']
+
+def _normalize_data(data):
+    """추출 직후 한 번만 파생 스칼라를 계산해 저장
+
+    이후 모든 소비자는 isinstance 검사와 dict 합산 없이 스칼라 필드를 읽는다.
+    """
+    assets = data['assets']
+    data['assets_total'] = sum(assets.values()) if isinstance(assets, dict) else int(assets)
+    return data
+
+def _bucket(data):
+    """재무 수치를 캐시 버킷 단위로 반올림
+
+    수입 431만원과 429만원의 플랜은 사실상 같으므로 수입/지출/저축은 10만원,
+    신용점수는 10점, 총 자산은 100만원 단위로 묶어 인접 사용자들이 같은
+    캐시 항목을 공유하게 한다. 프롬프트에도 버킷 값이 그대로 들어간다.
+    """
+    return (
+        int(round(data['income'], -5)),
+        int(round(data['expense'], -5)),
+        (data['credit_score'] // 10) * 10,
+        int(round(_assets_total(data), -6)),
+        int(round(data['savings'], -5)),
+    )
+
+def generate_credit_guidance(data, version=0):
+    """사용자 데이터 기반 신용 관리 가이드 생성 (version은 캐시 버스터)"""
+    return generate_all(data, version)['credit']
+
+def generate_financial_recommendations(data, version=0):
+    """사용자 데이터 기반 금융 상품 추천 생성 (version은 캐시 버스터)"""
+    return generate_all(data, version)['recommendations']
+
+# 신용 등급별 기본 가이드 뼈대 (등급별 문구는 고정이므로 모듈 로드 시 1회만 구성)
+_CREDIT_GUIDANCE_TEMPLATES = {
+    'good': """
+    ## 💡 맞춤형 신용 관리 가이드 (우수 단계)
 
-def get_default_credit_guidance(data):
-    """기본 신용 관리 가이드 (LangChain 실패 시)"""
-    credit_score = data['credit_score']
-    income = data['income']
-    
-    if credit_score >= 750:
-        level = "우수"
-        tips = [
-            "현재 우수한 신용점수를 유지하고 있습니다.",
-            "신용카드 사용량을 30% 이하로 유지하세요.",
-            "정기적으로 신용점수를 모니터링하세요."
-        ]
-        warnings = [
-            "과도한 신용카드 발급은 신용점수에 영향을 줄 수 있습니다.",
-            "대출 상환을 정시에 완료하세요."
-        ]
-    elif credit_score >= 650:
-        level = "양호"
-        tips = [
-            "신용점수를 더욱 향상시킬 수 있습니다.",
-            "신용카드 사용량을 40% 이하로 유지하세요.",
-            "다양한 금융거래를 활성화하세요."
-        ]
-        warnings = [
-            "연체는 신용점수에 큰 영향을 줍니다.",
-            "단기간에 여러 금융사에 대출 신청을 자제하세요."
-        ]
-    else:
-        level = "개선 필요"
-        tips = [
-            "신용점수 향상을 위한 노력이 필요합니다.",
-            "신용카드 사용량을 20% 이하로 유지하세요.",
-            "정시에 모든 대출을 상환하세요."
-        ]
-        warnings = [
-            "현금서비스나 카드론 이용을 최소화하세요.",
-            "주거래 은행과의 관계를 개선하세요."
-        ]
-    
-    return f"""
-    ## 💡 맞춤형 신용 관리 가이드 ({level} 단계)
-    
     ### ✅ 신용점수 향상 팁
-    {chr(10).join([f"- {tip}" for tip in tips])}
-    
+    - 현재 우수한 신용점수를 유지하고 있습니다.
+- 신용카드 사용량을 30% 이하로 유지하세요.
+- 정기적으로 신용점수를 모니터링하세요.
+
     ### ⚠️ 주의할 점
-    {chr(10).join([f"- {warning}" for warning in warnings])}
-    
+    - 과도한 신용카드 발급은 신용점수에 영향을 줄 수 있습니다.
+- 대출 상환을 정시에 완료하세요.
+
     ### 🎯 맞춤형 권장사항
     - 현재 신용점수 {credit_score}점에서 목표 750점 달성을 위해 노력하세요
     - 월 수입 {income:,}원을 고려하여 적절한 신용한도를 유지하세요
     - 정기적인 신용점수 모니터링으로 변화를 추적하세요
-    """
+    """,
+    'ok': """
+    ## 💡 맞춤형 신용 관리 가이드 (양호 단계)
 
-def get_default_financial_recommendations(data):
-    """기본 금융 상품 추천 (LangChain 실패 시)"""
-    credit_score = data['credit_score']
-    income = data['income']
-    
-    if credit_score >= 750:
-        loans = [
-            "🏠 **주택담보대출**: 최우대 금리, 장기 상환 가능",
-            "💼 **사업자 대출**: 사업 확장 자금, 최대 5억원"
-        ]
-        cards = [
-            "🏆 **프리미엄 신용카드**: 높은 한도, 다양한 혜택",
-            "✈️ **여행 전용 카드**: 마일리지 적립, 여행 보험"
-        ]
-        savings = [
-            "💰 **고금리 적금**: 연 3.5% 이상, 최대 3천만원",
-            "📈 **주식형 펀드**: 성장성 투자, 위험 분산"
-        ]
-    elif credit_score >= 650:
-        loans = [
-            "🏠 **전세자금대출**: 안정적 상환, 저금리",
-            "🚗 **자동차 대출**: 필요 자금, 적정 금리"
-        ]
-        cards = [
-            "💳 **일반 신용카드**: 기본 혜택, 안정적 한도",
-            "🎁 **포인트 카드**: 포인트 적립, 할인 혜택"
-        ]
-        savings = [
-            "💰 **청년 우대 적금**: 연 3.0% 이상, 최대 1천만원",
-            "📊 **채권형 펀드**: 안정성 투자, 정기 수익"
-        ]
-    else:
-        loans = [
-            "💰 **생활안정자금**: 소액 대출, 간편 상환",
-            "📚 **교육 대출**: 자기계발, 장기 투자"
-        ]
-        cards = [
-            "🏦 **체크카드**: 신용점수 영향 없음, 현금 사용",
-            "💰 **선불카드**: 사용한 만큼만 충전, 안전함"
-        ]
-        savings = [
-            "💰 **기본 적금**: 연 2.5% 이상, 안전한 저축",
-            "🏦 **정기예금**: 원금 보장, 안정적 수익"
-        ]
-    
-    return f"""
+    ### ✅ 신용점수 향상 팁
+    - 신용점수를 더욱 향상시킬 수 있습니다.
+- 신용카드 사용량을 40% 이하로 유지하세요.
+- 다양한 금융거래를 활성화하세요.
+
+    ### ⚠️ 주의할 점
+    - 연체는 신용점수에 큰 영향을 줍니다.
+- 단기간에 여러 금융사에 대출 신청을 자제하세요.
+
+    ### 🎯 맞춤형 권장사항
+    - 현재 신용점수 {credit_score}점에서 목표 750점 달성을 위해 노력하세요
+    - 월 수입 {income:,}원을 고려하여 적절한 신용한도를 유지하세요
+    - 정기적인 신용점수 모니터링으로 변화를 추적하세요
+    """,
+    'bad': """
+    ## 💡 맞춤형 신용 관리 가이드 (개선 필요 단계)
+
+    ### ✅ 신용점수 향상 팁
+    - 신용점수 향상을 위한 노력이 필요합니다.
+- 신용카드 사용량을 20% 이하로 유지하세요.
+- 정시에 모든 대출을 상환하세요.
+
+    ### ⚠️ 주의할 점
+    - 현금서비스나 카드론 이용을 최소화하세요.
+- 주거래 은행과의 관계를 개선하세요.
+
+    ### 🎯 맞춤형 권장사항
+    - 현재 신용점수 {credit_score}점에서 목표 750점 달성을 위해 노력하세요
+    - 월 수입 {income:,}원을 고려하여 적절한 신용한도를 유지하세요
+    - 정기적인 신용점수 모니터링으로 변화를 추적하세요
+    """,
+}
+
+# 신용 등급별 기본 상품 추천 뼈대
+_RECOMMENDATION_TEMPLATES = {
+    'good': """
     ## 🏦 맞춤형 금융 상품 추천
-    
+
     ### 💳 추천 신용카드
-    {chr(10).join([f"- {card}" for card in cards])}
-    
+    - 🏆 **프리미엄 신용카드**: 높은 한도, 다양한 혜택
+- ✈️ **여행 전용 카드**: 마일리지 적립, 여행 보험
+
     ### 🏦 추천 대출 상품
-    {chr(10).join([f"- {loan}" for loan in loans])}
-    
+    - 🏠 **주택담보대출**: 최우대 금리, 장기 상환 가능
+- 💼 **사업자 대출**: 사업 확장 자금, 최대 5억원
+
     ### 💰 추천 적금/투자 상품
-    {chr(10).join([f"- {saving}" for saving in savings])}
-    
+    - 💰 **고금리 적금**: 연 3.5% 이상, 최대 3천만원
+- 📈 **주식형 펀드**: 성장성 투자, 위험 분산
+
     ### 📊 추천 근거
     - 신용점수 {credit_score}점 기준으로 최적화된 상품 선별
     - 월 수입 {income:,}원을 고려한 상환 능력 분석
     - 개인 맞춤형 위험도와 수익성 균형 고려
-    """
+    """,
+    'ok': """
+    ## 🏦 맞춤형 금융 상품 추천
+
+    ### 💳 추천 신용카드
+    - 💳 **일반 신용카드**: 기본 혜택, 안정적 한도
+- 🎁 **포인트 카드**: 포인트 적립, 할인 혜택
+
+    ### 🏦 추천 대출 상품
+    - 🏠 **전세자금대출**: 안정적 상환, 저금리
+- 🚗 **자동차 대출**: 필요 자금, 적정 금리
+
+    ### 💰 추천 적금/투자 상품
+    - 💰 **청년 우대 적금**: 연 3.0% 이상, 최대 1천만원
+- 📊 **채권형 펀드**: 안정성 투자, 정기 수익
+
+    ### 📊 추천 근거
+    - 신용점수 {credit_score}점 기준으로 최적화된 상품 선별
+    - 월 수입 {income:,}원을 고려한 상환 능력 분석
+    - 개인 맞춤형 위험도와 수익성 균형 고려
+    """,
+    'bad': """
+    ## 🏦 맞춤형 금융 상품 추천
+
+    ### 💳 추천 신용카드
+    - 🏦 **체크카드**: 신용점수 영향 없음, 현금 사용
+- 💰 **선불카드**: 사용한 만큼만 충전, 안전함
+
+    ### 🏦 추천 대출 상품
+    - 💰 **생활안정자금**: 소액 대출, 간편 상환
+- 📚 **교육 대출**: 자기계발, 장기 투자
+
+    ### 💰 추천 적금/투자 상품
+    - 💰 **기본 적금**: 연 2.5% 이상, 안전한 저축
+- 🏦 **정기예금**: 원금 보장, 안정적 수익
+
+    ### 📊 추천 근거
+    - 신용점수 {credit_score}점 기준으로 최적화된 상품 선별
+    - 월 수입 {income:,}원을 고려한 상환 능력 분석
+    - 개인 맞춤형 위험도와 수익성 균형 고려
+    """,
+}
+
+def _credit_tier(credit_score):
+    """신용점수를 기본 템플릿 키로 변환"""
+    if credit_score >= 750:
+        return 'good'
+    if credit_score >= 650:
+        return 'ok'
+    return 'bad'
+
+def get_default_credit_guidance(data):
+    """기본 신용 관리 가이드 (LLM 실패 시)"""
+    credit_score = data['credit_score']
+    return _CREDIT_GUIDANCE_TEMPLATES[_credit_tier(credit_score)].format(
+        credit_score=credit_score, income=data['income'])
+
+def get_default_financial_recommendations(data):
+    """기본 금융 상품 추천 (LLM 실패 시)"""
+    credit_score = data['credit_score']
+    return _RECOMMENDATION_TEMPLATES[_credit_tier(credit_score)].format(
+        credit_score=credit_score, income=data['income'])
+
+# 월 납입 추천액의 상한/소득 비율 (키 순서대로 한 번의 벡터 연산으로 계산)
+_PLAN_KEYS = [
+    'recommended_youth_account', 'recommended_hope_savings',
+    'recommended_tomorrow_account', 'total_government_monthly',
+    'subscription_savings', 'subscription_account',
+    'subscription_fund', 'total_subscription',
+]
+_PLAN_CAPS = np.array([500000, 300000, 200000, 1000000, 500000, 300000, 200000, 1000000])
+_PLAN_PCTS = np.array([0.15, 0.10, 0.08, 0.25, 0.15, 0.10, 0.08, 0.33])
+
+def _capped_plan_amounts(income):
+    """소득 비율 기반 추천액을 상한과 함께 일괄 계산"""
+    return dict(zip(_PLAN_KEYS, np.minimum(_PLAN_CAPS, (income * _PLAN_PCTS).astype(np.int64)).tolist()))
+
+# 플랜 생성에 쓰이는 파생 수치 (LLM 프롬프트와 기본 플랜이 공유, 입력 조합별 1회만 계산)
+@functools.lru_cache(maxsize=32)
+def _derive_plan_metrics(income, expense, credit_score, assets, savings):
+    """재무 입력값에서 플랜 템플릿용 파생 수치를 계산"""
+    target_savings_ratio = 0.25 if income >= 4000000 else 0.20
+    target_monthly_savings = int(income * target_savings_ratio)
+    return {
+        **_capped_plan_amounts(income),
+        'income': income,
+        'expense': expense,
+        'credit_score': credit_score,
+        'assets': assets,
+        'savings': savings,
+        'current_savings_ratio': savings / income if income > 0 else 0,
+        'target_savings_ratio': target_savings_ratio,
+        'target_savings_ratio_mid': target_savings_ratio + 0.05,
+        'target_savings_ratio_high': target_savings_ratio + 0.1,
+        'target_monthly_savings': target_monthly_savings,
+        'improvement_needed': max(0, target_monthly_savings - savings),
+        'emergency_fund_target': int(income * 6),
+        'emergency_fund_3month': int(income * 3),
+        'stage1_savings': min(target_monthly_savings, savings + 100000),
+        'stage2_savings': target_monthly_savings,
+        'stage3_savings': int(target_monthly_savings * 1.1),
+        'stage4_savings': int(target_monthly_savings * 1.2),
+        # 정수 나눗셈 유지, 통합 데이터의 평균 소득(float) 대비 int()로 방어
+        'safe_assets_monthly': int(income // 10),
+        'growth_assets_monthly': int(income // 10),
+        'high_risk_monthly': int(income // 20),
+        'income_pct_01': int(income // 100),
+        'income_pct_02': int(income // 50),
+        'income_pct_03': int(income * 3 // 100),
+        'income_pct_05': int(income // 20),
+        'income_pct_06': int(income * 3 // 50),
+        'target_credit_score': min(900, credit_score + 30),
+        'target_assets_1year': int(assets * 1.3),
+        'subscription_fund_6month': int(income * 6),
+        'passive_income_start': int(income // 50),
+        'passive_income_target': int(income // 20),
+        'financial_independence': int(income * 36),
+        'yearly_savings': int(target_monthly_savings * 12),
+        'yearly_investment_return': int(target_monthly_savings * 12 * 0.06),
+        'total_1year': int(assets + target_monthly_savings * 12 * 1.06),
+        'three_year_savings': int(target_monthly_savings * 12 * 3),
+        'compound_effect': int(target_monthly_savings * 12 * 3 * 0.2),
+        'total_3year': int(assets + target_monthly_savings * 12 * 3 * 1.2),
+    }
+
+# 종합 금융 플랜 프롬프트 뼈대 (호출마다 수십 개의 문자열 결합을 피하기 위해 모듈 상수로 유지)
+_COMPREHENSIVE_PLAN_TEMPLATE = """
+        사용자의 재무 상황을 분석하여 청년 맞춤형 종합 금융 플랜을 제공해주세요.
+        사용자별 수치는 프롬프트 마지막의 "사용자 정보"를 참고하세요.
+        (고정 지침을 앞에, 사용자 값을 뒤에 두어 공통 접두부가 프롬프트 캐시에 적중하도록 한다)
+
+        다음 형식으로 구체적이고 실용적으로 답변해주세요:
+        
+        ## 🏛️ 청년 정부지원 금융상품 상세 가이드
+        
+        ### 📋 청년도약계좌 (2024년 기준)
+        - **가입 조건**: 만 19-34세, 연소득 5,500만원 이하
+        - **가입 한도**: 최대 3천만원 (5년간 분할 가입)
+        - **권장 월 가입금액**: {recommended_youth_account:,}원
+        - **정부 지원**: 연 3.5% 금리 보장, 세제혜택
+        - **가입 전략**: 월급일 다음날 자동이체, 생일 기준 분산 가입
+        
+        ### 💰 청년희망적금 (2024년 기준)
+        - **가입 조건**: 만 19-34세, 연소득 4,000만원 이하
+        - **가입 한도**: 최대 1천만원 (3년간 분할 가입)
+        - **권장 월 가입금액**: {recommended_hope_savings:,}원
+        - **정부 지원**: 연 2.5% 금리 보장, 중도해지 시에도 이자 지급
+        - **가입 전략**: 3년 계획으로 단계적 가입, 비상금 대용
+        
+        ### 🏦 청년내일저축계좌 (2024년 기준)
+        - **가입 조건**: 만 19-34세, 연소득 3,600만원 이하
+        - **가입 한도**: 최대 500만원 (1년간 분할 가입)
+        - **권장 월 가입금액**: {recommended_tomorrow_account:,}원
+        - **정부 지원**: 연 2.0% 금리 보장, 1년 후 자유로운 출금
+        - **가입 전략**: 단기 목표 자금으로 활용, 1년 후 재가입
+        
+        ### 🎯 정부지원상품 가입 우선순위 및 전략
+        - **1순위**: 청년도약계좌 (장기 자산 형성)
+        - **2순위**: 청년희망적금 (중기 저축)
+        - **3순위**: 청년내일저축계좌 (단기 목표)
+        - **총 월 가입금액**: {total_government_monthly:,}원 (소득의 25% 이내)
+        
+        ## 💰 맞춤형 저축 및 투자 전략
+        
+        ### 📊 현재 상황 분석
+        - **현재 월 저축**: {savings:,}원 (소득 대비 {current_savings_ratio:.1%})
+        - **목표 월 저축**: {target_monthly_savings:,}원 (소득의 25%)
+        - **개선 필요 금액**: {improvement_needed:,}원
+        - **비상금 목표**: {emergency_fund_target:,}원 (6개월치 생활비)
+        
+        ### 🎯 단계별 저축 계획
+        - **1단계 (1-3개월)**: 월 {stage1_savings:,}원 저축
+        - **2단계 (4-6개월)**: 월 {stage2_savings:,}원 저축 달성
+        - **3단계 (7-12개월)**: 월 {stage3_savings:,}원으로 확대
+        - **4단계 (1년 이후)**: 월 {stage4_savings:,}원으로 안정화
+        
+        ## 📊 청약 및 투자 상품별 구체적 투자 금액
+        
+        ### 🏠 청약 상품 투자 전략
+        - **청약저축**: 월 {subscription_savings:,}원 (총 자산의 15%)
+        - **청약통장**: 월 {subscription_account:,}원 (총 자산의 10%)
+        - **청약펀드**: 월 {subscription_fund:,}원 (총 자산의 8%)
+        - **총 청약 투자**: 월 {total_subscription:,}원
+        
+        ### 📈 위험도별 투자 포트폴리오
+        
+        #### 🟢 안전자산 (40% - {safe_assets_monthly:,}원)
+        - **정기예금**: 월 {income_pct_05:,}원 (연 2.5-3.0%)
+        - **적금**: 월 {income_pct_03:,}원 (연 2.8-3.5%)
+        - **국채/공사채**: 월 {income_pct_02:,}원 (연 2.0-2.5%)
+        
+        #### 🟡 성장자산 (40% - {growth_assets_monthly:,}원)
+        - **주식형 펀드**: 월 {income_pct_06:,}원 (연 5-8% 예상)
+        - **ETF**: 월 {income_pct_03:,}원 (연 4-6% 예상)
+        - **ISA 계좌**: 월 {income_pct_01:,}원 (세제혜택)
+        
+        #### 🔴 고위험자산 (20% - {high_risk_monthly:,}원)
+        - **개별 주식**: 월 {income_pct_03:,}원 (연 8-15% 예상)
+        - **부동산 투자신탁**: 월 {income_pct_02:,}원 (연 6-10% 예상)
+        
+        ### 💡 분산 투자 전략
+        - **시간 분산**: 월별 정기 투자로 평균 비용 효과
+        - **상품 분산**: 8개 이상 상품으로 리스크 분산
+        - **기관 분산**: 3개 이상 금융기관 활용
+        - **리밸런싱**: 분기별 포트폴리오 점검 및 조정
+        
+        ## 🎯 단계별 목표 설정
+        
+        ### 📅 단기 목표 (3-6개월)
+        - **비상금 확보**: {emergency_fund_3month:,}원 (3개월치 생활비)
+        - **월 저축률 달성**: 20% → 25% → 30%
+        - **정부지원상품 가입**: 2개 이상 상품 가입
+        - **신용점수 향상**: {credit_score}점 → {target_credit_score}점
+        
+        ### 📈 중기 목표 (6개월-1년)
+        - **총 자산 증대**: {assets:,}원 → {target_assets_1year:,}원 (30% 증가)
+        - **투자 포트폴리오 구축**: 5개 이상 상품으로 다각화
+        - **청약 자금 확보**: {subscription_fund_6month:,}원 (6개월치 청약 자금)
+        - **수동소득 시작**: 월 {passive_income_start:,}원 배당금/이자 수익
+        
+        ### 🚀 장기 목표 (1-3년)
+        - **자산 다각화**: 부동산, 해외투자, 대체투자 등
+        - **수동소득 확대**: 월 {passive_income_target:,}원 (소득의 5%)
+        - **재무 독립**: {financial_independence:,}원 자산 확보
+        - **투자 수익률**: 연평균 6-8% 달성
+        
+        ## 💡 실행 가능한 액션 플랜
+        
+        ### ⚡ 즉시 실행 (이번 주)
+        1. **청년도약계좌 가입 신청**: {recommended_youth_account:,}원/월
+        2. **자동이체 설정**: 월급일 다음날 자동 저축
+        3. **현재 지출 분석**: 절약 가능 항목 파악 및 개선
+        
+        ### 📋 주간 체크리스트
+        - [ ] 월 저축 목표 달성 확인
+        - [ ] 투자 상품 수익률 체크
+        - [ ] 신용점수 변화 모니터링
+        - [ ] 정부지원상품 신규 상품 확인
+        - [ ] 포트폴리오 리밸런싱 검토
+        
+        ### 📊 월간 체크리스트
+        - [ ] 전체 자산 현황 점검
+        - [ ] 투자 수익률 분석 및 전략 조정
+        - [ ] 새로운 금융 상품 검토
+        - [ ] 목표 달성도 평가 및 계획 수정
+        - [ ] 세금 절약 방안 검토
+        
+        ### 🎁 목표 달성 보상 시스템
+        - **월 저축 목표 달성**: 외식 1회 (5만원 이내)
+        - **분기 목표 달성**: 소원 상품 구매 (10만원 이내)
+        - **연간 목표 달성**: 여행 또는 특별 경험 (50만원 이내)
+        - **신용점수 향상**: 50점당 소원 상품 (5만원 이내)
+        
+        ## 📊 예상 결과 및 시뮬레이션
+        
+        ### 💰 1년 후 예상 자산
+        - **기존 자산**: {assets:,}원
+        - **저축 누적**: {yearly_savings:,}원
+        - **투자 수익**: {yearly_investment_return:,}원 (6% 수익률)
+        - **총 예상 자산**: {total_1year:,}원
+        
+        ### 📈 3년 후 예상 자산
+        - **저축 누적**: {three_year_savings:,}원
+        - **복리 효과**: {compound_effect:,}원 (복리 수익)
+        - **총 예상 자산**: {total_3year:,}원
+        
+        ### 🎯 투자 수익률 시나리오
+        - **보수적 시나리오**: 연평균 4-5% (안전자산 중심)
+        - **균형적 시나리오**: 연평균 6-8% (현재 포트폴리오)
+        - **공격적 시나리오**: 연평균 8-12% (고위험자산 확대)
+        
+        ## ⚠️ 주의사항 및 리스크 관리
+        
+        ### 🔒 리스크 관리 전략
+        - **비상금 우선**: 6개월치 생활비 확보 후 투자 시작
+        - **분산 투자**: 한 상품에 20% 이상 집중 투자 금지
+        - **정기 점검**: 월 1회 포트폴리오 현황 점검
+        - **리스크 조정**: 시장 상황에 따른 투자 비중 조정
+        
+        ### 📋 투자 시작 전 체크리스트
+        - [ ] 비상금 6개월치 확보 완료
+        - [ ] 월 저축 계획 수립 및 실행
+        - [ ] 정부지원상품 가입 완료
+        - [ ] 투자 상품 이해도 향상
+        - [ ] 전문가 상담 또는 교육 프로그램 참여
+        
+        답변은 한국어로 작성하고, 모든 금액은 구체적인 숫자로 명시해주세요.
+        실제 금융 상품명과 조건을 포함하여 실용적으로 작성해주세요.
+        사용자의 현재 상황에 맞는 구체적인 행동 지침을 제공해주세요.
+
+        사용자 정보:
+        - 월 수입: {income:,}원
+        - 월 지출: {expense:,}원
+        - 신용점수: {credit_score}점
+        - 총 자산: {assets:,}원
+        - 월 저축: {savings:,}원
+        - 연령대: 청년층 (20-30대)
+        """
+
+# 통합 프롬프트: 세 가지 생성을 한 번의 JSON 응답으로 요청
+_COMBINED_PROMPT_TEMPLATE = """
+사용자의 재무 상황을 분석하여 아래 세 필드를 가진 하나의 JSON 객체로 답변해주세요.
+각 필드 값은 한국어 마크다운 문자열입니다.
+
+{{
+  "credit": "맞춤형 신용 관리 가이드",
+  "recommendations": "맞춤형 금융 상품 추천",
+  "plan": "청년 맞춤형 종합 금융 플랜"
+}}
+
+[credit 필드 작성 지침]
+## 신용점수 향상 팁: 구체적이고 실행 가능한 팁 3-4개
+## 주의할 점: 신용점수에 부정적 영향을 주는 행동 2-3개
+## 맞춤형 권장사항: 사용자의 현재 상황에 특화된 권장사항 2-3개
+
+[recommendations 필드 작성 지침]
+## 💳 추천 신용카드 (실제 카드명 포함): 신용점수와 소득을 고려한 카드 상품 3-4개, 혜택/연회비/발급 조건 명시
+## 🏦 추천 대출 상품 (구체적인 상품명과 조건): 대출 상품 2-3개, 한도/금리/상환 기간 명시
+## 💰 추천 적금/투자 상품 (구체적인 상품명과 수익률): 상품 3-4개, 금리/가입 기간/최소 가입 금액 명시
+## 📊 신용점수별 금융 상품 이용 가능성: 현재 이용 가능 상품과 제한사항, 향상 시 추가 상품, 관리 전략
+
+[plan 필드 작성 지침]
+""" + _COMPREHENSIVE_PLAN_TEMPLATE + """
+
+모든 금액은 구체적인 숫자로, 실제 금융 상품명과 조건을 포함하여 실용적으로 작성해주세요.
+"""
+
+# 금융 상담 프롬프트 (호출마다 템플릿 문자열을 재구성하지 않도록 모듈 상수로 유지)
+_FINANCIAL_ADVICE_TEMPLATE = """
+            당신은 친근하고 전문적인 AI 금융 상담사 '머치'입니다.
+            사용자의 금융 고민에 대해 구체적이고 실용적인 조언을 제공해주세요.
 
-def generate_comprehensive_financial_plan(data):
-    """사용자 데이터 기반 종합 금융 플랜 생성 (정부지원상품 포함)"""
-    llm = get_llm()
-    if not llm:
-        return get_default_comprehensive_plan(data)
-    
-    try:
-        # 계산된 값들을 미리 준비
-        income = data['income']
-        expense = data['expense']
-        credit_score = data['credit_score']
-        assets = sum(data['assets'].values()) if isinstance(data['assets'], dict) else data['assets']
-        savings = data['savings']
-        
-        # 계산된 값들
-        recommended_youth_account = min(500000, int(income * 0.15))
-        recommended_hope_savings = min(300000, int(income * 0.1))
-        recommended_tomorrow_account = min(200000, int(income * 0.08))
-        total_government_monthly = min(1000000, int(income * 0.25))
-        
-        current_savings_ratio = savings / income * 100
-        target_monthly_savings = int(income * 0.25)
-        improvement_needed = max(0, target_monthly_savings - savings)
-        emergency_fund_target = int(income * 6)
-        
-        stage1_savings = min(int(income * 0.2), savings + 100000)
-        stage2_savings = int(income * 0.25)
-        stage3_savings = int(income * 0.3)
-        stage4_savings = int(income * 0.35)
-        
-        subscription_savings = min(500000, int(income * 0.15))
-        subscription_account = min(300000, int(income * 0.1))
-        subscription_fund = min(200000, int(income * 0.08))
-        total_subscription = min(1000000, int(income * 0.33))
-        
-        safe_assets_monthly = int(income * 0.1)
-        growth_assets_monthly = int(income * 0.1)
-        high_risk_monthly = int(income * 0.05)
-        
-        emergency_fund_3month = int(income * 3)
-        target_credit_score = min(900, credit_score + 30)
-        target_assets_1year = int(assets * 1.3)
-        subscription_fund_6month = int(income * 6)
-        passive_income_start = int(income * 0.02)
-        passive_income_target = int(income * 0.05)
-        financial_independence = int(income * 12 * 3)
-        
-        yearly_savings = int(income * 0.25 * 12)
-        yearly_investment_return = int(income * 0.25 * 12 * 0.06)
-        total_1year = int(assets + income * 0.25 * 12 * 1.06)
-        
-        three_year_savings = int(income * 0.25 * 12 * 3)
-        compound_effect = int(income * 0.25 * 12 * 3 * 0.2)
-        total_3year = int(assets + income * 0.25 * 12 * 3 * 1.2)
-        
-        # 종합 금융 플랜 프롬프트 (계산된 값들 사용)
-        plan_prompt = PromptTemplate(
-            input_variables=["income", "expense", "credit_score", "assets", "savings", "age"],
-            template="""
-            사용자의 재무 상황을 분석하여 청년 맞춤형 종합 금융 플랜을 제공해주세요.
-            
             사용자 정보:
             - 월 수입: {income:,}원
             - 월 지출: {expense:,}원
             - 신용점수: {credit_score}점
             - 총 자산: {assets:,}원
             - 월 저축: {savings:,}원
-            - 연령대: 청년층 (20-30대)
-            
-            다음 형식으로 구체적이고 실용적으로 답변해주세요:
-            
-            ## 🏛️ 청년 정부지원 금융상품 상세 가이드
-            
-            ### 📋 청년도약계좌 (2024년 기준)
-            - **가입 조건**: 만 19-34세, 연소득 5,500만원 이하
-            - **가입 한도**: 최대 3천만원 (5년간 분할 가입)
-            - **권장 월 가입금액**: """ + f"{recommended_youth_account:,}원" + """
-            - **정부 지원**: 연 3.5% 금리 보장, 세제혜택
-            - **가입 전략**: 월급일 다음날 자동이체, 생일 기준 분산 가입
-            
-            ### 💰 청년희망적금 (2024년 기준)
-            - **가입 조건**: 만 19-34세, 연소득 4,000만원 이하
-            - **가입 한도**: 최대 1천만원 (3년간 분할 가입)
-            - **권장 월 가입금액**: """ + f"{recommended_hope_savings:,}원" + """
-            - **정부 지원**: 연 2.5% 금리 보장, 중도해지 시에도 이자 지급
-            - **가입 전략**: 3년 계획으로 단계적 가입, 비상금 대용
-            
-            ### 🏦 청년내일저축계좌 (2024년 기준)
-            - **가입 조건**: 만 19-34세, 연소득 3,600만원 이하
-            - **가입 한도**: 최대 500만원 (1년간 분할 가입)
-            - **권장 월 가입금액**: """ + f"{recommended_tomorrow_account:,}원" + """
-            - **정부 지원**: 연 2.0% 금리 보장, 1년 후 자유로운 출금
-            - **가입 전략**: 단기 목표 자금으로 활용, 1년 후 재가입
-            
-            ### 🎯 정부지원상품 가입 우선순위 및 전략
-            - **1순위**: 청년도약계좌 (장기 자산 형성)
-            - **2순위**: 청년희망적금 (중기 저축)
-            - **3순위**: 청년내일저축계좌 (단기 목표)
-            - **총 월 가입금액**: """ + f"{total_government_monthly:,}원" + """ (소득의 25% 이내)
-            
-            ## 💰 맞춤형 저축 및 투자 전략
-            
-            ### 📊 현재 상황 분석
-            - **현재 월 저축**: {savings:,}원 (소득 대비 """ + f"{current_savings_ratio:.1f}%" + """)
-            - **목표 월 저축**: """ + f"{target_monthly_savings:,}원" + """ (소득의 25%)
-            - **개선 필요 금액**: """ + f"{improvement_needed:,}원" + """
-            - **비상금 목표**: """ + f"{emergency_fund_target:,}원" + """ (6개월치 생활비)
-            
-            ### 🎯 단계별 저축 계획
-            - **1단계 (1-3개월)**: 월 """ + f"{stage1_savings:,}원" + """ 저축
-            - **2단계 (4-6개월)**: 월 """ + f"{stage2_savings:,}원" + """ 저축 달성
-            - **3단계 (7-12개월)**: 월 """ + f"{stage3_savings:,}원" + """으로 확대
-            - **4단계 (1년 이후)**: 월 """ + f"{stage4_savings:,}원" + """으로 안정화
-            
-            ## 📊 청약 및 투자 상품별 구체적 투자 금액
-            
-            ### 🏠 청약 상품 투자 전략
-            - **청약저축**: 월 """ + f"{subscription_savings:,}원" + """ (총 자산의 15%)
-            - **청약통장**: 월 """ + f"{subscription_account:,}원" + """ (총 자산의 10%)
-            - **청약펀드**: 월 """ + f"{subscription_fund:,}원" + """ (총 자산의 8%)
-            - **총 청약 투자**: 월 """ + f"{total_subscription:,}원" + """
-            
-            ### 📈 위험도별 투자 포트폴리오
-            
-            #### 🟢 안전자산 (40% - """ + f"{safe_assets_monthly:,}원" + """)
-            - **정기예금**: 월 """ + f"{int(income * 0.05):,}원" + """ (연 2.5-3.0%)
-            - **적금**: 월 """ + f"{int(income * 0.03):,}원" + """ (연 2.8-3.5%)
-            - **국채/공사채**: 월 """ + f"{int(income * 0.02):,}원" + """ (연 2.0-2.5%)
-            
-            #### 🟡 성장자산 (40% - """ + f"{growth_assets_monthly:,}원" + """)
-            - **주식형 펀드**: 월 """ + f"{int(income * 0.06):,}원" + """ (연 5-8% 예상)
-            - **ETF**: 월 """ + f"{int(income * 0.03):,}원" + """ (연 4-6% 예상)
-            - **ISA 계좌**: 월 """ + f"{int(income * 0.01):,}원" + """ (세제혜택)
-            
-            #### 🔴 고위험자산 (20% - """ + f"{high_risk_monthly:,}원" + """)
-            - **개별 주식**: 월 """ + f"{int(income * 0.03):,}원" + """ (연 8-15% 예상)
-            - **부동산 투자신탁**: 월 """ + f"{int(income * 0.02):,}원" + """ (연 6-10% 예상)
-            
-            ### 💡 분산 투자 전략
-            - **시간 분산**: 월별 정기 투자로 평균 비용 효과
-            - **상품 분산**: 8개 이상 상품으로 리스크 분산
-            - **기관 분산**: 3개 이상 금융기관 활용
-            - **리밸런싱**: 분기별 포트폴리오 점검 및 조정
-            
-            ## 🎯 단계별 목표 설정
-            
-            ### 📅 단기 목표 (3-6개월)
-            - **비상금 확보**: """ + f"{emergency_fund_3month:,}원" + """ (3개월치 생활비)
-            - **월 저축률 달성**: 20% → 25% → 30%
-            - **정부지원상품 가입**: 2개 이상 상품 가입
-            - **신용점수 향상**: {credit_score}점 → """ + f"{target_credit_score}점" + """
-            
-            ### 📈 중기 목표 (6개월-1년)
-            - **총 자산 증대**: {assets:,}원 → """ + f"{target_assets_1year:,}원" + """ (30% 증가)
-            - **투자 포트폴리오 구축**: 5개 이상 상품으로 다각화
-            - **청약 자금 확보**: """ + f"{subscription_fund_6month:,}원" + """ (6개월치 청약 자금)
-            - **수동소득 시작**: 월 """ + f"{passive_income_start:,}원" + """ 배당금/이자 수익
-            
-            ### 🚀 장기 목표 (1-3년)
-            - **자산 다각화**: 부동산, 해외투자, 대체투자 등
-            - **수동소득 확대**: 월 """ + f"{passive_income_target:,}원" + """ (소득의 5%)
-            - **재무 독립**: """ + f"{financial_independence:,}원" + """ 자산 확보
-            - **투자 수익률**: 연평균 6-8% 달성
-            
-            ## 💡 실행 가능한 액션 플랜
-            
-            ### ⚡ 즉시 실행 (이번 주)
-            1. **청년도약계좌 가입 신청**: """ + f"{recommended_youth_account:,}원" + """/월
-            2. **자동이체 설정**: 월급일 다음날 자동 저축
-            3. **현재 지출 분석**: 절약 가능 항목 파악 및 개선
-            
-            ### 📋 주간 체크리스트
-            - [ ] 월 저축 목표 달성 확인
-            - [ ] 투자 상품 수익률 체크
-            - [ ] 신용점수 변화 모니터링
-            - [ ] 정부지원상품 신규 상품 확인
-            - [ ] 포트폴리오 리밸런싱 검토
-            
-            ### 📊 월간 체크리스트
-            - [ ] 전체 자산 현황 점검
-            - [ ] 투자 수익률 분석 및 전략 조정
-            - [ ] 새로운 금융 상품 검토
-            - [ ] 목표 달성도 평가 및 계획 수정
-            - [ ] 세금 절약 방안 검토
-            
-            ### 🎁 목표 달성 보상 시스템
-            - **월 저축 목표 달성**: 외식 1회 (5만원 이내)
-            - **분기 목표 달성**: 소원 상품 구매 (10만원 이내)
-            - **연간 목표 달성**: 여행 또는 특별 경험 (50만원 이내)
-            - **신용점수 향상**: 50점당 소원 상품 (5만원 이내)
-            
-            ## 📊 예상 결과 및 시뮬레이션
-            
-            ### 💰 1년 후 예상 자산
-            - **기존 자산**: {assets:,}원
-            - **저축 누적**: """ + f"{yearly_savings:,}원" + """
-            - **투자 수익**: """ + f"{yearly_investment_return:,}원" + """ (6% 수익률)
-            - **총 예상 자산**: """ + f"{total_1year:,}원" + """
-            
-            ### 📈 3년 후 예상 자산
-            - **저축 누적**: """ + f"{three_year_savings:,}원" + """
-            - **복리 효과**: """ + f"{compound_effect:,}원" + """ (복리 수익)
-            - **총 예상 자산**: """ + f"{total_3year:,}원" + """
-            
-            ### 🎯 투자 수익률 시나리오
-            - **보수적 시나리오**: 연평균 4-5% (안전자산 중심)
-            - **균형적 시나리오**: 연평균 6-8% (현재 포트폴리오)
-            - **공격적 시나리오**: 연평균 8-12% (고위험자산 확대)
-            
-            ## ⚠️ 주의사항 및 리스크 관리
-            
-            ### 🔒 리스크 관리 전략
-            - **비상금 우선**: 6개월치 생활비 확보 후 투자 시작
-            - **분산 투자**: 한 상품에 20% 이상 집중 투자 금지
-            - **정기 점검**: 월 1회 포트폴리오 현황 점검
-            - **리스크 조정**: 시장 상황에 따른 투자 비중 조정
-            
-            ### 📋 투자 시작 전 체크리스트
-            - [ ] 비상금 6개월치 확보 완료
-            - [ ] 월 저축 계획 수립 및 실행
-            - [ ] 정부지원상품 가입 완료
-            - [ ] 투자 상품 이해도 향상
-            - [ ] 전문가 상담 또는 교육 프로그램 참여
-            
-            답변은 한국어로 작성하고, 모든 금액은 구체적인 숫자로 명시해주세요.
-            실제 금융 상품명과 조건을 포함하여 실용적으로 작성해주세요.
-            사용자의 현재 상황에 맞는 구체적인 행동 지침을 제공해주세요.
+
+            사용자 질문: {user_question}
+
+            다음 형식으로 답변해주세요:
+
+            1. **공감과 이해**: 사용자의 고민에 공감을 표현
+            2. **현재 상황 분석**: 사용자의 재무 상황을 고려한 분석
+            3. **구체적인 해결방안**: 실행 가능한 구체적인 조언 3-5개
+            4. **주의사항**: 주의해야 할 점이나 위험 요소
+            5. **다음 단계**: 구체적인 행동 계획
+
+            답변은 친근하고 격려하는 톤으로, 한국어로 작성해주세요.
+            금액은 구체적으로 명시하고, 실제 금융 상품명이나 조건을 포함해주세요.
             """
-        )
-        
-        # 최신 LangChain 문법 사용
-        chain = plan_prompt | llm
-        
-        result = chain.invoke({
-            "income": data['income'],
-            "credit_score": data['credit_score'],
-            "assets": sum(data['assets'].values()),
-            "savings": data['savings'],
-            "expense": data['expense'],
-            "age": "청년층"
-        })
-        
-        return result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
-        st.warning(f"종합 금융 플랜 생성 실패: {e}")
-        return get_default_comprehensive_plan(data)
 
-def get_default_comprehensive_plan(data):
-    """기본 종합 금융 플랜 (LangChain 실패 시)"""
-    income = data['income']
-    credit_score = data['credit_score']
-    assets = sum(data['assets'].values())
-    savings = data['savings']
-    
-    # 정부지원상품 상세 정보
-    government_products = [
-        f"🏛️ **청년도약계좌**: 연 3.5% 금리, 최대 3천만원, 5년 가입, 권장 월 가입금액: {min(500000, int(income * 0.15)):,}원",
-        f"💰 **청년희망적금**: 연 2.5% 금리, 최대 1천만원, 3년 가입, 권장 월 가입금액: {min(300000, int(income * 0.1)):,}원",
-        f"🏦 **청년내일저축계좌**: 연 2.0% 금리, 최대 500만원, 1년 가입, 권장 월 가입금액: {min(200000, int(income * 0.08)):,}원"
-    ]
-    
-    # 맞춤형 저축 전략
-    target_savings_ratio = 0.25 if income >= 4000000 else 0.20
-    target_monthly_savings = int(income * target_savings_ratio)
-    current_savings_ratio = savings / income if income > 0 else 0
-    
-    # 청약 및 투자 전략 (구체적인 금액 포함)
-    if credit_score >= 700:
-        investment_strategy = [
-            f"📊 **주식형 펀드**: 월 {min(300000, int(income * 0.15)):,}원 (총 자산의 15%)",
-            f"🏦 **ISA 계좌**: 월 {min(200000, int(income * 0.1)):,}원 (세제혜택 활용)",
-            f"💰 **청약 상품**: 월 {min(500000, int(income * 0.15)):,}원 (정부지원상품 우선)"
-        ]
-    else:
-        investment_strategy = [
-            f"💰 **정기예금**: 월 {min(400000, int(income * 0.15)):,}원 (안정성 우선)",
-            f"🏦 **청약 상품**: 월 {min(300000, int(income * 0.1)):,}원 (정부지원상품)",
-            f"📊 **채권형 펀드**: 월 {min(200000, int(income * 0.08)):,}원 (위험 분산)"
-        ]
-    
-    # 위험도별 포트폴리오 구성
-    safe_assets = int(income * 0.1)
-    growth_assets = int(income * 0.1)
-    high_risk_assets = int(income * 0.05)
-    
-    return f"""
+# 자산 분석 프롬프트
+_ASSET_ANALYSIS_TEMPLATE = """
+            업로드된 PDF 데이터를 기반으로 사용자의 자산 상황을 전문적으로 분석하고 구체적인 개선 방안을 제공해주세요.
+
+            사용자 PDF 데이터:
+            - 월 수입: {income:,}원
+            - 월 지출: {expense:,}원
+            - 신용점수: {credit_score}점
+            - 총 자산: {assets:,}원
+            - 월 저축: {savings:,}원
+            - 거래 내역 수: {transactions}건
+
+            다음 형식으로 전문적인 분석을 제공해주세요:
+
+            ## 📊 PDF 데이터 기반 재무 현황 분석
+
+            ### 🎯 주요 강점
+            - 현재 재무 상황에서 긍정적인 요소 3-4개
+
+            ### ⚠️ 개선 필요 영역
+            - 즉시 개선이 필요한 영역 2-3개
+
+            ### 📈 자산 증대 전략
+            - 현재 상황에 맞는 구체적인 자산 증대 방법 3-4개
+            - 각 전략별 예상 효과와 기간 명시
+
+            ### 💰 최적화된 자산 배분
+            - 비상금: 구체적 금액과 비율
+            - 단기 저축: 구체적 금액과 상품
+            - 중장기 투자: 구체적 금액과 전략
+
+            ### 🏛️ 정부지원상품 활용 전략
+            - 가입 가능한 정부지원상품과 구체적 가입 금액
+            - 우선순위와 가입 시기
+
+            ### 📊 월별 실행 계획
+            - 1개월차: 즉시 실행할 항목
+            - 3개월차: 단기 목표
+            - 6개월차: 중기 목표
+            - 1년차: 장기 목표
+
+            ### 🎯 예상 결과
+            - 1년 후 예상 자산: 구체적 금액
+            - 투자 수익률: 예상 수익률과 근거
+            - 재무 건전성 개선도: 점수화
+
+            답변은 한국어로 작성하고, 모든 금액은 구체적으로 명시해주세요.
+            PDF에서 추출된 실제 데이터를 기반으로 한 실용적이고 실행 가능한 조언을 제공해주세요.
+            """
+
+def generate_comprehensive_financial_plan(data, version=0):
+    """사용자 데이터 기반 종합 금융 플랜 생성 (정부지원상품 포함)"""
+    return generate_all(data, version)['plan']
+
+def generate_all(data, version=0):
+    """신용 가이드·상품 추천·종합 플랜을 한 번의 LLM 호출로 생성
+
+    페이지마다 따로 세 번 호출하던 것을 JSON 모드 한 번의 왕복으로 합쳐
+    네트워크 왕복 두 번과 중복 프롬프트 토큰을 줄인다.
+    version은 캐시 무효화용 — 새로고침 버튼이 증가시키면 같은 재무 수치라도
+    새 캐시 항목으로 LLM을 다시 호출한다.
+    """
+    llm = get_llm()
+    if not llm:
+        return _default_all(data)
+
+    from openai import OpenAIError
+    try:
+        return _call_llm_all(*_bucket(data), version)
+    except (OpenAIError, ValueError) as e:
+        # API 실패(네트워크/한도/타임아웃)와 응답 파싱·검증 실패만 기본값으로 대체
+        st.warning(f"AI 생성 실패: {e}")
+        return _default_all(data)
+
+def _default_all(data):
+    """세 생성 결과의 기본값 묶음 (LLM 미설정/실패 시)"""
+    return {
+        'credit': get_default_credit_guidance(data),
+        'recommendations': get_default_financial_recommendations(data),
+        'plan': get_default_comprehensive_plan(data),
+    }
+
+@st.cache_data(ttl=3600, show_spinner="🤖 AI가 맞춤형 금융 분석을 생성하고 있습니다...")
+def _call_llm_all(income, expense, credit_score, assets, savings, version=0):
+    """통합 LLM 호출 (해시 가능한 스칼라 값 기준 캐싱, version은 캐시 버스터)"""
+    llm = get_llm()
+    metrics = _derive_plan_metrics(income, expense, credit_score, assets, savings)
+    prompt = _COMBINED_PROMPT_TEMPLATE.format(**metrics)
+
+    # 구조화된 출력은 temperature=0으로 결정적이게 유지 (응답 캐시/프롬프트 캐시 적중률 확보)
+    resp = llm.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0,
+        response_format={"type": "json_object"},
+        messages=[{"role": "user", "content": prompt}]
+    )
+    result = _json_loads(resp.choices[0].message.content)
+    if not all(key in result for key in ('credit', 'recommendations', 'plan')):
+        raise ValueError("LLM 응답에 필수 필드가 없습니다")
+    return result
+
+# 기본 종합 금융 플랜 뼈대 (LangChain 실패 시 사용, 호출마다 문자열 결합을 피하기 위해 모듈 상수로 유지)
+_DEFAULT_COMPREHENSIVE_PLAN_TEMPLATE = """
     ## 🏛️ 청년 정부지원 금융상품 상세 가이드
     
     ### 📋 정부지원상품 상세 정보
-    {chr(10).join([f"- {product}" for product in government_products])}
+    {government_products}
     
     ### 🎯 가입 우선순위 및 전략
     - **1순위**: 청년도약계좌 (장기 자산 형성, 5년간 분할 가입)
     - **2순위**: 청년희망적금 (중기 저축, 3년간 분할 가입)
     - **3순위**: 청년내일저축계좌 (단기 목표, 1년간 분할 가입)
-    - **총 월 가입금액**: {min(1000000, int(income * 0.25)):,}원 (소득의 25% 이내)
+    - **총 월 가입금액**: {total_government_monthly:,}원 (소득의 25% 이내)
     
     ## 💰 맞춤형 저축 및 투자 전략
     
     ### 📊 현재 상황 분석
     - **현재 월 저축**: {savings:,}원 ({current_savings_ratio:.1%})
     - **목표 월 저축**: {target_monthly_savings:,}원 ({target_savings_ratio:.1%})
-    - **개선 필요 금액**: {max(0, target_monthly_savings - savings):,}원
-    - **비상금 목표**: {int(income * 6):,}원 (6개월치 생활비)
+    - **개선 필요 금액**: {improvement_needed:,}원
+    - **비상금 목표**: {emergency_fund_target:,}원 (6개월치 생활비)
     
     ### 🎯 단계별 저축 계획
-    - **1단계 (1-3개월)**: 월 {min(target_monthly_savings, savings + 100000):,}원 저축
+    - **1단계 (1-3개월)**: 월 {stage1_savings:,}원 저축
     - **2단계 (4-6개월)**: 월 {target_monthly_savings:,}원 저축 달성
-    - **3단계 (7-12개월)**: 월 {int(target_monthly_savings * 1.1):,}원으로 확대
-    - **4단계 (1년 이후)**: 월 {int(target_monthly_savings * 1.2):,}원으로 안정화
+    - **3단계 (7-12개월)**: 월 {stage3_savings:,}원으로 확대
+    - **4단계 (1년 이후)**: 월 {stage4_savings:,}원으로 안정화
     
     ## 📊 청약 및 투자 상품별 구체적 투자 금액
     
     ### 🏠 청약 상품 투자 전략
-    - **청약저축**: 월 {min(500000, int(income * 0.15)):,}원 (총 자산의 15%)
-    - **청약통장**: 월 {min(300000, int(income * 0.1)):,}원 (총 자산의 10%)
-    - **청약펀드**: 월 {min(200000, int(income * 0.08)):,}원 (총 자산의 8%)
-    - **총 청약 투자**: 월 {min(1000000, int(income * 0.33)):,}원
+    - **청약저축**: 월 {subscription_savings:,}원 (총 자산의 15%)
+    - **청약통장**: 월 {subscription_account:,}원 (총 자산의 10%)
+    - **청약펀드**: 월 {subscription_fund:,}원 (총 자산의 8%)
+    - **총 청약 투자**: 월 {total_subscription:,}원
     
     ### 📈 위험도별 투자 포트폴리오
     
-    #### 🟢 안전자산 (40% - {safe_assets:,}원)
-    - **정기예금**: 월 {int(income * 0.05):,}원 (연 2.5-3.0%)
-    - **적금**: 월 {int(income * 0.03):,}원 (연 2.8-3.5%)
-    - **국채/공사채**: 월 {int(income * 0.02):,}원 (연 2.0-2.5%)
+    #### 🟢 안전자산 (40% - {safe_assets_monthly:,}원)
+    - **정기예금**: 월 {income_pct_05:,}원 (연 2.5-3.0%)
+    - **적금**: 월 {income_pct_03:,}원 (연 2.8-3.5%)
+    - **국채/공사채**: 월 {income_pct_02:,}원 (연 2.0-2.5%)
     
-    #### 🟡 성장자산 (40% - {growth_assets:,}원)
-    - **주식형 펀드**: 월 {int(income * 0.06):,}원 (연 5-8% 예상)
-    - **ETF**: 월 {int(income * 0.03):,}원 (연 4-6% 예상)
-    - **ISA 계좌**: 월 {int(income * 0.01):,}원 (세제혜택)
+    #### 🟡 성장자산 (40% - {growth_assets_monthly:,}원)
+    - **주식형 펀드**: 월 {income_pct_06:,}원 (연 5-8% 예상)
+    - **ETF**: 월 {income_pct_03:,}원 (연 4-6% 예상)
+    - **ISA 계좌**: 월 {income_pct_01:,}원 (세제혜택)
     
-    #### 🔴 고위험자산 (20% - {high_risk_assets:,}원)
-    - **개별 주식**: 월 {int(income * 0.03):,}원 (연 8-15% 예상)
-    - **부동산 투자신탁**: 월 {int(income * 0.02):,}원 (연 6-10% 예상)
+    #### 🔴 고위험자산 (20% - {high_risk_monthly:,}원)
+    - **개별 주식**: 월 {income_pct_03:,}원 (연 8-15% 예상)
+    - **부동산 투자신탁**: 월 {income_pct_02:,}원 (연 6-10% 예상)
     
     ### 💡 분산 투자 전략
     - **시간 분산**: 월별 정기 투자로 평균 비용 효과
@@ -610,27 +673,27 @@ def get_default_comprehensive_plan(data):
     ## 🎯 단계별 목표 설정
     
     ### 📅 단기 목표 (3-6개월)
-    - **비상금 확보**: {int(income * 3):,}원 (3개월치 생활비)
-    - **월 저축률 달성**: {target_savings_ratio:.1%} → {(target_savings_ratio + 0.05):.1%} → {(target_savings_ratio + 0.1):.1%}
+    - **비상금 확보**: {emergency_fund_3month:,}원 (3개월치 생활비)
+    - **월 저축률 달성**: {target_savings_ratio:.1%} → {target_savings_ratio_mid:.1%} → {target_savings_ratio_high:.1%}
     - **정부지원상품 가입**: 2개 이상 상품 가입
-    - **신용점수 향상**: {credit_score}점 → {min(900, credit_score + 30)}점
+    - **신용점수 향상**: {credit_score}점 → {target_credit_score}점
     
     ### 📈 중기 목표 (6개월-1년)
-    - **총 자산 증대**: {assets:,}원 → {int(assets * 1.3):,}원 (30% 증가)
+    - **총 자산 증대**: {assets:,}원 → {target_assets_1year:,}원 (30% 증가)
     - **투자 포트폴리오 구축**: 5개 이상 상품으로 다각화
-    - **청약 자금 확보**: {int(income * 6):,}원 (6개월치 청약 자금)
-    - **수동소득 시작**: 월 {int(income * 0.02):,}원 배당금/이자 수익
+    - **청약 자금 확보**: {emergency_fund_target:,}원 (6개월치 청약 자금)
+    - **수동소득 시작**: 월 {income_pct_02:,}원 배당금/이자 수익
     
     ### 🚀 장기 목표 (1-3년)
     - **자산 다각화**: 부동산, 해외투자, 대체투자 등
-    - **수동소득 확대**: 월 {int(income * 0.05):,}원 (소득의 5%)
-    - **재무 독립**: {int(income * 12 * 3):,}원 자산 확보
+    - **수동소득 확대**: 월 {income_pct_05:,}원 (소득의 5%)
+    - **재무 독립**: {financial_independence:,}원 자산 확보
     - **투자 수익률**: 연평균 6-8% 달성
     
     ## 💡 실행 가능한 액션 플랜
     
     ### ⚡ 즉시 실행 (이번 주)
-    1. **청년도약계좌 가입 신청**: {min(500000, int(income * 0.15)):,}원/월
+    1. **청년도약계좌 가입 신청**: {subscription_savings:,}원/월
     2. **자동이체 설정**: 월급일 다음날 자동 저축
     3. **현재 지출 분석**: 절약 가능 항목 파악 및 개선
     
@@ -658,14 +721,14 @@ def get_default_comprehensive_plan(data):
     
     ### 💰 1년 후 예상 자산
     - **기존 자산**: {assets:,}원
-    - **저축 누적**: {int(target_monthly_savings * 12):,}원
-    - **투자 수익**: {int(target_monthly_savings * 12 * 0.06):,}원 (6% 수익률)
-    - **총 예상 자산**: {int(assets + target_monthly_savings * 12 * 1.06):,}원
+    - **저축 누적**: {yearly_savings:,}원
+    - **투자 수익**: {yearly_investment_return:,}원 (6% 수익률)
+    - **총 예상 자산**: {total_1year:,}원
     
     ### 📈 3년 후 예상 자산
-    - **저축 누적**: {int(target_monthly_savings * 12 * 3):,}원
-    - **복리 효과**: {int(target_monthly_savings * 12 * 3 * 0.2):,}원 (복리 수익)
-    - **총 예상 자산**: {int(assets + target_monthly_savings * 12 * 3 * 1.2):,}원
+    - **저축 누적**: {three_year_savings:,}원
+    - **복리 효과**: {compound_effect:,}원 (복리 수익)
+    - **총 예상 자산**: {total_3year:,}원
     
     ### 🎯 투자 수익률 시나리오
     - **보수적 시나리오**: 연평균 4-5% (안전자산 중심)
@@ -702,6 +765,23 @@ def get_default_comprehensive_plan(data):
     - **리스크 관리**: 단계별 접근으로 안정적인 자산 형성
     """
 
+def get_default_comprehensive_plan(data):
+    """기본 종합 금융 플랜 (LangChain 실패 시)"""
+    income = data['income']
+    metrics = _derive_plan_metrics(income, data['expense'], data['credit_score'], _assets_total(data), data['savings'])
+
+    # 정부지원상품 상세 정보
+    government_products = [
+        f"🏛️ **청년도약계좌**: 연 3.5% 금리, 최대 3천만원, 5년 가입, 권장 월 가입금액: {metrics['recommended_youth_account']:,}원",
+        f"💰 **청년희망적금**: 연 2.5% 금리, 최대 1천만원, 3년 가입, 권장 월 가입금액: {metrics['recommended_hope_savings']:,}원",
+        f"🏦 **청년내일저축계좌**: 연 2.0% 금리, 최대 500만원, 1년 가입, 권장 월 가입금액: {metrics['recommended_tomorrow_account']:,}원"
+    ]
+
+    return _DEFAULT_COMPREHENSIVE_PLAN_TEMPLATE.format(
+        government_products="\n".join(f"- {product}" for product in government_products),
+        **metrics
+    )
+
 # 페이지 설정
 st.set_page_config(
     page_title="Much (머니치료)",
@@ -710,343 +790,45 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 페이지 테마 설정
-st.markdown("""
-<style>
-    /* Streamlit 기본 테마 오버라이드 */
-    .stApp {
-        background-color: #FFFFFF;
-    }
-    
-    /* 사이드바 배경색 */
-    section[data-testid="stSidebar"] {
-        background-color: #E4F0FF;
-    }
-    
-    /* 메인 컨테이너 배경색 */
-    .main .block-container {
-        background-color: #FFFFFF;
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# CSS 스타일링
-st.markdown("""
-<style>
-    /* 전체 페이지 스타일 */
-    .main {
-        background-color: #FFFFFF;
-    }
-    
-    /* 헤더 스타일 */
-    .main-header {
-        background: linear-gradient(135deg, #1D5091 0%, #5C81C7 100%);
-        padding: 2rem 1.5rem;
-        border-radius: 15px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-        box-shadow: 0 8px 32px rgba(29, 80, 145, 0.2);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    .main-header h1 {
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-    }
-    
-    .main-header p {
-        font-size: 1.1rem;
-        opacity: 0.9;
-        margin: 0;
-    }
-    
-    /* 메트릭 카드 스타일 */
-    .metric-card {
-        background: linear-gradient(135deg, #FFFFFF 0%, #E4F0FF 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 20px rgba(29, 80, 145, 0.1);
-        border: 2px solid #E4F0FF;
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 30px rgba(29, 80, 145, 0.15);
-        border-color: #5C81C7;
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 4px;
-        background: linear-gradient(90deg, #1D5091 0%, #5C81C7 100%);
-    }
-    
-    .metric-card h3 {
-        color: #1D5091;
-        font-size: 1rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }
-    
-    .metric-card h2 {
-        color: #1D5091;
-        font-size: 1.8rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-card p {
-        color: #5C81C7;
-        font-weight: 600;
-        margin: 0;
-        font-size: 0.9rem;
-    }
-    
-    /* 사이드바 스타일 */
-    .css-1d391kg {
-        background-color: #E4F0FF;
-    }
-    
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #E4F0FF 0%, #FFFFFF 100%);
-        border-right: 2px solid #5C81C7;
-    }
-    
-    /* 버튼 스타일 */
-    .stButton > button {
-        background: linear-gradient(135deg, #1D5091 0%, #5C81C7 100%);
-        color: white;
-        border-radius: 10px;
-        border: none;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(29, 80, 145, 0.2);
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #5C81C7 0%, #1D5091 100%);
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(29, 80, 145, 0.3);
-    }
-    
-    /* 선택박스 스타일 */
-    .stSelectbox > div > div {
-        background: #FFFFFF;
-        border: 2px solid #E4F0FF;
-        border-radius: 10px;
-        color: #1D5091;
-    }
-    
-    .stSelectbox > div > div:hover {
-        border-color: #5C81C7;
-    }
-    
-    /* 입력 필드 스타일 */
-    .stTextInput > div > div > input {
-        background: #FFFFFF;
-        border: 2px solid #E4F0FF;
-        border-radius: 10px;
-        color: #1D5091;
-    }
-    
-    .stTextInput > div > div > input:focus {
-        border-color: #5C81C7;
-        box-shadow: 0 0 0 3px rgba(92, 129, 199, 0.1);
-    }
-    
-    /* 파일 업로더 스타일 */
-    .stFileUploader > div {
-        background: #FFFFFF;
-        border: 2px dashed #5C81C7;
-        border-radius: 15px;
-        padding: 2rem;
-    }
-    
-    .stFileUploader > div:hover {
-        border-color: #1D5091;
-        background: #E4F0FF;
-    }
-    
-    /* 차트 컨테이너 스타일 */
-    .js-plotly-plot {
-        border-radius: 15px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(29, 80, 145, 0.1);
-    }
-    
-    /* 섹션 헤더 스타일 */
-    .section-header {
-        background: linear-gradient(135deg, #E4F0FF 0%, #FFFFFF 100%);
-        padding: 1rem 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #1D5091;
-        margin: 1.5rem 0;
-    }
-    
-    .section-header h2 {
-        color: #1D5091;
-        margin: 0;
-        font-weight: 700;
-    }
-    
-    /* 정보 박스 스타일 */
-    .info-box {
-        background: linear-gradient(135deg, #E4F0FF 0%, #FFFFFF 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border: 2px solid #5C81C7;
-        margin: 1rem 0;
-    }
-    
-    /* 경고 박스 스타일 */
-    .warning-box {
-        background: linear-gradient(135deg, #FFF3E0 0%, #FFFFFF 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border: 2px solid #D6A319;
-        margin: 1rem 0;
-    }
-    
-    /* 성공 박스 스타일 */
-    .success-box {
-        background: linear-gradient(135deg, #E8F5E8 0%, #FFFFFF 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        border: 2px solid #4CAF50;
-        margin: 1rem 0;
-    }
-    
-    /* 채팅 메시지 스타일 */
-    .chat-message {
-        padding: 1rem;
-        border-radius: 15px;
-        margin: 0.5rem 0;
-        border: 1px solid #E4F0FF;
-    }
-    
-    .chat-user {
-        background: linear-gradient(135deg, #5C81C7 0%, #1D5091 100%);
-        color: white;
-        text-align: right;
-    }
-    
-    .chat-assistant {
-        background: linear-gradient(135deg, #E4F0FF 0%, #FFFFFF 100%);
-        color: #1D5091;
-        border-left: 4px solid #5C81C7;
-    }
-    
-    /* 게이지 차트 스타일 */
-    .gauge-container {
-        background: #FFFFFF;
-        border-radius: 15px;
-        padding: 1rem;
-        box-shadow: 0 4px 20px rgba(29, 80, 145, 0.1);
-        border: 2px solid #E4F0FF;
-    }
-    
-    /* 테이블 스타일 */
-    .dataframe {
-        border-radius: 10px;
-        overflow: hidden;
-        box-shadow: 0 4px 20px rgba(29, 80, 145, 0.1);
-    }
-    
-    .dataframe th {
-        background: linear-gradient(135deg, #1D5091 0%, #5C81C7 100%);
-        color: white;
-        font-weight: 600;
-    }
-    
-    /* 구분선 스타일 */
-    hr {
-        border: none;
-        height: 2px;
-        background: linear-gradient(90deg, #E4F0FF 0%, #5C81C7 50%, #E4F0FF 100%);
-        border-radius: 1px;
-        margin: 2rem 0;
-    }
-    
-    /* 링크 스타일 */
-    a {
-        color: #1D5091;
-        text-decoration: none;
-        font-weight: 600;
-    }
-    
-    a:hover {
-        color: #5C81C7;
-        text-decoration: underline;
-    }
-    
-    /* 스크롤바 스타일 */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #E4F0FF;
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #1D5091 0%, #5C81C7 100%);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #5C81C7 0%, #1D5091 100%);
-    }
-    
-    /* 반응형 디자인 */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .metric-card {
-            padding: 1rem;
-        }
-        
-        .metric-card h2 {
-            font-size: 1.5rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+# 페이지 테마 + 공통 CSS는 styles.css에서 프로세스당 1회만 읽어온다
+@st.cache_resource(show_spinner=False)
+def load_css():
+    """styles.css 내용을 읽어 캐싱"""
+    with open('styles.css', 'r', encoding='utf-8') as f:
+        return f.read()
+
+def inject_css():
+    """페이지 스타일 주입 (테마/CSS를 한 번의 markdown 호출로 전송)"""
+    st.markdown(load_css(), unsafe_allow_html=True)
+
+inject_css()
 
 # 사용자 데이터 (실제로는 데이터베이스에서 관리)
+@functools.lru_cache(maxsize=256)
 def hash_password(password):
-    """간단한 비밀번호 해싱"""
+    """간단한 비밀번호 해싱 (재실행마다 같은 입력을 다시 해싱하지 않도록 캐싱)"""
     return hashlib.sha256(password.encode()).hexdigest()
 
-USERS = {
-    "test_user": {
-        "name": "테스트 사용자",
-        "password": hash_password("test123")
+@st.cache_resource(show_spinner=False)
+def get_users():
+    """사용자 테이블 (세션마다 복사하지 않고 프로세스당 한 객체를 공유)"""
+    return {
+        "test_user": {
+            "name": "테스트 사용자",
+            # sha256("test123") 미리 계산한 값 (스크립트 재실행마다 해싱하지 않음)
+            "password": "ecd71870d1963316a97e3ac3408c9835ad8cf0f3c1bc703527c30265534f75ae"
+        }
     }
-}
 
 # 세션 상태 초기화
 if 'authenticated' not in st.session_state:
     st.session_state.authenticated = False
 if 'current_user' not in st.session_state:
     st.session_state.current_user = None
+if 'user_display_name' not in st.session_state:
+    st.session_state.user_display_name = None
+if 'plan_version' not in st.session_state:
+    st.session_state.plan_version = 0
 if 'uploaded_files' not in st.session_state:
     st.session_state.uploaded_files = []
 if 'extracted_data' not in st.session_state:
@@ -1069,26 +851,33 @@ def login_page():
         col_a, col_b = st.columns(2)
         with col_a:
             if st.button("로그인", key="login_btn"):
-                if username in USERS and USERS[username]["password"] == hash_password(password):
+                users = get_users()
+                if username in users and users[username]["password"] == hash_password(password):
                     st.session_state.authenticated = True
                     st.session_state.current_user = username
+                    # 표시용 이름은 로그인 시 한 번만 조회해 세션에 보관
+                    st.session_state.user_display_name = users[username]["name"]
                     st.success("로그인 성공!")
                     st.rerun()
                 else:
                     st.error("아이디 또는 비밀번호가 올바르지 않습니다.")
         
 
+# 사이드바 메뉴 구성 (매 재실행마다 리스트를 새로 만들고 선형 탐색하지 않도록 모듈 상수로 유지)
+PAGES = ("🏠 대시보드", "📁 PDF 업로드", "📈 자산 분석", "💡 맞춤형 플랜", "📊 신용점수 관리", "💬 머치랑 대화하기")
+PAGE_INDEX = {p: i for i, p in enumerate(PAGES)}
+
 def main_dashboard():
     """메인 대시보드"""
     st.markdown('<div class="main-header"><h1>💰 Much (머니치료)</h1><p>청년 맞춤형 AI 자산관리 서비스</p></div>', unsafe_allow_html=True)
-    
+
     # 사이드바
     with st.sidebar:
         st.markdown("### 📊 메뉴")
         page = st.selectbox(
             "페이지 선택",
-            ["🏠 대시보드", "📁 PDF 업로드", "📈 자산 분석", "💡 맞춤형 플랜", "📊 신용점수 관리", "💬 머치랑 대화하기"],
-            index=["🏠 대시보드", "📁 PDF 업로드", "📈 자산 분석", "💡 맞춤형 플랜", "📊 신용점수 관리", "💬 머치랑 대화하기"].index(st.session_state.current_page)
+            PAGES,
+            index=PAGE_INDEX[st.session_state.current_page]
         )
         
         # 페이지 변경 시 세션 상태 업데이트
@@ -1096,7 +885,7 @@ def main_dashboard():
             st.session_state.current_page = page
         
         st.markdown("---")
-        st.markdown(f"**사용자:** {USERS[st.session_state.current_user]['name']}")
+        st.markdown(f"**사용자:** {st.session_state.user_display_name}")
         
         if st.button("로그아웃"):
             st.session_state.authenticated = False
@@ -1117,13 +906,276 @@ def main_dashboard():
     elif page == "💬 머치랑 대화하기":
         show_financial_chatbot()
 
+# 소득 구간별 안정성 점수 (bisect 경계, 점수)
+_INCOME_STABILITY_TABLE = ((2000000, 3000000, 4000000), (40, 60, 75, 90))
+
+@st.cache_data(show_spinner=False)
+def _derive_overview(income, expense, savings, assets_items):
+    """대시보드·자산 분석이 공유하는 파생 지표 (입력 조합별 1회 계산)"""
+    assets = dict(assets_items)
+    non_zero_assets = {k: v for k, v in assets.items() if v > 0}
+    total_assets = sum(assets.values())
+    return {
+        'non_zero_assets': non_zero_assets,
+        'total_assets': total_assets,
+        'asset_diversity': len(non_zero_assets),
+        'expense_ratio': (expense / income * 100) if income > 0 else 0,
+        'savings_ratio': (savings / income * 100) if income > 0 else 0,
+        'asset_income_ratio': (total_assets / income) if income > 0 else 0,
+        # 수입-지출 기준 저축 여력 (플랜 페이지 지표)
+        'implied_savings_ratio': ((income - expense) / income * 100) if income > 0 else 0,
+        'income_stability_score': _INCOME_STABILITY_TABLE[1][
+            bisect.bisect_right(_INCOME_STABILITY_TABLE[0], income)],
+    }
+
+def _overview(data):
+    """추출 데이터에서 공유 파생 지표를 얻는다"""
+    return _derive_overview(data['income'], data['expense'], data['savings'],
+                            tuple(data['assets'].items()))
+
+# 대시보드 지표 카드 공통 템플릿
+_METRIC_CARD = """
+        <div class="metric-card">
+            <h3>{title}</h3>
+            <h2>{value}</h2>
+            <p style="color: {color}; font-weight: bold;">{status}</p>
+        </div>
+        """
+
+# 재무 건강도 점수 테이블: (경계값, bisect 구간별 (점수, 라벨))
+# if/elif 사슬 대신 bisect 한 번으로 구간을 찾는다. 경계 포함 여부는 기존 비교식과 동일.
+_HEALTH_INCOME_TABLE = ((3000000, 4000000), (
+    (12, "⚠️ 수입: 개선 필요 (12점)"),
+    (20, "✅ 수입: 양호 (20점)"),
+    (25, "✅ 수입: 우수 (25점)"),
+))
+_HEALTH_EXPENSE_TABLE = ((70, 80), (
+    (25, "✅ 지출 관리: 우수 (25점)"),
+    (20, "✅ 지출 관리: 양호 (20점)"),
+    (10, "⚠️ 지출 관리: 개선 필요 (10점)"),
+))
+_HEALTH_SAVINGS_TABLE = ((15, 25), (
+    (8, "⚠️ 저축: 개선 필요 (8점)"),
+    (16, "✅ 저축: 양호 (16점)"),
+    (20, "✅ 저축: 우수 (20점)"),
+))
+_HEALTH_CREDIT_TABLE = ((600, 700, 800), (
+    (5, "⚠️ 신용점수: 개선 필요 (5점)"),
+    (10, "✅ 신용점수: 보통 (10점)"),
+    (13, "✅ 신용점수: 우수 (13점)"),
+    (15, "✅ 신용점수: 최우수 (15점)"),
+))
+_HEALTH_DIVERSITY_TABLE = ((2, 4), (
+    (6, "⚠️ 자산 다양성: 개선 필요 (6점)"),
+    (12, "✅ 자산 다양성: 양호 (12점)"),
+    (15, "✅ 자산 다양성: 우수 (15점)"),
+))
+
+@st.cache_data(show_spinner=False)
+def _top_expense_categories(transactions_tuple):
+    """거래 내역에서 상위 지출 항목 집계 (내역 조합별 1회 계산)
+
+    nlargest(10)은 전체 정렬 없이 상위 10개만 선별하므로
+    sort_values().head(10)보다 빠르다.
+    """
+    import pandas as pd
+
+    df = pd.DataFrame([dict(items) for items in transactions_tuple])
+    expenses = df[df['amount'] < 0].copy()
+    if expenses.empty:
+        return None
+    expenses['amount'] = expenses['amount'].abs()
+    return expenses.groupby('description')['amount'].sum().nlargest(10)
+
+def _transactions_key(transactions):
+    """거래 내역 리스트를 해시 가능한 튜플로 변환 — 캐시 키"""
+    return tuple(tuple(sorted(t.items())) for t in transactions)
+
+# 브랜드 차트 색상 — 차트 생성 시마다 리터럴 리스트를 새로 만들지 않도록 모듈 상수로 공유
+COLOR_PRIMARY = '#1D5091'
+COLOR_SECONDARY = '#5C81C7'
+COLOR_LIGHT = '#E4F0FF'
+COLOR_ACCENT = '#D6A319'
+CHART_PALETTE = (COLOR_PRIMARY, COLOR_SECONDARY, COLOR_LIGHT, COLOR_ACCENT, '#FFFFFF')
+
+# Plotly figure는 생성·직렬화 비용이 커서 스칼라 입력 기준으로 dict 형태로 캐싱한다
+@st.cache_data(show_spinner=False)
+def _health_gauge_fig(health_score):
+    """재무 건강도 게이지 (점수별 1회 생성)"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=health_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "재무 건강도 점수"},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': COLOR_PRIMARY},
+            'steps': [
+                {'range': [0, 60], 'color': COLOR_LIGHT},
+                {'range': [60, 80], 'color': COLOR_ACCENT},
+                {'range': [80, 100], 'color': COLOR_SECONDARY}
+            ],
+            'threshold': {
+                'line': {'color': COLOR_ACCENT, 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _asset_pie_fig(items):
+    """자산 분포 파이 차트 ((이름, 금액) 튜플 기준 캐싱)"""
+    import plotly.express as px
+
+    fig = px.pie(
+        values=[v for _, v in items],
+        names=[k for k, _ in items],
+        title="자산 분포",
+        color_discrete_sequence=list(CHART_PALETTE)
+    )
+    fig.update_layout(height=400)
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _trend_fig(months, income_points, expense_points, savings_points, title, xaxis_title):
+    """수입/지출/저축 추이 차트 (수치 튜플 기준 캐싱)"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=list(months),
+        y=np.asarray(income_points),
+        name='수입',
+        line=dict(color=COLOR_PRIMARY, width=3),
+        mode='lines+markers'
+    ))
+    fig.add_trace(go.Scatter(
+        x=list(months),
+        y=np.asarray(expense_points),
+        name='지출',
+        line=dict(color=COLOR_ACCENT, width=3),
+        mode='lines+markers'
+    ))
+    fig.add_trace(go.Scatter(
+        x=list(months),
+        y=np.asarray(savings_points),
+        name='저축',
+        line=dict(color=COLOR_SECONDARY, width=3),
+        mode='lines+markers'
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=xaxis_title,
+        yaxis_title="금액 (원)",
+        height=400,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def _cashflow_fig(income, expense):
+    """월별 현금 흐름 예측 차트 (수입/지출 스칼라 기준 캐싱)"""
+    import plotly.graph_objects as go
+
+    income_data = np.array([0.95, 1.0, 1.05]) * income
+    expense_data = np.array([1.05, 1.0, 0.95]) * expense
+    savings_data = income_data - expense_data
+    months = ['1월', '2월', '3월']
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=income_data,
+        name='수입',
+        line=dict(color=COLOR_PRIMARY, width=3),
+        mode='lines+markers'
+    ))
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=expense_data,
+        name='지출',
+        line=dict(color=COLOR_ACCENT, width=3),
+        mode='lines+markers'
+    ))
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=savings_data,
+        name='저축',
+        line=dict(color=COLOR_SECONDARY, width=3),
+        mode='lines+markers'
+    ))
+    fig.update_layout(
+        title="월별 현금 흐름 예측",
+        xaxis_title="월",
+        yaxis_title="금액 (원)",
+        height=300,
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def _stability_gauge_fig(score):
+    """소득 안정성 게이지 (점수별 1회 생성)"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "소득 안정성 점수"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': COLOR_PRIMARY},
+            'steps': [
+                {'range': [0, 50], 'color': COLOR_LIGHT},
+                {'range': [50, 70], 'color': COLOR_ACCENT},
+                {'range': [70, 100], 'color': COLOR_SECONDARY}
+            ]
+        }
+    ))
+    fig.update_layout(height=250)
+    return fig.to_dict()
+
+@st.cache_resource(show_spinner=False)
+def _grade_bar_fig():
+    """등급별 최소 신용점수 차트 (입력이 없는 고정 차트 — 프로세스당 1회 생성)"""
+    import plotly.graph_objects as go
+
+    grade_data = {
+        'A+': 800,
+        'A': 700,
+        'B': 600,
+        'C': 300
+    }
+    fig = go.Figure(data=[
+        go.Bar(
+            x=list(grade_data.keys()),
+            y=list(grade_data.values()),
+            marker_color=[COLOR_SECONDARY, COLOR_PRIMARY, COLOR_ACCENT, COLOR_LIGHT]
+        )
+    ])
+    fig.update_layout(
+        title="등급별 최소 신용점수",
+        yaxis_title="신용점수",
+        height=300
+    )
+    return fig.to_dict()
+
 def show_dashboard():
     """대시보드 페이지"""
+    import plotly.graph_objects as go
+
     st.markdown("## 🏠 대시보드")
     
     # 사용자 정보 표시
     if st.session_state.current_user:
-        st.markdown(f"### 👋 안녕하세요, {USERS[st.session_state.current_user]['name']}님!")
+        st.markdown(f"### 👋 안녕하세요, {st.session_state.user_display_name}님!")
     
     # 데이터가 없는 경우 안내
     if not st.session_state.extracted_data:
@@ -1150,67 +1202,42 @@ def show_dashboard():
     
     # 추출된 데이터 사용
     data = st.session_state.extracted_data
-    
+    overview = _overview(data)
+
     # 상세 분석 결과 요약
     st.markdown("### 📊 재무 현황 요약")
     
     # 주요 지표 카드 (더 상세한 정보 포함)
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        income = data['income']
-        income_status = "우수" if income >= 4000000 else "양호" if income >= 3000000 else "개선 필요"
-        income_color = "green" if income >= 4000000 else "blue" if income >= 3000000 else "orange"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>💰 월 수입</h3>
-            <h2>{income:,}원</h2>
-            <p style="color: {income_color}; font-weight: bold;">{income_status}</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        expense = data['expense']
-        expense_ratio = (expense / income * 100) if income > 0 else 0
-        expense_status = "절약" if expense_ratio < 70 else "적정" if expense_ratio < 80 else "높음"
-        expense_color = "green" if expense_ratio < 70 else "blue" if expense_ratio < 80 else "red"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>💸 월 지출</h3>
-            <h2>{expense:,}원</h2>
-            <p style="color: {expense_color}; font-weight: bold;">{expense_status} ({expense_ratio:.1f}%)</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        savings = data['savings']
-        savings_ratio = (savings / income * 100) if income > 0 else 0
-        savings_status = "우수" if savings_ratio >= 25 else "양호" if savings_ratio >= 15 else "개선 필요"
-        savings_color = "green" if savings_ratio >= 25 else "blue" if savings_ratio >= 15 else "orange"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>💎 월 저축</h3>
-            <h2>{savings:,}원</h2>
-            <p style="color: {savings_color}; font-weight: bold;">{savings_status} ({savings_ratio:.1f}%)</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        credit_score = data['credit_score']
-        credit_grade = "A+" if credit_score >= 800 else "A" if credit_score >= 700 else "B" if credit_score >= 600 else "C"
-        credit_status = "최우수" if credit_score >= 800 else "우수" if credit_score >= 700 else "보통" if credit_score >= 600 else "개선 필요"
-        credit_color = "green" if credit_score >= 800 else "blue" if credit_score >= 700 else "yellow" if credit_score >= 600 else "red"
-        
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>📊 신용점수</h3>
-            <h2>{credit_score}점</h2>
-            <p style="color: {credit_color}; font-weight: bold;">{credit_grade}등급 ({credit_status})</p>
-        </div>
-        """, unsafe_allow_html=True)
+    income = data['income']
+    income_status = "우수" if income >= 4000000 else "양호" if income >= 3000000 else "개선 필요"
+    income_color = "green" if income >= 4000000 else "blue" if income >= 3000000 else "orange"
+
+    expense = data['expense']
+    expense_ratio = overview['expense_ratio']
+    expense_status = "절약" if expense_ratio < 70 else "적정" if expense_ratio < 80 else "높음"
+    expense_color = "green" if expense_ratio < 70 else "blue" if expense_ratio < 80 else "red"
+
+    savings = data['savings']
+    savings_ratio = overview['savings_ratio']
+    savings_status = "우수" if savings_ratio >= 25 else "양호" if savings_ratio >= 15 else "개선 필요"
+    savings_color = "green" if savings_ratio >= 25 else "blue" if savings_ratio >= 15 else "orange"
+
+    credit_score = data['credit_score']
+    credit_grade = "A+" if credit_score >= 800 else "A" if credit_score >= 700 else "B" if credit_score >= 600 else "C"
+    credit_status = "최우수" if credit_score >= 800 else "우수" if credit_score >= 700 else "보통" if credit_score >= 600 else "개선 필요"
+    credit_color = "green" if credit_score >= 800 else "blue" if credit_score >= 700 else "yellow" if credit_score >= 600 else "red"
+
+    cards = (
+        ("💰 월 수입", f"{income:,}원", income_status, income_color),
+        ("💸 월 지출", f"{expense:,}원", f"{expense_status} ({expense_ratio:.1f}%)", expense_color),
+        ("💎 월 저축", f"{savings:,}원", f"{savings_status} ({savings_ratio:.1f}%)", savings_color),
+        ("📊 신용점수", f"{credit_score}점", f"{credit_grade}등급 ({credit_status})", credit_color),
+    )
+    # 4열 레이아웃은 유지해야 하므로 카드별 markdown 호출은 남고, 템플릿만 공유한다
+    for col, (title, value, status, color) in zip(st.columns(4), cards):
+        with col:
+            st.markdown(_METRIC_CARD.format(title=title, value=value, status=status, color=color),
+                        unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -1224,100 +1251,31 @@ def show_dashboard():
         st.markdown("---")
     
     # 종합 점수 계산 (신용점수 외 다각적 요소 반영)
+    total_assets = overview['total_assets']
+    asset_diversity = overview['asset_diversity']
+
     health_score = 0
     health_factors = []
-    
-    # 수입 점수 (25점 만점)
-    if income >= 4000000:
-        health_score += 25
-        health_factors.append("✅ 수입: 우수 (25점)")
-    elif income >= 3000000:
-        health_score += 20
-        health_factors.append("✅ 수입: 양호 (20점)")
-    else:
-        health_score += 12
-        health_factors.append("⚠️ 수입: 개선 필요 (12점)")
-    
-    # 지출 관리 점수 (25점 만점)
-    if expense_ratio < 70:
-        health_score += 25
-        health_factors.append("✅ 지출 관리: 우수 (25점)")
-    elif expense_ratio < 80:
-        health_score += 20
-        health_factors.append("✅ 지출 관리: 양호 (20점)")
-    else:
-        health_score += 10
-        health_factors.append("⚠️ 지출 관리: 개선 필요 (10점)")
-    
-    # 저축 점수 (20점 만점)
-    if savings_ratio >= 25:
-        health_score += 20
-        health_factors.append("✅ 저축: 우수 (20점)")
-    elif savings_ratio >= 15:
-        health_score += 16
-        health_factors.append("✅ 저축: 양호 (16점)")
-    else:
-        health_score += 8
-        health_factors.append("⚠️ 저축: 개선 필요 (8점)")
-    
-    # 신용점수 (15점 만점)
-    if credit_score >= 800:
-        health_score += 15
-        health_factors.append("✅ 신용점수: 최우수 (15점)")
-    elif credit_score >= 700:
-        health_score += 13
-        health_factors.append("✅ 신용점수: 우수 (13점)")
-    elif credit_score >= 600:
-        health_score += 10
-        health_factors.append("✅ 신용점수: 보통 (10점)")
-    else:
-        health_score += 5
-        health_factors.append("⚠️ 신용점수: 개선 필요 (5점)")
-    
-    # 자산 다양성 점수 (15점 만점) - 신규 추가
-    total_assets = sum(data['assets'].values())
-    asset_diversity = len([v for v in data['assets'].values() if v > 0])
-    if asset_diversity >= 4:
-        health_score += 15
-        health_factors.append("✅ 자산 다양성: 우수 (15점)")
-    elif asset_diversity >= 2:
-        health_score += 12
-        health_factors.append("✅ 자산 다양성: 양호 (12점)")
-    else:
-        health_score += 6
-        health_factors.append("⚠️ 자산 다양성: 개선 필요 (6점)")
+    for value, (bounds, entries) in (
+        (income, _HEALTH_INCOME_TABLE),
+        (expense_ratio, _HEALTH_EXPENSE_TABLE),
+        (savings_ratio, _HEALTH_SAVINGS_TABLE),
+        (credit_score, _HEALTH_CREDIT_TABLE),
+        (asset_diversity, _HEALTH_DIVERSITY_TABLE),
+    ):
+        score, label = entries[bisect.bisect_right(bounds, value)]
+        health_score += score
+        health_factors.append(label)
     
     col1, col2 = st.columns(2)
     
     with col1:
-        # 재무 건강도 게이지
-        fig_health = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = health_score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "재무 건강도 점수"},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "#1D5091"},
-                'steps': [
-                    {'range': [0, 60], 'color': "#E4F0FF"},
-                    {'range': [60, 80], 'color': "#D6A319"},
-                    {'range': [80, 100], 'color': "#5C81C7"}
-                ],
-                'threshold': {
-                    'line': {'color': "#D6A319", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        fig_health.update_layout(height=300)
-        st.plotly_chart(fig_health, use_container_width=True)
+        # 재무 건강도 게이지 (같은 점수면 캐시된 figure 재사용)
+        st.plotly_chart(go.Figure(_health_gauge_fig(health_score)), use_container_width=True)
     
     with col2:
         st.markdown("#### 📋 평가 세부사항")
-        for factor in health_factors:
-            st.markdown(factor)
+        st.markdown("\n\n".join(health_factors))
         
         st.markdown("---")
         
@@ -1340,37 +1298,17 @@ def show_dashboard():
     
     with col1:
         st.markdown("#### 📊 자산 분포")
-        assets_data = data['assets']
-        
-        # 0이 아닌 자산만 필터링
-        non_zero_assets = {k: v for k, v in assets_data.items() if v > 0}
-        
+        non_zero_assets = overview['non_zero_assets']
+
         if non_zero_assets:
-            # 자산 유형별 색상 매핑
-            asset_colors = {
-                'checking': '#1f77b4',
-                'savings': '#ff7f0e', 
-                'investment': '#2ca02c',
-                'pension': '#d62728',
-                'isa': '#9467bd',
-                'government': '#8c564b'
-            }
-            
-            fig_pie = px.pie(
-                values=list(non_zero_assets.values()),
-                names=list(non_zero_assets.keys()),
-                title="자산 분포",
-                color_discrete_sequence=['#1D5091', '#5C81C7', '#E4F0FF', '#D6A319', '#FFFFFF']
-            )
-            fig_pie.update_layout(height=400)
-            st.plotly_chart(fig_pie, use_container_width=True)
+            st.plotly_chart(go.Figure(_asset_pie_fig(tuple(non_zero_assets.items()))),
+                            use_container_width=True)
             
             # 자산 상세 정보
             st.markdown("**자산 상세 정보:**")
-            total_assets = sum(non_zero_assets.values())
-            for asset_type, amount in non_zero_assets.items():
-                percentage = (amount / total_assets * 100) if total_assets > 0 else 0
-                st.markdown(f"• {asset_type}: {amount:,}원 ({percentage:.1f}%)")
+            st.markdown("\n\n".join(
+                f"• {asset_type}: {amount:,}원 ({amount / total_assets * 100 if total_assets > 0 else 0:.1f}%)"
+                for asset_type, amount in non_zero_assets.items()))
         else:
             st.info("자산 데이터가 없습니다.")
     
@@ -1380,42 +1318,15 @@ def show_dashboard():
         # 실제 데이터 기반 추이 (3개월치)
         months = ['1월', '2월', '3월']
         
-        # 실제 수입 데이터 (약간의 변동 포함)
-        income_data = [income * 0.95, income, income * 1.05]
-        expense_data = [expense * 1.05, expense, expense * 0.95]
-        savings_data = [income_data[i] - expense_data[i] for i in range(3)]
-        
-        fig_line = go.Figure()
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=income_data, 
-            name='수입', 
-            line=dict(color='#1D5091', width=3),
-            mode='lines+markers'
-        ))
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=expense_data, 
-            name='지출', 
-            line=dict(color='#D6A319', width=3),
-            mode='lines+markers'
-        ))
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=savings_data, 
-            name='저축', 
-            line=dict(color='#5C81C7', width=3),
-            mode='lines+markers'
-        ))
-        
-        fig_line.update_layout(
-            title="월별 재무 현황",
-            xaxis_title="월",
-            yaxis_title="금액 (원)",
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig_line, use_container_width=True)
+        # 실제 수입 데이터 (약간의 변동 포함, 저축은 벡터 연산으로 계산)
+        income_data = np.array([income * 0.95, income, income * 1.05])
+        expense_data = np.array([expense * 1.05, expense, expense * 0.95])
+        savings_data = income_data - expense_data
+
+        st.plotly_chart(
+            go.Figure(_trend_fig(tuple(months), income_data, expense_data, savings_data,
+                                 "월별 재무 현황", "월")),
+            use_container_width=True)
     
     st.markdown("---")
     
@@ -1430,28 +1341,26 @@ def show_dashboard():
     
     # 지출 관련 권장사항
     if expense_ratio > 80:
-        recommendations.append("💸 **지출 절약**: 지출을 20% 줄여서 월 {:,}원을 절약할 수 있습니다.".format(int(expense * 0.2)))
+        recommendations.append(f"💸 **지출 절약**: 지출을 20% 줄여서 월 {int(expense * 0.2):,}원을 절약할 수 있습니다.")
     elif expense_ratio > 70:
         recommendations.append("💸 **지출 관리**: 지출 관리를 더욱 철저히 하여 저축을 늘려보세요.")
     
     # 저축 관련 권장사항
     if savings_ratio < 20:
-        recommendations.append("💰 **저축 증대**: 월 저축을 {:,}원으로 늘려서 20% 저축률을 달성해보세요.".format(int(income * 0.2)))
+        recommendations.append(f"💰 **저축 증대**: 월 저축을 {int(income // 5):,}원으로 늘려서 20% 저축률을 달성해보세요.")
     
     # 신용점수 관련 권장사항
     if credit_score < 700:
         recommendations.append("📊 **신용점수 향상**: 신용카드 사용량을 30% 이하로 유지하고 정시 상환을 통해 신용점수를 향상시켜보세요.")
     
     # 자산 관련 권장사항
-    total_assets = sum(data['assets'].values())
     if total_assets < income * 6:
-        recommendations.append("🏦 **비상금 확보**: {:,}원의 비상금을 확보하여 안정적인 재무 기반을 구축해보세요.".format(int(income * 6)))
+        recommendations.append(f"🏦 **비상금 확보**: {int(income * 6):,}원의 비상금을 확보하여 안정적인 재무 기반을 구축해보세요.")
     
     if not recommendations:
         recommendations.append("🎉 **축하합니다!** 현재 재무 상태가 매우 양호합니다. 다음 단계로 투자 포트폴리오 다각화를 고려해보세요.")
     
-    for i, rec in enumerate(recommendations, 1):
-        st.markdown(f"{i}. {rec}")
+    st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)))
     
     st.markdown("---")
     
@@ -1475,8 +1384,56 @@ def show_dashboard():
             st.session_state.current_page = "📊 신용점수 관리"
             st.rerun()
 
+def _pdf_content_hash(files):
+    """(이름, 바이트) 튜플에서 PDF 원본 내용 해시를 계산 — 분석 캐시의 영속 키"""
+    digest = hashlib.blake2b(digest_size=16)
+    for _, content in files:
+        digest.update(content)
+    return digest.hexdigest()
+
+def _pdf_upload_key(uploaded_files):
+    """업로드 파일들을 (이름, 바이트) 튜플로 변환 — 내용 기준 캐시 키"""
+    return tuple((f.name, f.getvalue()) for f in uploaded_files)
+
+def _rebuild_buffers(files):
+    """(이름, 바이트) 튜플을 pdf_parser가 기대하는 파일 객체로 복원"""
+    from io import BytesIO
+    buffers = []
+    for name, content in files:
+        buf = BytesIO(content)
+        buf.name = name
+        buffers.append(buf)
+    return buffers
+
+@st.cache_data(show_spinner="PDF 파일을 분석하고 있습니다...")
+def _process_pdf_files_cached(files):
+    """PDF 파싱 결과를 파일 내용 기준으로 캐싱 (같은 파일 재업로드 시 재파싱 생략)"""
+    from pdf_parser import process_pdf_files
+    data = process_pdf_files(_rebuild_buffers(files))
+    if data:
+        data['_hash'] = _pdf_content_hash(files)
+    return data
+
+@st.cache_data(show_spinner=False)
+def _read_json_file(path, mtime):
+    """다운로드 버튼용 JSON 파일 내용 캐싱 (mtime이 바뀌면 다시 읽음)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@st.cache_data(show_spinner="PDF 파일을 JSON으로 변환하고 있습니다...")
+def _process_pdf_to_json_cached(files, save_files):
+    """PDF→JSON 변환 결과를 파일 내용 기준으로 캐싱"""
+    from pdf_parser import process_pdf_to_json
+    data, json_files = process_pdf_to_json(_rebuild_buffers(files), save_files=save_files)
+    if data:
+        data['_hash'] = _pdf_content_hash(files)
+    return data, json_files
+
 def show_pdf_upload():
     """PDF 업로드 페이지"""
+    # PDF 파싱 스택은 이 페이지에서만 쓰므로 첫 진입 시에만 임포트
+    from pdf_parser import preview_json_data
+
     st.markdown("## 📁 PDF 업로드")
     st.markdown("3개월치 자산 관련 PDF 파일을 업로드해주세요.")
     
@@ -1512,58 +1469,57 @@ def show_pdf_upload():
         
         if process_option == "📊 데이터 추출 및 분석":
             if st.button("📊 데이터 추출 및 분석", key="extract_btn"):
-                with st.spinner("PDF 파일을 분석하고 있습니다..."):
-                    # 실제 PDF 파싱 실행
-                    extracted_data = process_pdf_files(uploaded_files)
-                    if extracted_data:
-                        st.session_state.extracted_data = extracted_data
-                        st.session_state.current_page = "📈 자산 분석"  # 자산분석 페이지로 자동 이동
-                        st.success("✅ PDF 데이터 추출이 완료되었습니다! 자산분석 페이지로 이동합니다.")
-                        st.balloons()  # 축하 효과
-                        st.rerun()
-                    else:
-                        st.error("❌ PDF 파일에서 데이터를 추출할 수 없습니다. 파일 형식을 확인해주세요.")
+                # 실제 PDF 파싱 실행 (같은 파일 조합이면 캐시 적중, 스피너는 캐시 데코레이터가 표시)
+                extracted_data = _process_pdf_files_cached(_pdf_upload_key(uploaded_files))
+                if extracted_data:
+                    st.session_state.extracted_data = _normalize_data(extracted_data)
+                    st.session_state.current_page = "📈 자산 분석"  # 자산분석 페이지로 자동 이동
+                    st.success("✅ PDF 데이터 추출이 완료되었습니다! 자산분석 페이지로 이동합니다.")
+                    st.balloons()  # 축하 효과
+                    st.rerun()
+                else:
+                    st.error("❌ PDF 파일에서 데이터를 추출할 수 없습니다. 파일 형식을 확인해주세요.")
         
         elif process_option == "📄 PDF를 JSON으로 변환":
             if st.button("📄 PDF를 JSON으로 변환", key="convert_btn"):
-                with st.spinner("PDF 파일을 JSON으로 변환하고 있습니다..."):
-                    # PDF를 JSON으로 변환
-                    extracted_data, json_files = process_pdf_to_json(uploaded_files, save_files=save_json)
+                # PDF를 JSON으로 변환 (같은 파일 조합이면 캐시 적중, 스피너는 캐시 데코레이터가 표시)
+                extracted_data, json_files = _process_pdf_to_json_cached(
+                    _pdf_upload_key(uploaded_files), save_json)
+                
+                if extracted_data:
+                    st.session_state.extracted_data = _normalize_data(extracted_data)
+                    
+                    # JSON 변환 결과 표시
+                    st.success("✅ PDF를 JSON으로 변환했습니다!")
+                    
+                    # JSON 데이터 미리보기
+                    st.markdown("### 📄 JSON 데이터 미리보기")
+                    json_preview = preview_json_data(extracted_data)
+                    st.code(json_preview, language='json')
+                    
+                    # JSON 파일 다운로드 버튼
+                    if json_files:
+                        st.markdown("### 💾 JSON 파일 다운로드")
+                        for json_file in json_files:
+                            filename = os.path.basename(json_file)
+                            json_content = _read_json_file(
+                                json_file, os.path.getmtime(json_file))
+
+                            st.download_button(
+                                label=f"📥 {filename} 다운로드",
+                                data=json_content,
+                                file_name=filename,
+                                mime="application/json"
+                            )
+                    
+                    # 분석 페이지로 이동 옵션
+                    if st.button("📈 자산 분석 페이지로 이동", key="go_analysis"):
+                        st.session_state.current_page = "📈 자산 분석"
+                        st.rerun()
                     
-                    if extracted_data:
-                        st.session_state.extracted_data = extracted_data
-                        
-                        # JSON 변환 결과 표시
-                        st.success("✅ PDF를 JSON으로 변환했습니다!")
-                        
-                        # JSON 데이터 미리보기
-                        st.markdown("### 📄 JSON 데이터 미리보기")
-                        json_preview = preview_json_data(extracted_data)
-                        st.code(json_preview, language='json')
-                        
-                        # JSON 파일 다운로드 버튼
-                        if json_files:
-                            st.markdown("### 💾 JSON 파일 다운로드")
-                            for json_file in json_files:
-                                filename = os.path.basename(json_file)
-                                with open(json_file, 'r', encoding='utf-8') as f:
-                                    json_content = f.read()
-                                
-                                st.download_button(
-                                    label=f"📥 {filename} 다운로드",
-                                    data=json_content,
-                                    file_name=filename,
-                                    mime="application/json"
-                                )
-                        
-                        # 분석 페이지로 이동 옵션
-                        if st.button("📈 자산 분석 페이지로 이동", key="go_analysis"):
-                            st.session_state.current_page = "📈 자산 분석"
-                            st.rerun()
-                        
-                        st.balloons()  # 축하 효과
-                    else:
-                        st.error("❌ PDF 파일을 JSON으로 변환할 수 없습니다. 파일 형식을 확인해주세요.")
+                    st.balloons()  # 축하 효과
+                else:
+                    st.error("❌ PDF 파일을 JSON으로 변환할 수 없습니다. 파일 형식을 확인해주세요.")
 
 def extract_sample_data():
     """샘플 데이터 추출 (실제로는 PDF 파싱)"""
@@ -1588,8 +1544,21 @@ def extract_sample_data():
         ]
     }
 
+# 자산 유형별 한글명 매핑
+ASSET_LABELS = {
+    'checking': '입출금 계좌',
+    'savings': '적금/저축',
+    'investment': '투자 계좌',
+    'pension': '연금 계좌',
+    'isa': 'ISA 계좌',
+    'government': '정부지원계좌'
+}
+
 def show_asset_analysis():
     """자산 분석 페이지 - PDF 데이터 기반 상세 분석"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     st.markdown("## 📈 자산 분석")
     
     if not st.session_state.extracted_data:
@@ -1612,12 +1581,13 @@ def show_asset_analysis():
     expense = data['expense']
     savings = data['savings']
     credit_score = data['credit_score']
-    total_assets = sum(data['assets'].values())
-    
-    # 주요 지표 계산
-    expense_ratio = (expense / income * 100) if income > 0 else 0
-    savings_ratio = (savings / income * 100) if income > 0 else 0
-    asset_income_ratio = (total_assets / income) if income > 0 else 0
+
+    # 주요 지표는 대시보드와 공유하는 캐시에서 가져온다
+    overview = _overview(data)
+    total_assets = overview['total_assets']
+    expense_ratio = overview['expense_ratio']
+    savings_ratio = overview['savings_ratio']
+    asset_income_ratio = overview['asset_income_ratio']
     
     # 개선된 플랜 타입 결정 (더 정교한 기준)
     if total_assets < income * 6:  # 6개월치 생활비 미만
@@ -1691,9 +1661,7 @@ def show_asset_analysis():
     
     # AI 기반 자산 분석 생성 및 표시
     if 'asset_analysis' not in st.session_state or st.session_state.asset_analysis is None:
-        with st.spinner("🤖 AI가 PDF 데이터를 분석하고 있습니다..."):
-            asset_analysis = generate_asset_analysis(data)
-            st.session_state.asset_analysis = asset_analysis
+        st.session_state.asset_analysis = generate_asset_analysis(data)
     
     # AI 분석 결과 표시
     if st.session_state.asset_analysis:
@@ -1710,41 +1678,25 @@ def show_asset_analysis():
     
     with col1:
         st.markdown("#### 📈 자산 구성비")
-        assets_data = data['assets']
-        
-        # 0이 아닌 자산만 필터링
-        non_zero_assets = {k: v for k, v in assets_data.items() if v > 0}
-        
+        non_zero_assets = overview['non_zero_assets']
+
         if non_zero_assets:
-            # 자산 유형별 한글명 매핑
-            asset_labels = {
-                'checking': '입출금 계좌',
-                'savings': '적금/저축',
-                'investment': '투자 계좌',
-                'pension': '연금 계좌',
-                'isa': 'ISA 계좌',
-                'government': '정부지원계좌'
-            }
-            
-            # 파이 차트 생성
-            labels = [asset_labels.get(k, k) for k in non_zero_assets.keys()]
-            values = list(non_zero_assets.values())
-            
-            fig_pie = px.pie(
-                values=values,
-                names=labels,
-                title="자산 분포",
-                color_discrete_sequence=['#1D5091', '#5C81C7', '#E4F0FF', '#D6A319', '#FFFFFF']
-            )
-            fig_pie.update_layout(height=400)
-            st.plotly_chart(fig_pie, use_container_width=True)
-            
+            # (한글 라벨, 금액, 비중)을 한 번만 계산해 차트와 상세 텍스트에 공유
+            labeled_assets = tuple(
+                (ASSET_LABELS.get(k, k), v,
+                 v / total_assets * 100 if total_assets > 0 else 0)
+                for k, v in non_zero_assets.items())
+
+            # 파이 차트 생성 (한글 라벨 기준)
+            st.plotly_chart(
+                go.Figure(_asset_pie_fig(tuple((label, amount) for label, amount, _ in labeled_assets))),
+                use_container_width=True)
+
             # 자산 상세 정보
             st.markdown("**자산 상세 정보:**")
-            for asset_type, amount in non_zero_assets.items():
-                label = asset_labels.get(asset_type, asset_type)
-                percentage = (amount / total_assets * 100) if total_assets > 0 else 0
-                st.markdown(f"• {label}: {amount:,}원 ({percentage:.1f}%)")
+            st.markdown("\n\n".join(
+                f"• {label}: {amount:,}원 ({pct:.1f}%)"
+                for label, amount, pct in labeled_assets))
         else:
             st.info("자산 데이터가 없습니다.")
     
@@ -1754,42 +1706,15 @@ def show_asset_analysis():
         # 3개월 추이 시뮬레이션 (실제 데이터 기반)
         months = ['1개월 전', '현재', '1개월 후(예상)']
         
-        # 실제 수입 데이터 (약간의 변동 포함)
-        income_trend = [income * 0.95, income, income * 1.02]
-        expense_trend = [expense * 1.02, expense, expense * 0.98]
-        savings_trend = [income_trend[i] - expense_trend[i] for i in range(3)]
-        
-        fig_line = go.Figure()
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=income_trend, 
-            name='수입', 
-            line=dict(color='#1D5091', width=3),
-            mode='lines+markers'
-        ))
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=expense_trend, 
-            name='지출', 
-            line=dict(color='#D6A319', width=3),
-            mode='lines+markers'
-        ))
-        fig_line.add_trace(go.Scatter(
-            x=months, 
-            y=savings_trend, 
-            name='저축', 
-            line=dict(color='#5C81C7', width=3),
-            mode='lines+markers'
-        ))
-        
-        fig_line.update_layout(
-            title="재무 현황 추이",
-            xaxis_title="기간",
-            yaxis_title="금액 (원)",
-            height=400,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig_line, use_container_width=True)
+        # 실제 수입 데이터 (약간의 변동 포함, 저축은 벡터 연산으로 계산)
+        income_trend = np.array([income * 0.95, income, income * 1.02])
+        expense_trend = np.array([expense * 1.02, expense, expense * 0.98])
+        savings_trend = income_trend - expense_trend
+
+        st.plotly_chart(
+            go.Figure(_trend_fig(tuple(months), income_trend, expense_trend, savings_trend,
+                                 "재무 현황 추이", "기간")),
+            use_container_width=True)
     
     st.markdown("---")
     
@@ -1798,23 +1723,16 @@ def show_asset_analysis():
         st.markdown("### 💳 거래 내역 분석")
         
         transactions = data['transactions']
-        df_transactions = pd.DataFrame(transactions)
-        
-        if not df_transactions.empty:
+
+        if transactions:
             col1, col2 = st.columns(2)
             
             with col1:
                 st.markdown("#### 📊 지출 카테고리별 분석")
-                
-                # 지출만 필터링
-                expenses = df_transactions[df_transactions['amount'] < 0].copy()
-                if not expenses.empty:
-                    expenses['amount'] = expenses['amount'].abs()
-                    expense_by_category = expenses.groupby('description')['amount'].sum().sort_values(ascending=False)
-                    
-                    # 상위 10개 카테고리만 표시
-                    top_expenses = expense_by_category.head(10)
-                    
+
+                # 상위 지출 항목 집계 (같은 내역이면 캐시 적중)
+                top_expenses = _top_expense_categories(_transactions_key(transactions))
+                if top_expenses is not None:
                     fig_bar = px.bar(
                         x=top_expenses.values,
                         y=top_expenses.index,
@@ -1828,21 +1746,20 @@ def show_asset_analysis():
                     st.info("지출 데이터가 없습니다.")
             
             with col2:
-                st.markdown("#### 📅 최근 거래 내역")
-                
-                # 최근 10개 거래 표시
-                recent_transactions = df_transactions.head(10)
-                for _, transaction in recent_transactions.iterrows():
-                    amount_color = "red" if transaction['amount'] < 0 else "green"
-                    amount_text = f"{transaction['amount']:+,}원"
-                    
-                    st.markdown(f"""
-                    <div style="padding: 10px; border-left: 3px solid {amount_color}; margin: 5px 0; background-color: #f8f9fa;">
-                        <strong>{transaction.get('date', 'N/A')}</strong><br>
-                        {transaction.get('description', 'N/A')}<br>
-                        <span style="color: {amount_color}; font-weight: bold;">{amount_text}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
+                st.markdown("#### 📅 최근 거래 내역")
+
+                # 전체 내역을 Arrow 버퍼 하나로 전송 — 프론트엔드가 행을 가상화
+                # 렌더링하므로 내역이 길어도 보이는 행만 그려진다
+                import pandas as pd
+
+                df_recent = pd.DataFrame(transactions, columns=['date', 'description', 'amount'])
+                st.dataframe(
+                    df_recent.style.apply(
+                        lambda r: ['color: red' if r['amount'] < 0 else 'color: green'] * 3,
+                        axis=1),
+                    use_container_width=True,
+                    hide_index=True
+                )
     
     st.markdown("---")
     
@@ -1854,52 +1771,25 @@ def show_asset_analysis():
     with col1:
         st.markdown("#### 🎯 단기 목표 (3-6개월)")
         
-        short_term_goals = []
-        
-        if expense_ratio > 80:
-            short_term_goals.append("💸 지출을 20% 줄여서 월 {:,}원 절약하기".format(int(expense * 0.2)))
-        
-        if savings_ratio < 20:
-            short_term_goals.append("💰 월 저축을 {:,}원으로 늘리기".format(int(income * 0.2)))
-        
-        if total_assets < income * 6:
-            short_term_goals.append("🏦 비상금을 {:,}원 확보하기".format(int(income * 6)))
-        
-        if not short_term_goals:
-            short_term_goals.append("✅ 현재 상황이 양호합니다. 다음 단계로 진행하세요!")
-        
-        for i, goal in enumerate(short_term_goals, 1):
-            st.markdown(f"{i}. {goal}")
+        # 정수 나눗셈으로 한 번만 계산 (float 곱셈 + int 변환 대체)
+        expense_cut = expense // 5
+        savings_target = income // 5
+        emergency_fund = income * 6
+
+        # 조건-문구 쌍에서 해당되는 목표만 추려 튜플로 구성 (append 루프 대체)
+        short_term_goals = tuple(goal for cond, goal in (
+            (expense_ratio > 80, f"💸 지출을 20% 줄여서 월 {expense_cut:,}원 절약하기"),
+            (savings_ratio < 20, f"💰 월 저축을 {savings_target:,}원으로 늘리기"),
+            (total_assets < emergency_fund, f"🏦 비상금을 {emergency_fund:,}원 확보하기"),
+        ) if cond) or ("✅ 현재 상황이 양호합니다. 다음 단계로 진행하세요!",)
+
+        st.markdown("\n".join(f"{i}. {goal}" for i, goal in enumerate(short_term_goals, 1)))
     
     with col2:
         st.markdown("#### 🚀 중장기 목표 (6개월-2년)")
         
-        long_term_goals = []
-        
-        if plan_type == "초보자":
-            long_term_goals.extend([
-                "📈 수입 증대를 위한 스킬 개발",
-                "🏦 정부지원계좌 활용 (청년도약계좌)",
-                "💳 신용점수 750점 이상 달성",
-                "📊 투자 기초 학습 및 소액 투자 시작"
-            ])
-        elif plan_type == "성장기":
-            long_term_goals.extend([
-                "📊 투자 포트폴리오 다각화",
-                "🏦 ISA 계좌 활용으로 세제 혜택",
-                "💰 월 25% 이상 저축 목표",
-                "📈 고수익 투자 상품 검토"
-            ])
-        else:
-            long_term_goals.extend([
-                "📈 고수익 투자 상품 확대",
-                "🏦 연금 계좌 확충",
-                "💰 월 30% 이상 저축 목표",
-                "📊 자산 배분 최적화"
-            ])
-        
-        for i, goal in enumerate(long_term_goals, 1):
-            st.markdown(f"{i}. {goal}")
+        long_term_goals = LONG_TERM_GOALS.get(plan_type, LONG_TERM_GOALS["일반"])
+        st.markdown("\n".join(f"{i}. {goal}" for i, goal in enumerate(long_term_goals, 1)))
     
     st.markdown("---")
     
@@ -1921,7 +1811,7 @@ def show_asset_analysis():
             step=5
         )
         
-        target_savings_amount = int(income * target_savings_ratio / 100)
+        target_savings_amount = int(income * target_savings_ratio // 100)
         monthly_increase = target_savings_amount - current_savings
         
         st.metric("현재 월 저축", f"{current_savings:,}원")
@@ -1936,28 +1826,9 @@ def show_asset_analysis():
         st.markdown("#### 📊 투자 계획")
         
         # 투자 상품 추천
-        if plan_type == "초보자":
-            investment_recommendations = [
-                "🏦 정기예금/적금 (안정성)",
-                "📈 국채/공사채 (저위험)",
-                "💰 청년도약계좌 (정부지원)"
-            ]
-        elif plan_type == "성장기":
-            investment_recommendations = [
-                "📊 주식형 펀드 (성장성)",
-                "🏦 ISA 계좌 (세제혜택)",
-                "📈 ETF 투자 (다각화)"
-            ]
-        else:
-            investment_recommendations = [
-                "📈 개별 주식 투자",
-                "🏦 부동산 투자 신탁",
-                "📊 해외 투자 상품"
-            ]
-        
+        investment_recommendations = INVESTMENT_RECS.get(plan_type, INVESTMENT_RECS["일반"])
         st.markdown("**추천 투자 상품:**")
-        for i, rec in enumerate(investment_recommendations, 1):
-            st.markdown(f"{i}. {rec}")
+        st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(investment_recommendations, 1)))
     
     st.markdown("---")
     
@@ -1991,45 +1862,12 @@ def show_asset_analysis():
     with col2:
         st.markdown("#### 💰 현금 흐름 예측")
         
-        # 월별 현금 흐름 예측 (3개월)
-        months = ['1월', '2월', '3월']
-        
-        # 실제 수입 데이터 (약간의 변동 포함)
-        income_data = [income * 0.95, income, income * 1.05]
-        expense_data = [expense * 1.05, expense, expense * 0.95]
-        savings_data = [income_data[i] - expense_data[i] for i in range(3)]
-        
-        fig_cashflow = go.Figure()
-        fig_cashflow.add_trace(go.Scatter(
-            x=months, 
-            y=income_data, 
-            name='수입', 
-            line=dict(color='#1D5091', width=3),
-            mode='lines+markers'
-        ))
-        fig_cashflow.add_trace(go.Scatter(
-            x=months, 
-            y=expense_data, 
-            name='지출', 
-            line=dict(color='#D6A319', width=3),
-            mode='lines+markers'
-        ))
-        fig_cashflow.add_trace(go.Scatter(
-            x=months, 
-            y=savings_data, 
-            name='저축', 
-            line=dict(color='#5C81C7', width=3),
-            mode='lines+markers'
-        ))
-        
-        fig_cashflow.update_layout(
-            title="월별 현금 흐름 예측",
-            xaxis_title="월",
-            yaxis_title="금액 (원)",
-            height=300,
-            hovermode='x unified'
-        )
-        st.plotly_chart(fig_cashflow, use_container_width=True)
+        # 월별 현금 흐름 예측 — 수입/지출 지문이 같으면 Figure 객체 생성까지 건너뜀
+        cashflow_fp = (income, expense)
+        if st.session_state.get('_cashflow_fp') != cashflow_fp:
+            st.session_state._cashflow_fig = go.Figure(_cashflow_fig(income, expense))
+            st.session_state._cashflow_fp = cashflow_fp
+        st.plotly_chart(st.session_state._cashflow_fig, use_container_width=True)
     
     st.markdown("---")
     
@@ -2044,7 +1882,7 @@ def show_asset_analysis():
         target_savings = st.number_input(
             "월 저축 목표 (원)",
             min_value=0,
-            value=int(income * 0.2) if income > 0 else 0,
+            value=int(income // 5) if income > 0 else 0,
             step=100000
         )
     
@@ -2068,8 +1906,79 @@ def show_asset_analysis():
     if st.button("🎯 목표 저장", key="save_goals"):
         st.success("✅ 목표가 저장되었습니다! 정기적으로 진행 상황을 확인해보세요.")
 
+# 플랜 타입별 중장기 목표/추천 투자 상품 (재실행마다 리스트를 새로 만들지 않도록 모듈 상수)
+LONG_TERM_GOALS = {
+    "초보자": (
+        "📈 수입 증대를 위한 스킬 개발",
+        "🏦 정부지원계좌 활용 (청년도약계좌)",
+        "💳 신용점수 750점 이상 달성",
+        "📊 투자 기초 학습 및 소액 투자 시작",
+    ),
+    "성장기": (
+        "📊 투자 포트폴리오 다각화",
+        "🏦 ISA 계좌 활용으로 세제 혜택",
+        "💰 월 25% 이상 저축 목표",
+        "📈 고수익 투자 상품 검토",
+    ),
+    "일반": (
+        "📈 고수익 투자 상품 확대",
+        "🏦 연금 계좌 확충",
+        "💰 월 30% 이상 저축 목표",
+        "📊 자산 배분 최적화",
+    ),
+}
+
+INVESTMENT_RECS = {
+    "초보자": (
+        "🏦 정기예금/적금 (안정성)",
+        "📈 국채/공사채 (저위험)",
+        "💰 청년도약계좌 (정부지원)",
+    ),
+    "성장기": (
+        "📊 주식형 펀드 (성장성)",
+        "🏦 ISA 계좌 (세제혜택)",
+        "📈 ETF 투자 (다각화)",
+    ),
+    "일반": (
+        "📈 개별 주식 투자",
+        "🏦 부동산 투자 신탁",
+        "📊 해외 투자 상품",
+    ),
+}
+
+# AI 플랜 섹션 헤더 (마커, 표시 제목) — 렌더링 순서대로
+_PLAN_SECTION_HEADERS = (
+    ("## 🏛️ 청년 정부지원 금융상품", "#### 🏛️ 청년 정부지원 금융상품 상세 가이드"),
+    ("## 💰 맞춤형 저축 및 투자 전략", "#### 💰 맞춤형 저축 및 투자 전략"),
+    ("## 📊 청약 및 투자 상품별", "#### 📊 청약 및 투자 상품별 구체적 투자 금액"),
+    ("## 🎯 단계별 목표 설정", "#### 🎯 단계별 목표 설정"),
+    ("## 💡 실행 가능한 액션 플랜", "#### 💡 실행 가능한 액션 플랜"),
+    ("## 📊 예상 결과 및 시뮬레이션", "#### 📊 예상 결과 및 시뮬레이션"),
+    ("## ⚠️ 주의사항 및 리스크 관리", "#### ⚠️ 주의사항 및 리스크 관리"),
+    ("## 🌟 추천 근거", "#### 🌟 추천 근거"),
+)
+
+_PLAN_SECTION_PATTERN = re.compile(
+    "|".join(re.escape(marker) for marker, _ in _PLAN_SECTION_HEADERS))
+
+@st.cache_data(show_spinner=False)
+def split_plan_sections(plan_content):
+    """AI 플랜 문자열을 섹션 헤더 위치 기준으로 한 번에 분할
+
+    섹션마다 전체 문자열을 두 번씩 split하는 대신 finditer 한 패스로
+    헤더 오프셋을 모두 찾고 인덱스 슬라이스로 잘라낸다.
+    """
+    matches = list(_PLAN_SECTION_PATTERN.finditer(plan_content))
+    sections = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(plan_content)
+        sections[match.group(0)] = plan_content[match.end():end]
+    return sections
+
 def show_custom_plan():
     """맞춤형 플랜 페이지 - LangChain 모델 기반 상세 플랜 제공"""
+    import plotly.graph_objects as go
+
     st.markdown("## 💡 맞춤형 플랜")
     st.markdown("### 🌟 AI 기반 맞춤형 자산 관리 플랜")
 
@@ -2086,70 +1995,27 @@ def show_custom_plan():
     with col2:
         if st.button("🔄 AI 플랜 새로고침", type="primary"):
             st.session_state.ai_plan = None
+            st.session_state.plan_version += 1  # 캐시 무효화
             st.rerun()
     
     # AI 기반 맞춤형 플랜 생성 및 표시
     if 'ai_plan' not in st.session_state or st.session_state.ai_plan is None:
-        with st.spinner("🤖 AI가 맞춤형 금융 플랜을 생성하고 있습니다..."):
-            ai_plan = generate_comprehensive_financial_plan(data)
-            st.session_state.ai_plan = ai_plan
-    
+        st.session_state.ai_plan = generate_comprehensive_financial_plan(
+            data, st.session_state.plan_version)
+
     # AI 플랜 표시
     if st.session_state.ai_plan:
         st.markdown("---")
         st.markdown("### 🎯 AI 생성 맞춤형 금융 플랜")
         
-        # 플랜을 섹션별로 분리하여 표시
-        plan_content = st.session_state.ai_plan
-        
-        # 정부지원상품 섹션
-        if "청년 정부지원 금융상품" in plan_content:
-            st.markdown("#### 🏛️ 청년 정부지원 금융상품 상세 가이드")
-            gov_section = plan_content.split("## 💰 맞춤형 저축 및 투자 전략")[0].split("🏛️ 청년 정부지원 금융상품")[1]
-            st.markdown(gov_section)
-        
-        # 저축 및 투자 전략 섹션
-        if "맞춤형 저축 및 투자 전략" in plan_content:
-            st.markdown("#### 💰 맞춤형 저축 및 투자 전략")
-            savings_section = plan_content.split("## 📊 청약 및 투자 상품별")[0].split("## 💰 맞춤형 저축 및 투자 전략")[1]
-            st.markdown(savings_section)
-        
-        # 청약 및 투자 상품 섹션
-        if "청약 및 투자 상품별" in plan_content:
-            st.markdown("#### 📊 청약 및 투자 상품별 구체적 투자 금액")
-            investment_section = plan_content.split("## 🎯 단계별 목표 설정")[0].split("## 📊 청약 및 투자 상품별")[1]
-            st.markdown(investment_section)
-        
-        # 단계별 목표 설정 섹션
-        if "단계별 목표 설정" in plan_content:
-            st.markdown("#### 🎯 단계별 목표 설정")
-            goals_section = plan_content.split("## 💡 실행 가능한 액션 플랜")[0].split("## 🎯 단계별 목표 설정")[1]
-            st.markdown(goals_section)
-        
-        # 실행 가능한 액션 플랜 섹션
-        if "실행 가능한 액션 플랜" in plan_content:
-            st.markdown("#### 💡 실행 가능한 액션 플랜")
-            action_section = plan_content.split("## 📊 예상 결과 및 시뮬레이션")[0].split("## 💡 실행 가능한 액션 플랜")[1]
-            st.markdown(action_section)
-        
-        # 예상 결과 및 시뮬레이션 섹션
-        if "예상 결과 및 시뮬레이션" in plan_content:
-            st.markdown("#### 📊 예상 결과 및 시뮬레이션")
-            simulation_section = plan_content.split("## ⚠️ 주의사항 및 리스크 관리")[0].split("## 📊 예상 결과 및 시뮬레이션")[1]
-            st.markdown(simulation_section)
-        
-        # 주의사항 및 리스크 관리 섹션
-        if "주의사항 및 리스크 관리" in plan_content:
-            st.markdown("#### ⚠️ 주의사항 및 리스크 관리")
-            risk_section = plan_content.split("## 🌟 추천 근거")[0].split("## ⚠️ 주의사항 및 리스크 관리")[1]
-            st.markdown(risk_section)
-        
-        # 추천 근거 섹션
-        if "추천 근거" in plan_content:
-            st.markdown("#### 🌟 추천 근거")
-            basis_section = plan_content.split("## 🌟 추천 근거")[1]
-            st.markdown(basis_section)
-        
+        # 플랜을 섹션별로 분리하여 표시 (헤더 오프셋 한 패스 분할 결과 재사용)
+        sections = split_plan_sections(st.session_state.ai_plan)
+        for marker, title in _PLAN_SECTION_HEADERS:
+            section = sections.get(marker)
+            if section:
+                st.markdown(title)
+                st.markdown(section)
+
         # 전체 플랜을 접을 수 있는 섹션으로도 제공
         with st.expander("📋 전체 AI 플랜 보기"):
             st.markdown(st.session_state.ai_plan)
@@ -2176,7 +2042,7 @@ def show_custom_plan():
         )
     
     with col3:
-        savings_ratio = (data['income'] - data['expense']) / data['income'] * 100
+        savings_ratio = _overview(data)['implied_savings_ratio']
         st.metric(
             label="💾 저축률",
             value=f"{savings_ratio:.1f}%",
@@ -2189,35 +2055,15 @@ def show_custom_plan():
     col1, col2 = st.columns(2)
     
     with col1:
-        # 소득 안정성 점수 계산
-        income_stability_score = 0
-        if data['income'] >= 4000000:
-            income_stability_score = 90
-        elif data['income'] >= 3000000:
-            income_stability_score = 75
-        elif data['income'] >= 2000000:
-            income_stability_score = 60
-        else:
-            income_stability_score = 40
-        
-        # 소득 안정성 게이지
-        fig_stability = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = income_stability_score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "소득 안정성 점수"},
-            gauge = {
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "#1D5091"},
-                'steps': [
-                    {'range': [0, 50], 'color': "#E4F0FF"},
-                    {'range': [50, 70], 'color': "#D6A319"},
-                    {'range': [70, 100], 'color': "#5C81C7"}
-                ]
-            }
-        ))
-        fig_stability.update_layout(height=250)
-        st.plotly_chart(fig_stability, use_container_width=True)
+        # 소득 안정성 점수 (공유 파생 지표 캐시에서 조회)
+        income_stability_score = _overview(data)['income_stability_score']
+
+        # 소득 안정성 게이지 — 점수 지문이 같으면 Figure 객체 생성까지 건너뜀
+        if st.session_state.get('_stability_fp') != income_stability_score:
+            st.session_state._stability_fig = go.Figure(
+                _stability_gauge_fig(income_stability_score))
+            st.session_state._stability_fp = income_stability_score
+        st.plotly_chart(st.session_state._stability_fig, use_container_width=True)
     
     with col2:
         st.markdown("#### 📈 소득 변동 시나리오")
@@ -2292,8 +2138,7 @@ def show_custom_plan():
             "현재 지출 분석: 절약 가능 항목 파악 및 개선"
         ]
         
-        for action in immediate_actions:
-            st.markdown(f"✅ {action}")
+        st.markdown("\n".join(f"- ✅ {action}" for action in immediate_actions))
     
     with col2:
         st.markdown("#### 📋 이번 달 체크리스트")
@@ -2304,8 +2149,7 @@ def show_custom_plan():
             "정부지원상품 신규 상품 확인"
         ]
         
-        for item in monthly_checklist:
-            st.markdown(f"☐ {item}")
+        st.markdown("\n".join(f"- ☐ {item}" for item in monthly_checklist))
     
     st.markdown("---")
     
@@ -2321,8 +2165,77 @@ def show_custom_plan():
     투자 전 상품 설명서를 꼭 읽어보시고, 필요시 전문가 상담을 받으시기 바랍니다.
     """)
 
+# 신용점수 관리 팁 (완전 정적 콘텐츠 — 모듈 로드 시 한 번만 마크다운으로 조립)
+_CREDIT_TIPS_DATA = {
+    "신용카드 관리": (
+        "💳 사용량을 30% 이하로 유지하세요",
+        "⏰ 결제일을 정확히 기억하고 정시에 결제하세요",
+        "📊 여러 카드를 번갈아 사용하세요",
+    ),
+    "대출 관리": (
+        "🏦 대출 상환을 정시에 완료하세요",
+        "📈 대출 한도를 점진적으로 늘리세요",
+        "📊 대출 종류를 다양화하세요",
+    ),
+    "금융거래": (
+        "🏦 다양한 금융기관과 거래하세요",
+        "📊 정기적인 수입 증명을 제출하세요",
+        "💰 안정적인 수입을 유지하세요",
+    ),
+}
+_CREDIT_TIPS_MD = "\n\n".join(
+    f"#### {category}\n" + "\n".join(f"- {tip}" for tip in tips)
+    for category, tips in _CREDIT_TIPS_DATA.items())
+
+# 신용점수 개선 요소 (라벨, 상승 점수) — 순서 고정 튜플, 인덱스로 조회
+IMPROVEMENT_FACTORS = (
+    ("신용카드 사용량 30% 이하", 20),
+    ("정시 상환 6개월 연속", 30),
+    ("다양한 금융거래 활성화", 15),
+    ("수입 증대", 25),
+    ("신용한도 증가", 10),
+)
+
+# 신용 등급 경계 — if/elif 사다리 대신 bisect 한 번으로 조회
+_GRADE_THRESHOLDS = (600, 700, 800)
+_GRADE_LABELS = ("C", "B", "A", "A+")
+
+def score_to_grade(score):
+    """신용점수를 등급 문자로 변환"""
+    return _GRADE_LABELS[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
+
+# 등급별 설명/표시 색/혜택 (점수 사다리마다 리스트를 다시 만들지 않도록 모듈 상수)
+_GRADE_INFO = {
+    "A+": ("최우수 등급", "success", (
+        "🏦 모든 금융상품 이용 가능",
+        "💳 최고 한도 신용카드 발급",
+        "🏠 대출 금리 최우대",
+        "📊 투자 상품 우선 이용",
+    )),
+    "A": ("우수 등급", "info", (
+        "🏦 대부분 금융상품 이용 가능",
+        "💳 높은 한도 신용카드 발급",
+        "🏠 대출 금리 우대",
+        "📊 투자 상품 이용 가능",
+    )),
+    "B": ("보통 등급", "warning", (
+        "🏦 기본 금융상품 이용 가능",
+        "💳 일반 한도 신용카드 발급",
+        "🏠 대출 가능하나 금리 보통",
+        "📊 제한적 투자 상품 이용",
+    )),
+    "C": ("개선 필요 등급", "error", (
+        "🏦 제한적 금융상품 이용",
+        "💳 신용카드 발급 어려움",
+        "🏠 대출 한도 제한",
+        "📊 투자 상품 이용 제한",
+    )),
+}
+
 def show_credit_score():
     """신용점수 관리 페이지"""
+    import plotly.graph_objects as go
+
     # 기획서에 반영할 내용:
     # - 실제 금융권 적용 가능성: 신용점수 관리 가이드가 실제 신용 평가 기관의 기준과 금융 상품 연계에 부합하도록 제시
     # - 객관적 근거 자료: 신용점수 상승 요인 및 하락 요인에 대한 통계적 근거 제시, 금융사 연계 상품의 실제 효과를 데이터로 뒷받침
@@ -2348,13 +2261,13 @@ def show_credit_score():
     with col1:
         st.markdown("#### 🏦 KCB 신용점수")
         kcb_score = current_score
-        kcb_grade = "A+" if kcb_score >= 800 else "A" if kcb_score >= 700 else "B" if kcb_score >= 600 else "C"
+        kcb_grade = score_to_grade(kcb_score)
         st.markdown(f"**{kcb_score}점 ({kcb_grade}등급)**")
     
     with col2:
         st.markdown("#### 🏦 NICE 신용점수")
         nice_score = current_score + 5  # 실제로는 NICE 점수 (예시로 +5)
-        nice_grade = "A+" if nice_score >= 800 else "A" if nice_score >= 700 else "B" if nice_score >= 600 else "C"
+        nice_grade = score_to_grade(nice_score)
         st.markdown(f"**{nice_score}점 ({nice_grade}등급)**")
 
     st.markdown("---")
@@ -2364,10 +2277,11 @@ def show_credit_score():
     
     if st.button("🔄 AI 가이드 새로고침", key="refresh_credit_guide"):
         st.session_state.credit_guidance = None
+        st.session_state.plan_version += 1  # 통합 호출 캐시 무효화
     
-    if 'credit_guidance' not in st.session_state:
-        st.session_state.credit_guidance = generate_credit_guidance(data)
-    
+    if st.session_state.get('credit_guidance') is None:
+        st.session_state.credit_guidance = generate_credit_guidance(
+            data, st.session_state.plan_version)
     st.markdown(st.session_state.credit_guidance)
     
     st.markdown("---")
@@ -2378,10 +2292,11 @@ def show_credit_score():
     
     if st.button("🔄 추천 상품 새로고침", key="refresh_recommendations"):
         st.session_state.financial_recommendations = None
+        st.session_state.plan_version += 1  # 통합 호출 캐시 무효화
     
-    if 'financial_recommendations' not in st.session_state:
-        st.session_state.financial_recommendations = generate_financial_recommendations(data)
-    
+    if st.session_state.get('financial_recommendations') is None:
+        st.session_state.financial_recommendations = generate_financial_recommendations(
+            data, st.session_state.plan_version)
     st.markdown(st.session_state.financial_recommendations)
     
     st.markdown("---")
@@ -2389,79 +2304,21 @@ def show_credit_score():
     # 신용점수 등급별 상세 분석
     st.markdown("### 📈 신용점수 등급별 분석")
     
-    if current_score >= 800:
-        grade = "A+"
-        grade_description = "최우수 등급"
-        grade_color = "success"
-        grade_benefits = [
-            "🏦 모든 금융상품 이용 가능",
-            "💳 최고 한도 신용카드 발급",
-            "🏠 대출 금리 최우대",
-            "📊 투자 상품 우선 이용"
-        ]
-    elif current_score >= 700:
-        grade = "A"
-        grade_description = "우수 등급"
-        grade_color = "info"
-        grade_benefits = [
-            "🏦 대부분 금융상품 이용 가능",
-            "💳 높은 한도 신용카드 발급",
-            "🏠 대출 금리 우대",
-            "📊 투자 상품 이용 가능"
-        ]
-    elif current_score >= 600:
-        grade = "B"
-        grade_description = "보통 등급"
-        grade_color = "warning"
-        grade_benefits = [
-            "🏦 기본 금융상품 이용 가능",
-            "💳 일반 한도 신용카드 발급",
-            "🏠 대출 가능하나 금리 보통",
-            "📊 제한적 투자 상품 이용"
-        ]
-    else:
-        grade = "C"
-        grade_description = "개선 필요 등급"
-        grade_color = "error"
-        grade_benefits = [
-            "🏦 제한적 금융상품 이용",
-            "💳 신용카드 발급 어려움",
-            "🏠 대출 한도 제한",
-            "📊 투자 상품 이용 제한"
-        ]
+    grade = score_to_grade(current_score)
+    grade_description, grade_color, grade_benefits = _GRADE_INFO[grade]
     
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown(f"#### 현재 등급: {grade} ({grade_description})")
         
-        for benefit in grade_benefits:
-            st.markdown(f"✅ {benefit}")
+        st.markdown("\n".join(f"- ✅ {benefit}" for benefit in grade_benefits))
     
     with col2:
         st.markdown("#### 📊 등급별 신용점수 분포")
         
-        # 등급별 분포 차트
-        grade_data = {
-            'A+': 800,
-            'A': 700,
-            'B': 600,
-            'C': 300
-        }
-        
-        fig_grade = go.Figure(data=[
-            go.Bar(
-                x=list(grade_data.keys()),
-                y=list(grade_data.values()),
-                marker_color=['#5C81C7', '#1D5091', '#D6A319', '#E4F0FF']
-            )
-        ])
-        fig_grade.update_layout(
-            title="등급별 최소 신용점수",
-            yaxis_title="신용점수",
-            height=300
-        )
-        st.plotly_chart(fig_grade, use_container_width=True)
+        # 등급별 분포 차트 (고정 차트 — 프로세스당 1회 생성)
+        st.plotly_chart(go.Figure(_grade_bar_fig()), use_container_width=True)
     
     st.markdown("---")
     
@@ -2481,8 +2338,7 @@ def show_credit_score():
             "📈 신용한도 점진적 증가 신청"
         ]
         
-        for i, action in enumerate(immediate_actions, 1):
-            st.markdown(f"{i}. {action}")
+        st.markdown("\n".join(f"{i}. {action}" for i, action in enumerate(immediate_actions, 1)))
     
     with col2:
         st.markdown("#### 🎯 중장기 개선 방법")
@@ -2495,8 +2351,7 @@ def show_credit_score():
             "🤝 신용상담 전문가 상담"
         ]
         
-        for i, action in enumerate(long_term_actions, 1):
-            st.markdown(f"{i}. {action}")
+        st.markdown("\n".join(f"{i}. {action}" for i, action in enumerate(long_term_actions, 1)))
     
     st.markdown("---")
     
@@ -2508,22 +2363,15 @@ def show_credit_score():
     with col1:
         st.markdown("#### 📊 개선 요소별 점수 변화")
         
-        improvement_factors = {
-            "신용카드 사용량 30% 이하": 20,
-            "정시 상환 6개월 연속": 30,
-            "다양한 금융거래 활성화": 15,
-            "수입 증대": 25,
-            "신용한도 증가": 10
-        }
-        
         selected_improvements = st.multiselect(
             "개선할 요소를 선택하세요:",
-            list(improvement_factors.keys())
+            range(len(IMPROVEMENT_FACTORS)),
+            format_func=lambda i: IMPROVEMENT_FACTORS[i][0]
         )
-        
-        total_improvement = sum(improvement_factors[factor] for factor in selected_improvements)
+
+        total_improvement = sum(IMPROVEMENT_FACTORS[i][1] for i in selected_improvements)
         projected_score = min(900, current_score + total_improvement)
-        projected_grade = "A+" if projected_score >= 800 else "A" if projected_score >= 700 else "B" if projected_score >= 600 else "C"
+        projected_grade = score_to_grade(projected_score)
         
         st.metric("현재 점수", f"{current_score}점 ({grade}등급)")
         st.metric("예상 점수", f"{projected_score}점 ({projected_grade}등급)")
@@ -2540,7 +2388,7 @@ def show_credit_score():
             step=10
         )
         
-        target_grade = "A+" if target_score >= 800 else "A" if target_score >= 700 else "B" if target_score >= 600 else "C"
+        target_grade = score_to_grade(target_score)
         score_gap = target_score - current_score
         
         st.metric("목표 등급", target_grade)
@@ -2559,29 +2407,24 @@ def show_credit_score():
     # 신용점수 관리 팁
     st.markdown("### 💡 신용점수 관리 팁")
     
-    tips_data = {
-        "신용카드 관리": [
-            "💳 사용량을 30% 이하로 유지하세요",
-            "⏰ 결제일을 정확히 기억하고 정시에 결제하세요",
-            "📊 여러 카드를 번갈아 사용하세요"
-        ],
-        "대출 관리": [
-            "🏦 대출 상환을 정시에 완료하세요",
-            "📈 대출 한도를 점진적으로 늘리세요",
-            "📊 대출 종류를 다양화하세요"
-        ],
-        "금융거래": [
-            "🏦 다양한 금융기관과 거래하세요",
-            "📊 정기적인 수입 증명을 제출하세요",
-            "💰 안정적인 수입을 유지하세요"
-        ]
-    }
-    
-    for category, tips in tips_data.items():
-        st.markdown(f"#### {category}")
-        for tip in tips:
-            st.markdown(f"• {tip}")
-        st.markdown("")
+    st.markdown(_CREDIT_TIPS_MD)
+
+_CHAT_GREETING_TEMPLATE = """
+<div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin: 10px 0;">
+    <strong>🤖 머치:</strong> 안녕하세요! 저는 당신의 AI 금융 상담사 머치입니다.
+    현재 월 수입 {income:,}원, 신용점수 {credit_score}점으로 파악되었습니다.
+    어떤 금융 고민이 있으신가요? 편하게 말씀해주세요! 😊
+</div>"""
+
+# 챗봇 말풍선 HTML 틀 (메시지마다 f-string을 다시 구성하지 않도록 모듈 상수)
+_CHAT_USER_BUBBLE = """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 10px; margin: 10px 0; text-align: right;">
+    <strong>👤 나:</strong> {content}
+</div>"""
+_CHAT_AI_BUBBLE = """
+<div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin: 10px 0;">
+    <strong>🤖 머치:</strong> {content}
+</div>"""
 
 def show_financial_chatbot():
     """머치랑 대화하기 - 금융 상담 챗봇 페이지"""
@@ -2614,30 +2457,19 @@ def show_financial_chatbot():
     chat_container = st.container()
     
     with chat_container:
-        # AI 상담사 첫 인사
+        # AI 상담사 첫 인사 (모듈 상수 틀에 수치만 채움)
         if not st.session_state.chat_history:
-            st.markdown("""
-            <div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin: 10px 0;">
-                <strong>🤖 머치:</strong> 안녕하세요! 저는 당신의 AI 금융 상담사 머치입니다. 
-                현재 월 수입 {income:,}원, 신용점수 {credit_score}점으로 파악되었습니다. 
-                어떤 금융 고민이 있으신가요? 편하게 말씀해주세요! 😊
-            </div>
-            """.format(income=data['income'], credit_score=data['credit_score']), unsafe_allow_html=True)
-        
-        # 기존 대화 내용 표시
-        for message in st.session_state.chat_history:
-            if message['role'] == 'user':
-                st.markdown(f"""
-                <div style="background-color: #e3f2fd; padding: 15px; border-radius: 10px; margin: 10px 0; text-align: right;">
-                    <strong>👤 나:</strong> {message['content']}
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                st.markdown(f"""
-                <div style="background-color: #f0f2f6; padding: 15px; border-radius: 10px; margin: 10px 0;">
-                    <strong>🤖 머치:</strong> {message['content']}
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown(_CHAT_GREETING_TEMPLATE.format(
+                income=data['income'], credit_score=data['credit_score']),
+                unsafe_allow_html=True)
+        
+        # 기존 대화 내용을 HTML 한 덩어리로 묶어 한 번에 출력
+        # (메시지마다 markdown을 호출하면 델타 메시지가 대화 길이만큼 늘어난다)
+        if st.session_state.chat_history:
+            st.markdown("".join(
+                (_CHAT_USER_BUBBLE if message['role'] == 'user' else _CHAT_AI_BUBBLE)
+                .format(content=html.escape(message['content']))
+                for message in st.session_state.chat_history), unsafe_allow_html=True)
     
     # 사용자 입력
     st.markdown("---")
@@ -2723,87 +2555,88 @@ def show_financial_chatbot():
         
         # 대화 내보내기 기능
         if st.button("📥 대화 내보내기"):
-            chat_text = ""
-            for message in st.session_state.chat_history:
-                role = "나" if message['role'] == 'user' else "머치"
-                chat_text += f"[{role}]: {message['content']}\n\n"
-            
+            chat_text = "".join(
+                f"[{'나' if message['role'] == 'user' else '머치'}]: {message['content']}\n\n"
+                for message in st.session_state.chat_history)
+
             st.download_button(
                 label="💾 대화 내용 다운로드",
                 data=chat_text,
-                file_name=f"머치와의_대화_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                # 포맷 스펙 경로가 strftime 메서드 디스패치보다 빠르다
+                file_name=f"머치와의_대화_{datetime.now():%Y%m%d_%H%M%S}.txt",
                 mime="text/plain"
             )
         
-        # 대화 내용 요약
+        # 대화 내용 요약 (히스토리가 그대로면 캐시 적중 — 다른 위젯 조작에는 재생성 없음)
         if len(st.session_state.chat_history) > 2:
             st.markdown("#### 📊 이번 대화 요약")
-            summary = generate_chat_summary(st.session_state.chat_history, data)
-            st.info(summary)
+            history_key = tuple((m['role'], m['content']) for m in st.session_state.chat_history)
+            st.info(_chat_summary_cached(history_key))
+
+# 스트리밍 응답은 st.cache_data가 저장해 줄 수 없어 (질문 + 버킷) 키의 수동 캐시를 쓴다
+_ADVICE_CACHE = {}
+_ADVICE_CACHE_TTL = 3600
+
+def _advice_intent_confident(user_question):
+    """질문이 단일 의도로 확실히 분류되는지 판별
+
+    키워드 그룹이 정확히 하나만 등장하고 (키워드 2회 이상 또는 짧은 질문이면)
+    결정적 템플릿으로 충분하다고 보고 LLM 호출을 생략한다.
+    """
+    matches = [m.lastgroup for m in _ADVICE_BRANCH_RE.finditer(user_question)]
+    return len(set(matches)) == 1 and (len(matches) >= 2 or len(user_question) <= 30)
 
 def generate_financial_advice(user_question, data):
-    """사용자 질문에 대한 금융 상담 답변 생성"""
+    """사용자 질문에 대한 금융 상담 답변 생성 (캐시 미적중 시 토큰 단위 스트리밍)"""
+    # 의도가 확실한 전형적 질문은 LLM 없이 즉시 템플릿으로 응답
+    if _advice_intent_confident(user_question):
+        return get_default_financial_advice(user_question, data)
+
     llm = get_llm()
     if not llm:
         return get_default_financial_advice(user_question, data)
-    
+
+    # 같은 질문 + 비슷한 재무 프로필(버킷 단위)은 캐시에서 바로 응답
+    key = (user_question, *_bucket(data))
+    now = time.monotonic()
+    cached = _ADVICE_CACHE.get(key)
+    if cached and now - cached[0] < _ADVICE_CACHE_TTL:
+        return cached[1]
+
+    from openai import OpenAIError
     try:
-        # 금융 상담 프롬프트
-        advice_prompt = PromptTemplate(
-            input_variables=["user_question", "income", "expense", "credit_score", "assets", "savings"],
-            template="""
-            당신은 친근하고 전문적인 AI 금융 상담사 '머치'입니다. 
-            사용자의 금융 고민에 대해 구체적이고 실용적인 조언을 제공해주세요.
-            
-            사용자 정보:
-            - 월 수입: {income:,}원
-            - 월 지출: {expense:,}원
-            - 신용점수: {credit_score}점
-            - 총 자산: {assets:,}원
-            - 월 저축: {savings:,}원
-            
-            사용자 질문: {user_question}
-            
-            다음 형식으로 답변해주세요:
-            
-            1. **공감과 이해**: 사용자의 고민에 공감을 표현
-            2. **현재 상황 분석**: 사용자의 재무 상황을 고려한 분석
-            3. **구체적인 해결방안**: 실행 가능한 구체적인 조언 3-5개
-            4. **주의사항**: 주의해야 할 점이나 위험 요소
-            5. **다음 단계**: 구체적인 행동 계획
-            
-            답변은 친근하고 격려하는 톤으로, 한국어로 작성해주세요.
-            금액은 구체적으로 명시하고, 실제 금융 상품명이나 조건을 포함해주세요.
-            """
-        )
-        
-        # LangChain 체인 실행
-        chain = advice_prompt | llm
-        
-        result = chain.invoke({
-            "user_question": user_question,
-            "income": data['income'],
-            "expense": data['expense'],
-            "credit_score": data['credit_score'],
-            "assets": sum(data['assets'].values()) if isinstance(data['assets'], dict) else data['assets'],
-            "savings": data['savings']
-        })
-        
-        return result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
+        # 전체 응답을 기다리지 않고 첫 토큰부터 화면에 밀어넣는다
+        full_text = st.write_stream(_stream_llm_advice(user_question, *key[1:]))
+        _ADVICE_CACHE[key] = (now, full_text)
+        return full_text
+    except OpenAIError as e:
         st.warning(f"AI 상담 생성 실패: {e}")
         return get_default_financial_advice(user_question, data)
 
-def get_default_financial_advice(user_question, data):
-    """기본 금융 상담 답변 (AI 실패 시)"""
-    income = data['income']
-    credit_score = data['credit_score']
-    assets = sum(data['assets'].values()) if isinstance(data['assets'], dict) else data['assets']
-    savings = data['savings']
-    
-    # 질문 키워드별 기본 답변
-    if "신용점수" in user_question or "신용" in user_question:
-        return f"""
+def _stream_llm_advice(user_question, income, expense, credit_score, assets, savings):
+    """상담 LLM 스트리밍 호출 — 토큰 단위 제너레이터"""
+    llm = get_llm()
+    prompt = _FINANCIAL_ADVICE_TEMPLATE.format(
+        user_question=user_question,
+        income=income,
+        expense=expense,
+        credit_score=credit_score,
+        assets=assets,
+        savings=savings
+    )
+    stream = llm.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.7,
+        stream=True,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content
+        if delta:
+            yield delta
+
+# 기본 상담 답변 템플릿 (호출마다 수 KB 문자열 리터럴을 다시 조립하지 않도록 모듈 상수)
+_ADVICE_CREDIT_TEMPLATE = """
         💳 **신용점수 향상에 대한 조언**
         
         현재 신용점수 {credit_score}점으로 파악되었습니다. 
@@ -2814,7 +2647,7 @@ def get_default_financial_advice(user_question, data):
         3. **신용조회 최소화**: 불필요한 대출 신청 자제
         
         **3개월 내 목표:**
-        - 신용점수 {min(900, credit_score + 30)}점 달성
+        - 신용점수 {credit_target}점 달성
         - 월별 신용점수 변화 모니터링
         
         **주의사항:**
@@ -2823,15 +2656,14 @@ def get_default_financial_advice(user_question, data):
         
         현재 상황에서는 안정적인 신용 관리가 가장 중요합니다! 💪
         """
-    
-    elif "투자" in user_question or "펀드" in user_question or "주식" in user_question:
-        return f"""
+
+_ADVICE_INVEST_TEMPLATE = """
         📊 **투자 시작에 대한 조언**
         
         현재 월 저축 {savings:,}원, 총 자산 {assets:,}원으로 파악되었습니다.
         
         **투자 시작 전 체크리스트:**
-        1. ✅ 비상금 6개월치 확보 ({int(income * 6):,}원)
+        1. ✅ 비상금 6개월치 확보 ({emergency:,}원)
         2. ✅ 월 저축 계획 수립 및 실행
         3. ✅ 투자 상품 이해도 향상
         
@@ -2841,9 +2673,9 @@ def get_default_financial_advice(user_question, data):
         - **3단계 (7-12개월)**: 위험도별 포트폴리오 구축
         
         **권장 투자 비중:**
-        - 안전자산: 40% ({int(income * 0.1):,}원/월)
-        - 성장자산: 40% ({int(income * 0.1):,}원/월)
-        - 고위험자산: 20% ({int(income * 0.05):,}원/월)
+        - 안전자산: 40% ({income_pct_10:,}원/월)
+        - 성장자산: 40% ({income_pct_10:,}원/월)
+        - 고위험자산: 20% ({income_pct_05:,}원/월)
         
         **주의사항:**
         - 모든 투자는 원금 손실 가능성 있음
@@ -2852,34 +2684,40 @@ def get_default_financial_advice(user_question, data):
         
         천천히 시작해서 점진적으로 확대하는 것이 좋습니다! 🚀
         """
-    
-    elif "정부지원" in user_question or "청년" in user_question:
-        return f"""
-        🏛️ **청년 정부지원 금융상품 안내**
-        
-        현재 월 수입 {income:,}원 기준으로 가입 가능한 상품입니다.
-        
-        **가입 가능 상품:**
-        """
-        + (f"""
+
+_ADVICE_GOV_ITEM1_OK = """
         1. 🏛️ **청년도약계좌**: 연 3.5% 금리, 최대 3천만원
-           - 가입 조건: 연소득 {income * 12:,}원 (5,500만원 이하) ✅
-           - 권장 월 가입: {min(500000, int(income * 0.15)):,}원
-        """ if income * 12 <= 55000000 else """
+           - 가입 조건: 연소득 {annual_income:,}원 (5,500만원 이하) ✅
+           - 권장 월 가입: {youth_account_monthly:,}원
+        """
+
+_ADVICE_GOV_ITEM1_NO = """
         1. 🏛️ **청년도약계좌**: 연 3.5% 금리, 최대 3천만원
            - 가입 조건: 연소득 5,500만원 이하 ❌
-           - 현재 연소득: {income * 12:,}원
-        """) + (f"""
+           - 현재 연소득: {annual_income:,}원
+        """
+
+_ADVICE_GOV_ITEM2_OK = """
         
         2. 💰 **청년희망적금**: 연 2.5% 금리, 최대 1천만원
-           - 가입 조건: 연소득 {income * 12:,}원 (4,000만원 이하) ✅
-           - 권장 월 가입: {min(300000, int(income * 0.1)):,}원
-        """ if income * 12 <= 40000000 else """
+           - 가입 조건: 연소득 {annual_income:,}원 (4,000만원 이하) ✅
+           - 권장 월 가입: {hope_savings_monthly:,}원
+        """
+
+_ADVICE_GOV_ITEM2_NO = """
         
         2. 💰 **청년희망적금**: 연 2.5% 금리, 최대 1천만원
            - 가입 조건: 연소득 4,000만원 이하 ❌
-           - 현재 연소득: {income * 12:,}원
-        """) + f"""
+           - 현재 연소득: {annual_income:,}원
+        """
+
+_ADVICE_GOV_TEMPLATE = """
+        🏛️ **청년 정부지원 금융상품 안내**
+        
+        현재 월 수입 {income:,}원 기준으로 가입 가능한 상품입니다.
+        
+        **가입 가능 상품:**
+        {gov_item1}{gov_item2}
         
         **가입 전략:**
         - 우선순위: 청년도약계좌 → 청년희망적금 → 청년내일저축계좌
@@ -2893,9 +2731,8 @@ def get_default_financial_advice(user_question, data):
         
         정부지원상품을 활용하면 일반 상품보다 높은 수익을 얻을 수 있습니다! 🎯
         """
-    
-    elif "자산관리" in user_question or "자산" in user_question:
-        return f"""
+
+_ADVICE_ASSET_TEMPLATE = """
         💰 **자산 관리 전략 제안**
         
         현재 상황 분석:
@@ -2904,8 +2741,8 @@ def get_default_financial_advice(user_question, data):
         - 월 저축: {savings:,}원
         - 총 자산: {assets:,}원
         
-        **현재 저축률: {(savings / income * 100):.1f}%**
-        **목표 저축률: 25% ({int(income * 0.25):,}원)**
+        **현재 저축률: {savings_ratio:.1f}%**
+        **목표 저축률: 25% ({income_pct_25:,}원)**
         
         **개선 방안:**
         1. **지출 분석**: 월 {expense:,}원 중 절약 가능 항목 파악
@@ -2913,9 +2750,9 @@ def get_default_financial_advice(user_question, data):
         3. **목표 설정**: 단기(3개월), 중기(6개월), 장기(1년) 목표 설정
         
         **자산 배분 전략:**
-        - 비상금: {int(income * 6):,}원 (6개월치 생활비)
-        - 정기 저축: {int(income * 0.15):,}원 (소득의 15%)
-        - 투자 자금: {int(income * 0.1):,}원 (소득의 10%)
+        - 비상금: {emergency:,}원 (6개월치 생활비)
+        - 정기 저축: {income_pct_15:,}원 (소득의 15%)
+        - 투자 자금: {income_pct_10:,}원 (소득의 10%)
         
         **월별 체크리스트:**
         - [ ] 저축 목표 달성 확인
@@ -2925,16 +2762,15 @@ def get_default_financial_advice(user_question, data):
         
         체계적인 자산 관리로 안정적인 재무 상태를 만들어보세요! 📈
         """
-    
-    elif "위기" in user_question or "경제" in user_question or "불황" in user_question:
-        return f"""
+
+_ADVICE_CRISIS_TEMPLATE = """
         🚨 **경제 위기 대응 전략**
         
         현재 상황에서 경제 위기에 대비하는 방법을 제안드립니다.
         
         **즉시 실행:**
-        1. **비상금 확보**: 현재 {savings:,}원 → 목표 {int(income * 6):,}원
-        2. **지출 절약**: 월 {expense:,}원 → 목표 {int(expense * 0.8):,}원
+        1. **비상금 확보**: 현재 {savings:,}원 → 목표 {emergency:,}원
+        2. **지출 절약**: 월 {expense:,}원 → 목표 {expense_cut_target:,}원
         3. **부채 관리**: 고금리 부채 우선 상환
         
         **3개월 내 준비:**
@@ -2959,9 +2795,8 @@ def get_default_financial_advice(user_question, data):
         
         차분하게 준비하면 위기를 기회로 바꿀 수 있습니다! 💪
         """
-    
-    elif "목표" in user_question or "1억" in user_question or "큰 목표" in user_question:
-        return f"""
+
+_ADVICE_GOAL_TEMPLATE = """
         🎯 **큰 목표 달성 전략**
         
         현재 월 수입 {income:,}원, 월 저축 {savings:,}원으로 큰 목표를 달성하는 방법을 제안드립니다.
@@ -2969,19 +2804,19 @@ def get_default_financial_advice(user_question, data):
         **1억 달성 시나리오:**
         
         **보수적 시나리오 (연 4% 수익률):**
-        - 월 저축: {int(income * 0.3):,}원 (소득의 30%)
+        - 월 저축: {income_pct_30:,}원 (소득의 30%)
         - 달성 기간: 약 15-18년
-        - 복리 효과: {int(income * 0.3 * 12 * 15 * 0.3):,}원
+        - 복리 효과: {compound_conservative:,}원
         
         **균형적 시나리오 (연 6% 수익률):**
-        - 월 저축: {int(income * 0.25):,}원 (소득의 25%)
+        - 월 저축: {income_pct_25:,}원 (소득의 25%)
         - 달성 기간: 약 12-15년
-        - 복리 효과: {int(income * 0.25 * 12 * 12 * 0.4):,}원
+        - 복리 효과: {compound_balanced:,}원
         
         **공격적 시나리오 (연 8% 수익률):**
-        - 월 저축: {int(income * 0.2):,}원 (소득의 20%)
+        - 월 저축: {income_pct_20:,}원 (소득의 20%)
         - 달성 기간: 약 10-12년
-        - 복리 효과: {int(income * 0.2 * 12 * 10 * 0.5):,}원
+        - 복리 효과: {compound_aggressive:,}원
         
         **단계별 목표 설정:**
         - **1단계 (1-3년)**: 1천만원 달성
@@ -3002,9 +2837,8 @@ def get_default_financial_advice(user_question, data):
         
         큰 목표는 작은 목표들의 연속입니다. 하나씩 달성해나가면 반드시 이루어집니다! 🚀
         """
-    
-    else:
-        return f"""
+
+_ADVICE_GENERAL_TEMPLATE = """
         💡 **일반적인 금융 상담**
         
         안녕하세요! 금융에 관한 고민을 편하게 말씀해주셔서 감사합니다.
@@ -3031,49 +2865,102 @@ def get_default_financial_advice(user_question, data):
         신용점수, 투자, 저축, 대출 등 모든 금융 분야에 대해 상담해드릴 수 있습니다. 😊
         """
 
+def _advice_context(data):
+    """기본 상담 템플릿이 쓰는 파생 수치를 한 번만 계산"""
+    income = data['income']
+    expense = data['expense']
+    credit_score = data['credit_score']
+    savings = data['savings']
+    annual_income = income * 12
+    return {
+        'income': income,
+        'expense': expense,
+        'credit_score': credit_score,
+        'assets': _assets_total(data),
+        'savings': savings,
+        'annual_income': annual_income,
+        'credit_target': min(900, credit_score + 30),
+        'emergency': int(income * 6),
+        # 정수 나눗셈 유지, 통합 데이터의 평균 소득(float) 대비 int()로 방어
+        'income_pct_05': int(income // 20),
+        'income_pct_10': int(income // 10),
+        'income_pct_15': int(income * 15 // 100),
+        'income_pct_20': int(income // 5),
+        'income_pct_25': int(income // 4),
+        'income_pct_30': int(income * 3 // 10),
+        'savings_ratio': (savings / income * 100) if income > 0 else 0,
+        'expense_cut_target': int(expense * 4 // 5),
+        'youth_account_monthly': min(500000, int(income * 15 // 100)),
+        'hope_savings_monthly': min(300000, int(income // 10)),
+        'compound_conservative': int(income * 162 // 10),
+        'compound_balanced': int(income * 72 // 5),
+        'compound_aggressive': int(income * 12),
+    }
+
+# 질문 키워드 → 답변 분기 (여러 번의 in 스캔 대신 정규식 한 패스로 판별)
+_ADVICE_BRANCH_RE = re.compile(
+    "(?P<credit>신용점수|신용)|(?P<invest>투자|펀드|주식)|(?P<gov>정부지원|청년)|"
+    "(?P<asset>자산관리|자산)|(?P<crisis>위기|경제|불황)|(?P<goal>목표|1억|큰 목표)")
+# 기존 if/elif 순서와 같은 우선순위
+_ADVICE_BRANCH_PRIORITY = ("credit", "invest", "gov", "asset", "crisis", "goal")
+_ADVICE_BRANCH_TEMPLATES = {
+    "credit": _ADVICE_CREDIT_TEMPLATE,
+    "invest": _ADVICE_INVEST_TEMPLATE,
+    "asset": _ADVICE_ASSET_TEMPLATE,
+    "crisis": _ADVICE_CRISIS_TEMPLATE,
+    "goal": _ADVICE_GOAL_TEMPLATE,
+    "general": _ADVICE_GENERAL_TEMPLATE,
+}
+
+def get_default_financial_advice(user_question, data):
+    """기본 금융 상담 답변 (AI 실패 시)"""
+    ctx = _advice_context(data)
+
+    # 질문을 한 번만 훑어 등장한 키워드 그룹을 모으고, 분기 우선순위로 선택
+    hits = {m.lastgroup for m in _ADVICE_BRANCH_RE.finditer(user_question)}
+    branch = next((b for b in _ADVICE_BRANCH_PRIORITY if b in hits), "general")
+
+    if branch == "gov":
+        item1 = (_ADVICE_GOV_ITEM1_OK if ctx['annual_income'] <= 55000000
+                 else _ADVICE_GOV_ITEM1_NO).format_map(ctx)
+        item2 = (_ADVICE_GOV_ITEM2_OK if ctx['annual_income'] <= 40000000
+                 else _ADVICE_GOV_ITEM2_NO).format_map(ctx)
+        return _ADVICE_GOV_TEMPLATE.format(gov_item1=item1, gov_item2=item2, **ctx)
+
+    return _ADVICE_BRANCH_TEMPLATES[branch].format_map(ctx)
+
+# 랜덤 조언 틀 — 호출마다 8개 문자열을 모두 만들지 않고 뽑힌 하나만 채운다
+_RANDOM_ADVICE_TEMPLATES = (
+    "💡 **오늘의 금융 팁**: 월 수입 {income:,}원의 20%인 {twenty_pct:,}원을 자동이체로 저축해보세요. 작은 습관이 큰 자산을 만듭니다!",
+    "🎯 **신용점수 관리**: 현재 {credit_score}점에서 50점만 더 올리면 더 좋은 금융 상품을 이용할 수 있어요. 매월 전액 상환으로 시작해보세요!",
+    "🏛️ **정부지원상품**: 청년도약계좌 가입을 고려해보세요. 연 3.5% 금리로 안전하게 자산을 늘릴 수 있습니다.",
+    "📊 **투자 시작**: 월 {ten_pct:,}원부터 시작하는 적립식 투자를 추천합니다. 복리의 힘을 경험해보세요!",
+    "💰 **지출 관리**: 현재 지출을 10% 줄이면 월 {ten_pct:,}원을 절약할 수 있어요. 작은 변화가 큰 차이를 만듭니다!",
+    "🚀 **수입 증대**: 현재 직업 외에 부업이나 스킬 개발을 통해 월 {ten_pct:,}원의 추가 수입을 만들어보세요!",
+    "🔄 **자산 다각화**: 예금, 적금, 펀드 등 다양한 상품에 분산 투자하여 리스크를 줄이고 수익을 극대화해보세요!",
+    "📈 **장기 계획**: 10년 후를 생각해서 월 {fifteen_pct:,}원씩 투자하면 큰 자산을 만들 수 있어요!",
+)
+_RNG = random.Random()
+
 def get_random_financial_advice(data):
     """랜덤 금융 조언 생성"""
-    import random
-    
     income = data['income']
-    credit_score = data['credit_score']
-    
-    advices = [
-        f"💡 **오늘의 금융 팁**: 월 수입 {income:,}원의 20%인 {int(income * 0.2):,}원을 자동이체로 저축해보세요. 작은 습관이 큰 자산을 만듭니다!",
-        
-        f"🎯 **신용점수 관리**: 현재 {credit_score}점에서 50점만 더 올리면 더 좋은 금융 상품을 이용할 수 있어요. 매월 전액 상환으로 시작해보세요!",
-        
-        f"🏛️ **정부지원상품**: 청년도약계좌 가입을 고려해보세요. 연 3.5% 금리로 안전하게 자산을 늘릴 수 있습니다.",
-        
-        f"📊 **투자 시작**: 월 {int(income * 0.1):,}원부터 시작하는 적립식 투자를 추천합니다. 복리의 힘을 경험해보세요!",
-        
-        f"💰 **지출 관리**: 현재 지출을 10% 줄이면 월 {int(income * 0.1):,}원을 절약할 수 있어요. 작은 변화가 큰 차이를 만듭니다!",
-        
-        f"🚀 **수입 증대**: 현재 직업 외에 부업이나 스킬 개발을 통해 월 {int(income * 0.1):,}원의 추가 수입을 만들어보세요!",
-        
-        f"🔄 **자산 다각화**: 예금, 적금, 펀드 등 다양한 상품에 분산 투자하여 리스크를 줄이고 수익을 극대화해보세요!",
-        
-        f"📈 **장기 계획**: 10년 후를 생각해서 월 {int(income * 0.15):,}원씩 투자하면 큰 자산을 만들 수 있어요!"
-    ]
-    
-    return random.choice(advices)
+    template = _RANDOM_ADVICE_TEMPLATES[_RNG.randrange(len(_RANDOM_ADVICE_TEMPLATES))]
+    return template.format(
+        income=income,
+        credit_score=data['credit_score'],
+        twenty_pct=int(income // 5),
+        ten_pct=int(income // 10),
+        fifteen_pct=int(income * 15 // 100),
+    )
 
-def generate_chat_summary(chat_history, data):
-    """대화 내용 요약 생성"""
-    if len(chat_history) < 3:
-        return "대화가 충분하지 않아 요약을 생성할 수 없습니다."
-    
-    try:
-        # 간단한 요약 생성
-        user_questions = [msg['content'] for msg in chat_history if msg['role'] == 'user']
-        ai_answers = [msg['content'] for msg in chat_history if msg['role'] == 'assistant']
-        
-        summary = f"""
+# 대화 요약 틀 (호출마다 같은 안내 문구를 다시 조립하지 않도록 모듈 상수)
+_CHAT_SUMMARY_TEMPLATE = """
         **💬 이번 대화 요약**
         
-        **상담 주제**: {', '.join(user_questions[:3])}
-        **상담 횟수**: {len(user_questions)}회
-        **주요 조언**: {len(ai_answers)}개
+        **상담 주제**: {topics}
+        **상담 횟수**: {question_count}회
+        **주요 조언**: {answer_count}개
         
         **다음 단계 제안**:
         - 상담 내용을 바탕으로 맞춤형 플랜 확인
@@ -3082,8 +2969,35 @@ def generate_chat_summary(chat_history, data):
         
         더 자세한 상담이 필요하시면 언제든 말씀해주세요! 😊
         """
-        
-        return summary
+
+@st.cache_data(show_spinner=False)
+def _chat_summary_cached(history_key):
+    """(role, content) 튜플 키 기준으로 대화 요약을 캐싱"""
+    return generate_chat_summary([{'role': r, 'content': c} for r, c in history_key], None)
+
+def generate_chat_summary(chat_history, data):
+    """대화 내용 요약 생성"""
+    if len(chat_history) < 3:
+        return "대화가 충분하지 않아 요약을 생성할 수 없습니다."
+    
+    try:
+        # 한 번의 순회로 질문 수/답변 수를 세고, 주제는 앞 3개만 담아둔다
+        topics = []
+        question_count = 0
+        answer_count = 0
+        for msg in chat_history:
+            if msg['role'] == 'user':
+                question_count += 1
+                if len(topics) < 3:
+                    topics.append(msg['content'])
+            elif msg['role'] == 'assistant':
+                answer_count += 1
+
+        return _CHAT_SUMMARY_TEMPLATE.format(
+            topics=', '.join(topics),
+            question_count=question_count,
+            answer_count=answer_count
+        )
     except Exception as e:
         return f"대화 요약 생성 중 오류가 발생했습니다: {e}"
 
@@ -3092,155 +3006,144 @@ def generate_asset_analysis(data):
     llm = get_llm()
     if not llm:
         return get_default_asset_analysis(data)
-    
+
+    from openai import OpenAIError
     try:
-        # 자산 분석 프롬프트
-        analysis_prompt = PromptTemplate(
-            input_variables=["income", "expense", "credit_score", "assets", "savings", "transactions"],
-            template="""
-            업로드된 PDF 데이터를 기반으로 사용자의 자산 상황을 전문적으로 분석하고 구체적인 개선 방안을 제공해주세요.
-            
-            사용자 PDF 데이터:
-            - 월 수입: {income:,}원
-            - 월 지출: {expense:,}원
-            - 신용점수: {credit_score}점
-            - 총 자산: {assets:,}원
-            - 월 저축: {savings:,}원
-            - 거래 내역 수: {transactions}건
-            
-            다음 형식으로 전문적인 분석을 제공해주세요:
-            
-            ## 📊 PDF 데이터 기반 재무 현황 분석
-            
-            ### 🎯 주요 강점
-            - 현재 재무 상황에서 긍정적인 요소 3-4개
-            
-            ### ⚠️ 개선 필요 영역
-            - 즉시 개선이 필요한 영역 2-3개
-            
-            ### 📈 자산 증대 전략
-            - 현재 상황에 맞는 구체적인 자산 증대 방법 3-4개
-            - 각 전략별 예상 효과와 기간 명시
-            
-            ### 💰 최적화된 자산 배분
-            - 비상금: 구체적 금액과 비율
-            - 단기 저축: 구체적 금액과 상품
-            - 중장기 투자: 구체적 금액과 전략
-            
-            ### 🏛️ 정부지원상품 활용 전략
-            - 가입 가능한 정부지원상품과 구체적 가입 금액
-            - 우선순위와 가입 시기
-            
-            ### 📊 월별 실행 계획
-            - 1개월차: 즉시 실행할 항목
-            - 3개월차: 단기 목표
-            - 6개월차: 중기 목표
-            - 1년차: 장기 목표
-            
-            ### 🎯 예상 결과
-            - 1년 후 예상 자산: 구체적 금액
-            - 투자 수익률: 예상 수익률과 근거
-            - 재무 건전성 개선도: 점수화
-            
-            답변은 한국어로 작성하고, 모든 금액은 구체적으로 명시해주세요.
-            PDF에서 추출된 실제 데이터를 기반으로 한 실용적이고 실행 가능한 조언을 제공해주세요.
-            """
+        return _call_llm_analysis(
+            data['income'],
+            data['expense'],
+            data['credit_score'],
+            _assets_total(data),
+            data['savings'],
+            len(data.get('transactions', [])),
+            data.get('_hash')
         )
-        
-        # 최신 LangChain 문법 사용
-        chain = analysis_prompt | llm
-        
-        # 거래 내역 수 계산
-        transaction_count = len(data.get('transactions', []))
-        
-        result = chain.invoke({
-            "income": data['income'],
-            "expense": data['expense'],
-            "credit_score": data['credit_score'],
-            "assets": sum(data['assets'].values()) if isinstance(data['assets'], dict) else data['assets'],
-            "savings": data['savings'],
-            "transactions": transaction_count
-        })
-        
-        return result.content if hasattr(result, 'content') else str(result)
-    except Exception as e:
+    except OpenAIError as e:
         st.warning(f"AI 자산 분석 생성 실패: {e}")
         return get_default_asset_analysis(data)
 
+# persist="disk"로 프로세스 재시작 후에도 같은 PDF(내용 해시 기준)는 즉시 응답
+@st.cache_data(ttl=86400 * 7, persist="disk",
+               show_spinner="🤖 AI가 PDF 데이터를 분석하고 있습니다...")
+def _call_llm_analysis(income, expense, credit_score, assets, savings, transactions,
+                       pdf_hash=None):
+    """자산 분석 LLM 호출 (PDF 내용 해시 + 스칼라 값 기준 캐싱)"""
+    llm = get_llm()
+    prompt = _ASSET_ANALYSIS_TEMPLATE.format(
+        income=income,
+        expense=expense,
+        credit_score=credit_score,
+        assets=assets,
+        savings=savings,
+        transactions=transactions
+    )
+    result = llm.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.7,
+        messages=[{"role": "user", "content": prompt}]
+    )
+    return result.choices[0].message.content
+
 def get_default_asset_analysis(data):
     """기본 자산 분석 (AI 실패 시)"""
     income = data['income']
     expense = data['expense']
     credit_score = data['credit_score']
-    assets = sum(data['assets'].values()) if isinstance(data['assets'], dict) else data['assets']
+    assets = _assets_total(data)
     savings = data['savings']
     
     savings_ratio = (savings / income * 100) if income > 0 else 0
     expense_ratio = (expense / income * 100) if income > 0 else 0
     asset_months = (assets / income) if income > 0 else 0
-    
+
+    # 본문에서 여러 번 쓰이는 파생 금액은 지역변수로 한 번만 계산/포맷한다
+    emergency_fund = int(income * 6)
+    emergency_3m = int(income * 3)
+    save_25 = int(income // 4)
+    expense_cap = int(income * 7 // 10)
+    save_15 = int(income * 15 // 100)
+    invest_10 = int(income // 10)
+    invest_08 = int(income * 8 // 100)
+    invest_05 = int(income // 20)
+    invest_02 = int(income // 50)
+    leap_monthly = min(500000, save_15)
+    hope_monthly = min(300000, invest_10)
+    isa_monthly = min(200000, invest_08)
+    gov_annual_gain = int((leap_monthly * 35 + hope_monthly * 25) * 12 // 1000)
+    isa_tax_saving = int(isa_monthly * 12 * 15 // 100)
+    asset_goal = int(assets * 3 // 2)
+    projected_assets = int(assets + savings * 72 // 5)
+    growth_pct = (projected_assets - assets) / assets * 100 if assets > 0 else 0
+    passive_income = int(savings // 20)
+    health_score = min(100, int((savings_ratio * 2) + (100 - expense_ratio) + (credit_score / 10)))
+    
+    # 해당되는 개선 항목만 모아 한 번에 join — 수 KB 문자열의 + 연쇄 복사를 피한다
+    issue_lines = "\n    ".join(line for cond, line in (
+        (asset_months < 6, f"- 비상금 부족: 현재 {asset_months:.1f}개월분 → 목표 6개월분 ({_won(emergency_fund)}원)"),
+        (savings_ratio < 25, f"- 저축률 개선: 현재 {savings_ratio:.1f}% → 목표 25% ({_won(save_25)}원)"),
+        (expense_ratio > 75, f"- 지출 관리: 현재 {expense_ratio:.1f}% → 목표 70% 이하 ({_won(expense_cap)}원)"),
+        (credit_score < 750, f"- 신용점수 향상: 현재 {credit_score}점 → 목표 750점 이상"),
+    ) if cond)
+
     return f"""
     ## 📊 PDF 데이터 기반 재무 현황 분석
     
     ### 🎯 주요 강점
     
     ✅ **현재 재무 상황의 긍정적 요소:**
-    - 월 수입 {income:,}원으로 {"안정적인" if income >= 3000000 else "기본적인"} 소득 기반 확보
-    - 월 저축 {savings:,}원 (저축률 {savings_ratio:.1f}%)로 {"우수한" if savings_ratio >= 25 else "양호한" if savings_ratio >= 15 else "기본적인"} 저축 습관
+    - 월 수입 {_won(income)}원으로 {"안정적인" if income >= 3000000 else "기본적인"} 소득 기반 확보
+    - 월 저축 {_won(savings)}원 (저축률 {savings_ratio:.1f}%)로 {"우수한" if savings_ratio >= 25 else "양호한" if savings_ratio >= 15 else "기본적인"} 저축 습관
     - 신용점수 {credit_score}점으로 {"최우수" if credit_score >= 800 else "우수한" if credit_score >= 700 else "보통" if credit_score >= 600 else "개선 필요한"} 신용 관리
-    - 총 자산 {assets:,}원으로 {asset_months:.1f}개월분 생활비 확보
+    - 총 자산 {_won(assets)}원으로 {asset_months:.1f}개월분 생활비 확보
     
     ### ⚠️ 개선 필요 영역
     
     🔧 **즉시 개선이 필요한 영역:**
-    """ + (f"- 비상금 부족: 현재 {asset_months:.1f}개월분 → 목표 6개월분 ({int(income * 6):,}원)" if asset_months < 6 else "") + f"""
-    """ + (f"- 저축률 개선: 현재 {savings_ratio:.1f}% → 목표 25% ({int(income * 0.25):,}원)" if savings_ratio < 25 else "") + f"""
-    """ + (f"- 지출 관리: 현재 {expense_ratio:.1f}% → 목표 70% 이하 ({int(income * 0.7):,}원)" if expense_ratio > 75 else "") + f"""
-    """ + (f"- 신용점수 향상: 현재 {credit_score}점 → 목표 750점 이상" if credit_score < 750 else "") + f"""
+    {issue_lines}
     
     ### 📈 자산 증대 전략
     
     💰 **현재 상황에 맞는 구체적 전략:**
     
     1. **정부지원상품 적극 활용**
-       - 청년도약계좌: 월 {min(500000, int(income * 0.15)):,}원 (연 3.5% 금리)
-       - 청년희망적금: 월 {min(300000, int(income * 0.1)):,}원 (연 2.5% 금리)
-       - 예상 연간 수익: {int((min(500000, int(income * 0.15)) * 0.035 + min(300000, int(income * 0.1)) * 0.025) * 12):,}원
+       - 청년도약계좌: 월 {_won(leap_monthly)}원 (연 3.5% 금리)
+       - 청년희망적금: 월 {_won(hope_monthly)}원 (연 2.5% 금리)
+       - 예상 연간 수익: {_won(gov_annual_gain)}원
     
     2. **단계적 투자 포트폴리오 구축**
-       - 1단계: 안전자산 중심 (월 {int(income * 0.1):,}원)
-       - 2단계: 성장자산 확대 (월 {int(income * 0.08):,}원)
-       - 3단계: 고수익 자산 도입 (월 {int(income * 0.05):,}원)
+       - 1단계: 안전자산 중심 (월 {_won(invest_10)}원)
+       - 2단계: 성장자산 확대 (월 {_won(invest_08)}원)
+       - 3단계: 고수익 자산 도입 (월 {_won(invest_05)}원)
     
     3. **수입 증대 계획**
-       - 부업/프리랜서: 월 {int(income * 0.1):,}원 목표
-       - 스킬 개발 투자: 월 {int(income * 0.02):,}원
+       - 부업/프리랜서: 월 {_won(invest_10)}원 목표
+       - 스킬 개발 투자: 월 {_won(invest_02)}원
        - 예상 수입 증가: 6개월 내 10-20%
     
     ### 💰 최적화된 자산 배분
     
-    📊 **권장 자산 배분 (월 {income:,}원 기준):**
+    📊 **권장 자산 배분 (월 {_won(income)}원 기준):**
     
-    - **비상금**: {int(income * 6):,}원 (6개월치, 고금리 적금)
-    - **단기 저축**: 월 {int(income * 0.15):,}원 (정기예금, 청년도약계좌)
-    - **중기 투자**: 월 {int(income * 0.1):,}원 (주식형 펀드, ETF)
-    - **장기 투자**: 월 {int(income * 0.05):,}원 (연금저축, ISA)
+    - **비상금**: {_won(emergency_fund)}원 (6개월치, 고금리 적금)
+    - **단기 저축**: 월 {_won(save_15)}원 (정기예금, 청년도약계좌)
+    - **중기 투자**: 월 {_won(invest_10)}원 (주식형 펀드, ETF)
+    - **장기 투자**: 월 {_won(invest_05)}원 (연금저축, ISA)
     
     ### 🏛️ 정부지원상품 활용 전략
     
     🎯 **가입 우선순위 및 일정:**
     
     1. **1순위 - 청년도약계좌** (즉시 가입)
-       - 월 가입금액: {min(500000, int(income * 0.15)):,}원
-       - 5년간 총 {min(500000, int(income * 0.15)) * 60:,}원 적립 가능
+       - 월 가입금액: {_won(leap_monthly)}원
+       - 5년간 총 {_won(leap_monthly * 60)}원 적립 가능
     
     2. **2순위 - 청년희망적금** (1개월 후)
-       - 월 가입금액: {min(300000, int(income * 0.1)):,}원
-       - 3년간 총 {min(300000, int(income * 0.1)) * 36:,}원 적립 가능
+       - 월 가입금액: {_won(hope_monthly)}원
+       - 3년간 총 {_won(hope_monthly * 36)}원 적립 가능
     
     3. **3순위 - ISA 계좌** (3개월 후)
-       - 월 가입금액: {min(200000, int(income * 0.08)):,}원
-       - 세제혜택으로 연간 {int(min(200000, int(income * 0.08)) * 12 * 0.15):,}원 절약
+       - 월 가입금액: {_won(isa_monthly)}원
+       - 세제혜택으로 연간 {_won(isa_tax_saving)}원 절약
     
     ### 📊 월별 실행 계획
     
@@ -3253,27 +3156,27 @@ def get_default_asset_analysis(data):
     
     **3개월차 (단기 목표):**
     - 월 저축률 20% 달성
-    - 비상금 3개월치 확보 ({int(income * 3):,}원)
+    - 비상금 3개월치 확보 ({_won(emergency_3m)}원)
     - 투자 상품 교육 이수 및 소액 투자 시작
     
     **6개월차 (중기 목표):**
     - 월 저축률 25% 달성
-    - 비상금 6개월치 완성 ({int(income * 6):,}원)
+    - 비상금 6개월치 완성 ({_won(emergency_fund)}원)
     - 다양한 투자 포트폴리오 구축
     
     **1년차 (장기 목표):**
-    - 총 자산 {int(assets * 1.5):,}원 달성 (50% 증가)
-    - 월 수동소득 {int(income * 0.02):,}원 창출
+    - 총 자산 {_won(asset_goal)}원 달성 (50% 증가)
+    - 월 수동소득 {_won(invest_02)}원 창출
     - 신용점수 {min(900, credit_score + 50)}점 달성
     
     ### 🎯 예상 결과
     
     📈 **1년 후 예상 성과:**
     
-    - **예상 총 자산**: {int(assets + savings * 12 * 1.2):,}원 (현재 대비 {((assets + savings * 12 * 1.2 - assets) / assets * 100):.1f}% 증가)
+    - **예상 총 자산**: {_won(projected_assets)}원 (현재 대비 {growth_pct:.1f}% 증가)
     - **예상 투자 수익률**: 연 5-7% (분산 투자 포트폴리오)
-    - **재무 건전성 점수**: {min(100, int((savings_ratio * 2) + (100 - expense_ratio) + (credit_score / 10)))}점 (현재 대비 15-20점 향상)
-    - **월 수동소득**: {int(savings * 12 * 0.05 / 12):,}원 (배당금 및 이자 수익)
+    - **재무 건전성 점수**: {health_score}점 (현재 대비 15-20점 향상)
+    - **월 수동소득**: {_won(passive_income)}원 (배당금 및 이자 수익)
     
     **핵심 성공 요인:**
     - 정부지원상품 최대 활용으로 안전한 수익 확보
@@ -0,0 +1,50 @@
+"""
+사용자 일괄 추천액 계산기
+
+관리자 대시보드·배치 리포트처럼 다수 사용자의 추천 납입액을 한 번에 구할 때
+사용자별 파이썬 min/int 호출 대신 numpy 벡터 연산으로 계산합니다.
+상품 한도와 소득 비율은 app.py의 상담 로직(_advice_context)과 동일합니다.
+"""
+
+import numpy as np
+
+# 상품별 월 납입 한도 (원)
+LEAP_ACCOUNT_CAP = 500000      # 청년도약계좌
+HOPE_SAVINGS_CAP = 300000      # 청년희망적금
+ISA_ACCOUNT_CAP = 200000       # ISA 계좌
+
+
+def recommend(incomes):
+    """월 소득 배열에서 사용자별 추천 납입액/비상금 목표를 일괄 계산
+
+    incomes: 월 소득 정수 배열 (np.ndarray 또는 array-like)
+    반환: 같은 길이의 int 배열을 담은 dict
+      - leap: 청년도약계좌 월 납입액 (소득 15%, 한도 50만원)
+      - hope: 청년희망적금 월 납입액 (소득 10%, 한도 30만원)
+      - isa: ISA 계좌 월 납입액 (소득 8%, 한도 20만원)
+      - emergency: 비상금 목표 (6개월치 소득)
+    """
+    incomes = np.asarray(incomes, dtype=np.int64)
+    return {
+        'leap': np.minimum(LEAP_ACCOUNT_CAP, incomes * 15 // 100),
+        'hope': np.minimum(HOPE_SAVINGS_CAP, incomes // 10),
+        'isa': np.minimum(ISA_ACCOUNT_CAP, incomes * 8 // 100),
+        'emergency': incomes * 6,
+    }
+
+
+def score_users(incomes, expenses, credit_scores, savings):
+    """재무 건전성 점수(0~100)를 사용자 배열 단위로 일괄 계산
+
+    app.py의 단일 사용자 점수식과 동일한 공식의 벡터 버전입니다.
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    expenses = np.asarray(expenses, dtype=np.float64)
+    credit_scores = np.asarray(credit_scores, dtype=np.float64)
+    savings = np.asarray(savings, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        savings_ratio = np.where(incomes > 0, savings / incomes * 100, 0)
+        expense_ratio = np.where(incomes > 0, expenses / incomes * 100, 0)
+    raw = savings_ratio * 2 + (100 - expense_ratio) + credit_scores / 10
+    return np.minimum(100, raw.astype(np.int32))
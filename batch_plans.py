@@ -0,0 +1,124 @@
+"""
+종합 금융 플랜 배치 생성기
+
+실시간 응답이 필요 없는 플랜 생성(야간 일괄 재생성, "플랜 메일로 받기" 등)을
+OpenAI Batch API로 처리합니다. 동일 프롬프트를 절반 비용으로 처리할 수 있으며,
+결과는 JSON 파일 저장소에 user_id 기준으로 보관되어 앱에서 필요 시 읽어갑니다.
+
+사용 예:
+    python batch_plans.py submit users.json   # 배치 제출
+    python batch_plans.py poll <batch_id>     # 결과 수집 및 저장
+"""
+
+import json
+import os
+import sys
+
+from openai import OpenAI
+from dotenv import load_dotenv
+
+load_dotenv()
+
+BATCH_INPUT_FILE = 'plan_batch_input.jsonl'
+BATCH_RESULTS_FILE = 'plan_batch_results.json'
+
+
+def _get_client():
+    """배치 제출/조회용 OpenAI 클라이언트 생성"""
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY 환경변수가 설정되어 있지 않습니다.")
+    return OpenAI(api_key=api_key)
+
+
+def _build_plan_prompt(row):
+    """사용자 행(dict)에서 종합 플랜 프롬프트 생성 (앱과 동일한 템플릿 재사용)"""
+    # app.py의 템플릿/파생 수치 계산을 그대로 사용해 프롬프트 중복을 피한다
+    from app import _COMPREHENSIVE_PLAN_TEMPLATE, _assets_total, _derive_plan_metrics
+    metrics = _derive_plan_metrics(row['income'], row['expense'], row['credit_score'],
+                                   _assets_total(row), row['savings'])
+    return _COMPREHENSIVE_PLAN_TEMPLATE.format(**metrics)
+
+
+def submit_plan_batch(user_rows):
+    """사용자 목록에 대한 플랜 생성 배치를 제출하고 batch id를 반환
+
+    user_rows: user_id, income, expense, credit_score, assets, savings 키를
+    가진 dict의 리스트
+    """
+    client = _get_client()
+
+    with open(BATCH_INPUT_FILE, 'w', encoding='utf-8') as f:
+        for row in user_rows:
+            request = {
+                'custom_id': str(row['user_id']),
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': {
+                    'model': 'gpt-4o-mini',
+                    'temperature': 0,
+                    'messages': [
+                        {'role': 'user', 'content': _build_plan_prompt(row)}
+                    ]
+                }
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + '\n')
+
+    with open(BATCH_INPUT_FILE, 'rb') as f:
+        input_file = client.files.create(file=f, purpose='batch')
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint='/v1/chat/completions',
+        completion_window='24h'
+    )
+    print(f"배치가 제출되었습니다: {batch.id} (요청 {len(user_rows)}건)")
+    return batch.id
+
+
+def fetch_plan_batch_results(batch_id):
+    """완료된 배치의 결과를 user_id 기준 dict로 반환 (미완료 시 None)"""
+    client = _get_client()
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != 'completed':
+        print(f"배치 상태: {batch.status} (아직 결과를 가져올 수 없습니다)")
+        return None
+
+    output = client.files.content(batch.output_file_id)
+    results = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        body = item['response']['body']
+        results[item['custom_id']] = body['choices'][0]['message']['content']
+    return results
+
+
+def save_plan_batch_results(results):
+    """배치 결과를 기존 저장소와 병합하여 JSON 파일로 저장"""
+    stored = load_plan_batch_results()
+    stored.update(results)
+    with open(BATCH_RESULTS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(stored, f, ensure_ascii=False, indent=2)
+    print(f"플랜 {len(results)}건이 {BATCH_RESULTS_FILE} 파일에 저장되었습니다.")
+
+
+def load_plan_batch_results():
+    """저장된 배치 결과를 읽어 user_id 기준 dict로 반환"""
+    if not os.path.exists(BATCH_RESULTS_FILE):
+        return {}
+    with open(BATCH_RESULTS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == 'submit':
+        with open(sys.argv[2], 'r', encoding='utf-8') as f:
+            submit_plan_batch(json.load(f))
+    elif len(sys.argv) >= 3 and sys.argv[1] == 'poll':
+        fetched = fetch_plan_batch_results(sys.argv[2])
+        if fetched:
+            save_plan_batch_results(fetched)
+    else:
+        print("사용법: python batch_plans.py submit <users.json> | poll <batch_id>")
@@ -1,30 +1,174 @@
 import PyPDF2
 import re
-import pandas as pd
 from datetime import datetime
+# PDFium(C++) 경로가 있으면 텍스트 추출이 수 배 빠르고 GIL도 풀린다
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 # import streamlit as st  # Streamlit 의존성 제거
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain.prompts import PromptTemplate
 # from langchain_community.llms import OpenAI  # 필요시 주석 해제
 # from langchain.chains import LLMChain  # 필요시 주석 해제
+import functools
 import json
 import os
+# orjson(러스트 구현)이 있으면 JSON 직렬화가 수 배 빠르다 — 없으면 표준 json 사용
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# 패턴은 모듈 로드 시 1회만 컴파일하고, 필드 키워드 전체를 하나의 알터네이션으로
+# 결합해 텍스트를 단 한 번만 훑는다 (패턴별 O(n) 스캔 ~30회 → 1회).
+# 이름 붙은 그룹이 값(금액/점수/등급)만 캡처하므로 m.group(m.lastgroup)이 곧 값이다.
+
+# 수입: (그룹 이름, 연 단위 여부) — 연 단위면 12로 나눠 월 환산. 순서가 우선순위.
+_INCOME_FIELDS = (
+    ('inc_0', '급여', False),
+    ('inc_1', '수입', False),
+    ('inc_2', '월급', False),
+    ('inc_3', '월\\s*수입', False),
+    ('inc_4', '월\\s*소득', False),
+    ('inc_5', '연봉', True),
+    ('inc_6', '연\\s*소득', True),
+)
+_EXPENSE_FIELDS = (
+    ('exp_0', '지출'),
+    ('exp_1', '월\\s*지출'),
+    ('exp_2', '총\\s*지출'),
+    ('exp_3', '월\\s*생활비'),
+    ('exp_4', '고정\\s*지출'),
+)
+# 신용: 숫자 점수 그룹(crd_*)과 문자 등급 그룹(grd_*)을 구분
+_CREDIT_FIELDS = (
+    ('crd_0', '신용점수', '[0-9]+'),
+    ('crd_1', '신용\\s*점수', '[0-9]+'),
+    ('crd_2', 'KCB', '[0-9]+'),
+    ('crd_3', 'NICE', '[0-9]+'),
+    ('grd_0', '신용등급', '[A-Z][+-]?'),
+    ('grd_1', '신용\\s*등급', '[A-Z][+-]?'),
+)
+_ASSET_FIELDS = {
+    'checking': (('chk_0', '입출금'), ('chk_1', '통장'), ('chk_2', '현금'), ('chk_3', '계좌')),
+    'savings': (('sav_0', '적금'), ('sav_1', '저축'), ('sav_2', '예금'), ('sav_3', '정기예금')),
+    'investment': (('inv_0', '투자'), ('inv_1', '증권'), ('inv_2', '주식'),
+                   ('inv_3', '펀드'), ('inv_4', 'ETF')),
+    'pension': (('pen_0', '연금'), ('pen_1', '퇴직연금'), ('pen_2', '개인연금')),
+    'isa': (('isa_0', 'ISA'), ('isa_1', '개인형퇴직연금'), ('isa_2', 'IRP')),
+    'government': (('gov_0', '청년도약계좌'), ('gov_1', '희망두배통장'), ('gov_2', '정부지원'),
+                   ('gov_3', '청년희망적금'), ('gov_4', '청년내일저축계좌')),
+}
+
+def _field_alternatives():
+    """필드 스펙 전체를 (그룹 이름, 키워드, 값 패턴) 순서로 펼친다"""
+    for name, keyword, _ in _INCOME_FIELDS:
+        yield name, keyword, '[0-9,]+'
+    for name, keyword in _EXPENSE_FIELDS:
+        yield name, keyword, '[0-9,]+'
+    for name, keyword, value_pat in _CREDIT_FIELDS:
+        yield name, keyword, value_pat
+    for fields in _ASSET_FIELDS.values():
+        for name, keyword in fields:
+            yield name, keyword, '[0-9,]+'
+
+_COMBINED_FIELD_RE = re.compile('|'.join(
+    f'(?:{keyword}[:\\s]*(?P<{name}>{value_pat}))'
+    for name, keyword, value_pat in _field_alternatives()))
+# 그룹 이름 → 필드 비트: 9개 필드(수입/지출/신용/자산 6종)가 모두 채워지면 스캔 중단
+_FIELD_BIT = {name: 0 for name, _, _ in _INCOME_FIELDS}
+_FIELD_BIT.update({name: 1 for name, _ in _EXPENSE_FIELDS})
+_FIELD_BIT.update({name: 2 for name, _, _ in _CREDIT_FIELDS})
+_next_bit = 3
+for _fields in _ASSET_FIELDS.values():
+    for _name, _ in _fields:
+        _FIELD_BIT[_name] = _next_bit
+    _next_bit += 1
+_ALL_FIELDS_MASK = (1 << _next_bit) - 1
+del _next_bit, _fields, _name
+
+# 금액 문자열에서 콤마 제거용 변환 테이블 (replace보다 빠른 단일 C 패스)
+_NO_COMMA_TABLE = str.maketrans('', '', ',')
+
+_GRADE_TO_SCORE = {
+    'A+': 850, 'A': 750, 'A-': 700,
+    'B+': 650, 'B': 600, 'B-': 550,
+    'C+': 500, 'C': 450, 'C-': 400,
+    'D+': 350, 'D': 300, 'D-': 250,
+}
+
+# 날짜가 포함된 줄만 골라내는 멀티라인 패턴 — 줄 분할 없이 전체 텍스트를 1회 스캔
+_TXN_LINE_RE = re.compile(
+    r'^[^\n]*?(?P<date>\d{4}[-/]\d{1,2}[-/]\d{1,2})[^\n]*$', re.MULTILINE)
+_AMOUNT_RE = re.compile(r'([+-]?[0-9,]+)')
+_CATEGORY_GROUPS = (
+    '급여|월급|수입|소득',
+    '식비|음식|식사|외식',
+    '교통비|교통|지하철|버스|택시',
+    '주거비|월세|전세|관리비|집세',
+    '통신비|전화비|인터넷|휴대폰',
+    '의료비|병원|약|치료',
+    '교육비|학원|강의|도서',
+    '문화생활|영화|공연|취미',
+    '쇼핑|의류|화장품|생활용품',
+    '저축|적금|투자|펀드',
+    '보험|보험료',
+    '카드대금|대출상환',
+)
+_CATEGORY_RE = re.compile('|'.join(
+    f'(?P<cat_{i}>{alts})' for i, alts in enumerate(_CATEGORY_GROUPS)))
+
+# 이 페이지 수 이상이면 PyPDF2 추출을 프로세스 풀로 분할 (풀 기동 비용 회수 기준)
+_PARALLEL_PAGE_THRESHOLD = 8
+
+def _extract_pages_pypdf2(pdf_bytes, start, stop):
+    """워커 프로세스에서 페이지 구간 [start, stop)의 텍스트를 추출"""
+    from io import BytesIO
+    reader = PyPDF2.PdfReader(BytesIO(pdf_bytes))
+    # 이미지 전용 페이지는 extract_text가 None을 줄 수 있으므로 빈 문자열로 대체
+    return "".join(reader.pages[i].extract_text() or '' for i in range(start, stop))
 
 class PDFParser:
-    def __init__(self):
-        self.text_splitter = RecursiveCharacterTextSplitter(
+    @functools.cached_property
+    def text_splitter(self):
+        """텍스트 분할기 — 처음 쓰일 때 한 번만 LangChain을 임포트해 생성"""
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        return RecursiveCharacterTextSplitter(
             chunk_size=1000,
             chunk_overlap=200
         )
     
     def extract_text_from_pdf(self, pdf_file):
-        """PDF 파일에서 텍스트 추출"""
+        """PDF 파일에서 텍스트 추출 (가능하면 PDFium, 실패 시 PyPDF2)"""
         try:
+            if pdfium is not None:
+                try:
+                    pdf = pdfium.PdfDocument(pdf_file)
+                    try:
+                        return "".join(
+                            page.get_textpage().get_text_range() for page in pdf)
+                    finally:
+                        pdf.close()
+                except Exception:
+                    # PDFium이 읽지 못하는 파일은 PyPDF2로 재시도
+                    pdf_file.seek(0)
+            # PyPDF2는 순수 파이썬이라 GIL을 쥐고 있으므로 페이지가 많으면
+            # 프로세스 풀로 페이지 구간을 나눠 병렬 추출한다
             pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-            return text
+            n_pages = len(pdf_reader.pages)
+            workers = min(os.cpu_count() or 1, 4, n_pages)
+            if n_pages >= _PARALLEL_PAGE_THRESHOLD and workers > 1:
+                pdf_file.seek(0)
+                pdf_bytes = pdf_file.read()
+                bounds = [(i * n_pages // workers, (i + 1) * n_pages // workers)
+                          for i in range(workers)]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parts = executor.map(_extract_pages_pypdf2,
+                                         [pdf_bytes] * workers,
+                                         (b[0] for b in bounds),
+                                         (b[1] for b in bounds))
+                    return "".join(parts)
+            return "".join(page.extract_text() or '' for page in pdf_reader.pages)
         except Exception as e:
             # st.error(f"PDF 파일 읽기 오류: {str(e)}")  # Streamlit 의존성 제거
             print(f"PDF 파일 읽기 오류: {str(e)}")  # 일반 print로 대체
@@ -48,45 +192,36 @@ class PDFParser:
             'transactions': []
         }
         
-        # 수입 패턴 매칭
-        income_patterns = [
-            r'급여[:\s]*([0-9,]+)',
-            r'수입[:\s]*([0-9,]+)',
-            r'월급[:\s]*([0-9,]+)',
-            r'월\s*수입[:\s]*([0-9,]+)',
-            r'월\s*소득[:\s]*([0-9,]+)',
-            r'연봉[:\s]*([0-9,]+)',
-            r'연\s*소득[:\s]*([0-9,]+)'
-        ]
+        # 전체 키워드 알터네이션으로 텍스트를 한 번만 스캔하고,
+        # 그룹별 첫 매치를 모은 뒤 기존 패턴 우선순위로 필드를 확정한다
+        first = {}
+        filled = 0
+        for m in _COMBINED_FIELD_RE.finditer(text):
+            name = m.lastgroup
+            if name not in first:
+                first[name] = m.group(name)
+                filled |= 1 << _FIELD_BIT[name]
+                # 요약 블록이 문서 앞쪽에 있으면 나머지 본문 스캔을 통째로 건너뛴다
+                if filled == _ALL_FIELDS_MASK:
+                    break
         
-        for pattern in income_patterns:
-            match = re.search(pattern, text)
-            if match:
-                amount_str = match.group(1).replace(',', '')
+        # 수입 (연 단위 키워드는 월급으로 환산)
+        for name, _, is_annual in _INCOME_FIELDS:
+            value = first.get(name)
+            if value:
                 try:
-                    data['income'] = int(amount_str)
-                    # 연봉인 경우 월급으로 변환
-                    if '연봉' in pattern or '연\s*소득' in pattern:
-                        data['income'] = int(amount_str) // 12
+                    amount = int(value.translate(_NO_COMMA_TABLE))
+                    data['income'] = amount // 12 if is_annual else amount
                     break
                 except ValueError:
                     continue
         
-        # 지출 패턴 매칭
-        expense_patterns = [
-            r'지출[:\s]*([0-9,]+)',
-            r'월\s*지출[:\s]*([0-9,]+)',
-            r'총\s*지출[:\s]*([0-9,]+)',
-            r'월\s*생활비[:\s]*([0-9,]+)',
-            r'고정\s*지출[:\s]*([0-9,]+)'
-        ]
-        
-        for pattern in expense_patterns:
-            match = re.search(pattern, text)
-            if match:
-                amount_str = match.group(1).replace(',', '')
+        # 지출
+        for name, _ in _EXPENSE_FIELDS:
+            value = first.get(name)
+            if value:
                 try:
-                    data['expense'] = int(amount_str)
+                    data['expense'] = int(value.translate(_NO_COMMA_TABLE))
                     break
                 except ValueError:
                     continue
@@ -95,81 +230,23 @@ class PDFParser:
         if data['income'] > 0 and data['expense'] > 0:
             data['savings'] = data['income'] - data['expense']
         
-        # 신용점수 패턴 매칭
-        credit_patterns = [
-            r'신용점수[:\s]*([0-9]+)',
-            r'신용\s*점수[:\s]*([0-9]+)',
-            r'KCB[:\s]*([0-9]+)',
-            r'NICE[:\s]*([0-9]+)',
-            r'신용등급[:\s]*([A-Z][+-]?)',
-            r'신용\s*등급[:\s]*([A-Z][+-]?)'
-        ]
-        
-        for pattern in credit_patterns:
-            match = re.search(pattern, text)
-            if match:
-                value = match.group(1)
-                if value.isdigit():
+        # 신용점수 (숫자 점수 우선, 없으면 등급을 점수로 변환)
+        for name, _, _ in _CREDIT_FIELDS:
+            value = first.get(name)
+            if value:
+                if name.startswith('crd'):
                     data['credit_score'] = int(value)
-                    break
-                elif re.match(r'[A-Z][+-]?', value):
-                    # 등급을 점수로 변환
-                    grade_to_score = {
-                        'A+': 850, 'A': 750, 'A-': 700,
-                        'B+': 650, 'B': 600, 'B-': 550,
-                        'C+': 500, 'C': 450, 'C-': 400,
-                        'D+': 350, 'D': 300, 'D-': 250
-                    }
-                    data['credit_score'] = grade_to_score.get(value, 600)
-                    break
-        
-        # 자산 정보 추출
-        asset_patterns = {
-            'checking': [
-                r'입출금[:\s]*([0-9,]+)', 
-                r'통장[:\s]*([0-9,]+)', 
-                r'현금[:\s]*([0-9,]+)',
-                r'계좌[:\s]*([0-9,]+)'
-            ],
-            'savings': [
-                r'적금[:\s]*([0-9,]+)', 
-                r'저축[:\s]*([0-9,]+)', 
-                r'예금[:\s]*([0-9,]+)',
-                r'정기예금[:\s]*([0-9,]+)'
-            ],
-            'investment': [
-                r'투자[:\s]*([0-9,]+)', 
-                r'증권[:\s]*([0-9,]+)', 
-                r'주식[:\s]*([0-9,]+)',
-                r'펀드[:\s]*([0-9,]+)',
-                r'ETF[:\s]*([0-9,]+)'
-            ],
-            'pension': [
-                r'연금[:\s]*([0-9,]+)',
-                r'퇴직연금[:\s]*([0-9,]+)',
-                r'개인연금[:\s]*([0-9,]+)'
-            ],
-            'isa': [
-                r'ISA[:\s]*([0-9,]+)', 
-                r'개인형퇴직연금[:\s]*([0-9,]+)',
-                r'IRP[:\s]*([0-9,]+)'
-            ],
-            'government': [
-                r'청년도약계좌[:\s]*([0-9,]+)', 
-                r'희망두배통장[:\s]*([0-9,]+)', 
-                r'정부지원[:\s]*([0-9,]+)',
-                r'청년희망적금[:\s]*([0-9,]+)',
-                r'청년내일저축계좌[:\s]*([0-9,]+)'
-            ]
-        }
+                else:
+                    data['credit_score'] = _GRADE_TO_SCORE.get(value, 600)
+                break
         
-        for asset_type, patterns in asset_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    amount_str = match.group(1).replace(',', '')
+        # 자산 정보
+        for asset_type, fields in _ASSET_FIELDS.items():
+            for name, _ in fields:
+                value = first.get(name)
+                if value:
                     try:
-                        data['assets'][asset_type] = int(amount_str)
+                        data['assets'][asset_type] = int(value.translate(_NO_COMMA_TABLE))
                         break
                     except ValueError:
                         continue
@@ -180,44 +257,27 @@ class PDFParser:
         """거래 내역 추출"""
         transactions = []
         
-        # 날짜 패턴
-        date_pattern = r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})'
-        # 금액 패턴
-        amount_pattern = r'([+-]?[0-9,]+)'
-        # 카테고리 패턴
-        category_patterns = [
-            r'(급여|월급|수입|소득)',
-            r'(식비|음식|식사|외식)',
-            r'(교통비|교통|지하철|버스|택시)',
-            r'(주거비|월세|전세|관리비|집세)',
-            r'(통신비|전화비|인터넷|휴대폰)',
-            r'(의료비|병원|약|치료)',
-            r'(교육비|학원|강의|도서)',
-            r'(문화생활|영화|공연|취미)',
-            r'(쇼핑|의류|화장품|생활용품)',
-            r'(저축|적금|투자|펀드)',
-            r'(보험|보험료)',
-            r'(카드대금|대출상환)'
-        ]
-        
-        lines = text.split('\n')
-        for line in lines:
-            date_match = re.search(date_pattern, line)
-            amount_match = re.search(amount_pattern, line)
+        # 거래 줄(날짜 포함)만 C 레벨 스캔 한 번으로 찾는다 — 줄 리스트 생성과
+        # 비거래 줄에 대한 파이썬 루프 반복을 모두 생략
+        for line_match in _TXN_LINE_RE.finditer(text):
+            line = line_match.group(0)
+            amount_match = _AMOUNT_RE.search(line)
             
-            if date_match and amount_match:
-                date = date_match.group(1)
-                amount_str = amount_match.group(1).replace(',', '')
+            if amount_match:
+                date = line_match.group('date')
+                amount_str = amount_match.group(1).translate(_NO_COMMA_TABLE)
                 try:
                     amount = int(amount_str)
                     
-                    # 카테고리 추출
-                    category = "기타"
-                    for pattern in category_patterns:
-                        cat_match = re.search(pattern, line)
-                        if cat_match:
-                            category = cat_match.group(1)
-                            break
+                    # 카테고리 추출 — 한 번의 스캔으로 매치를 모으고 그룹 순서로 선택
+                    cat_hits = {}
+                    for cat_match in _CATEGORY_RE.finditer(line):
+                        if cat_match.lastgroup not in cat_hits:
+                            cat_hits[cat_match.lastgroup] = cat_match.group()
+                    category = next(
+                        (cat_hits[f'cat_{i}'] for i in range(len(_CATEGORY_GROUPS))
+                         if f'cat_{i}' in cat_hits),
+                        "기타")
                     
                     # 수입/지출 구분
                     transaction_type = "income" if amount > 0 else "expense"
@@ -272,19 +332,29 @@ class PDFParser:
         # 임시로 기본 파싱 결과 반환
         return self.parse_financial_data(text)
     
-    def convert_to_json(self, data, filename=None):
-        """데이터를 JSON 형식으로 변환"""
-        json_data = {
+    def _json_payload(self, data, filename=None, generated_at=None):
+        """메타데이터를 붙인 직렬화 대상 dict 생성
+
+        generated_at을 주면 배치 전체가 같은 타임스탬프를 공유한다
+        (파일마다 시계를 읽지 않음).
+        """
+        return {
             'metadata': {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': generated_at or datetime.now().isoformat(),
                 'source_file': filename or 'unknown',
                 'version': '1.0'
             },
             'financial_data': data
         }
+
+    def convert_to_json(self, data, filename=None, generated_at=None):
+        """데이터를 JSON 형식으로 변환"""
+        json_data = self._json_payload(data, filename, generated_at)
+        if orjson is not None:
+            return orjson.dumps(json_data, option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(json_data, ensure_ascii=False, indent=2)
     
-    def save_json_file(self, data, filename, output_dir='output'):
+    def save_json_file(self, data, filename, output_dir='output', generated_at=None):
         """JSON 파일로 저장"""
         try:
             # 출력 디렉토리 생성
@@ -295,12 +365,17 @@ class PDFParser:
             json_filename = f"{base_name}_financial_data.json"
             json_path = os.path.join(output_dir, json_filename)
             
-            # JSON 데이터 생성
-            json_data = self.convert_to_json(data, filename)
-            
-            # 파일 저장
-            with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(json_data)
+            # 파일 저장 — orjson은 bytes를 바로 쓰므로 decode→재인코딩 왕복이 없다
+            if orjson is not None:
+                payload = orjson.dumps(self._json_payload(data, filename, generated_at),
+                                       option=orjson.OPT_INDENT_2)
+                with open(json_path, 'wb') as f:
+                    f.write(payload)
+            else:
+                # 전체 문자열을 먼저 만들지 않고 파일로 바로 스트리밍 직렬화
+                with open(json_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._json_payload(data, filename, generated_at), f,
+                              ensure_ascii=False, indent=2)
             
             return json_path
         except Exception as e:
@@ -308,73 +383,92 @@ class PDFParser:
             print(f"JSON 파일 저장 오류: {str(e)}")  # 일반 print로 대체
             return None
 
+def _parse_single_pdf(parser, file):
+    """PDF 한 개에서 재무 데이터와 거래 내역을 추출 (실패 시 None)"""
+    # st.info(f"파일 처리 중: {file.name}")  # Streamlit 의존성 제거
+    print(f"파일 처리 중: {file.name}")
+
+    # 텍스트 추출
+    text = parser.extract_text_from_pdf(file)
+    if not text:
+        return None
+
+    # 기본 파싱
+    data = parser.parse_financial_data(text)
+
+    # 거래 내역 추출
+    data['transactions'] = parser.extract_transactions(text)
+
+    # LLM 분석 (선택적)
+    # llm_data = parser.analyze_with_llm(text)
+    # data.update(llm_data)
+
+    return data
+
+def _parse_pdfs(parser, uploaded_files):
+    """여러 PDF를 파싱 — 2개 이상이면 스레드 풀로 병렬 처리
+
+    파일 읽기와 네이티브 파서 호출 구간에서 GIL이 풀리므로
+    3개월치 업로드 기준 파일 수만큼 병렬화 이득이 있다.
+    반환 리스트는 입력 파일 순서와 1:1 대응하며 실패한 파일 자리는 None이다.
+    """
+    if len(uploaded_files) > 1:
+        workers = min(os.cpu_count() or 1, len(uploaded_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda f: _parse_single_pdf(parser, f), uploaded_files))
+    return [_parse_single_pdf(parser, f) for f in uploaded_files]
+
+# 파서는 상태가 없으므로 배치마다 만들지 않고 모듈 전역 싱글턴을 재사용
+_PARSER = None
+
+def get_parser():
+    """모듈 전역 PDFParser 싱글턴 반환"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = PDFParser()
+    return _PARSER
+
 def process_pdf_files(uploaded_files):
     """여러 PDF 파일 처리"""
-    parser = PDFParser()
-    all_data = []
-    
-    for file in uploaded_files:
-        # st.info(f"파일 처리 중: {file.name}")  # Streamlit 의존성 제거
-        print(f"파일 처리 중: {file.name}")
-        
-        # 텍스트 추출
-        text = parser.extract_text_from_pdf(file)
-        if text:
-            # 기본 파싱
-            data = parser.parse_financial_data(text)
-            
-            # 거래 내역 추출
-            transactions = parser.extract_transactions(text)
-            data['transactions'] = transactions
-            
-            # LLM 분석 (선택적)
-            # llm_data = parser.analyze_with_llm(text)
-            # data.update(llm_data)
-            
-            all_data.append(data)
-    
+    parser = get_parser()
+    all_data = [data for data in _parse_pdfs(parser, uploaded_files) if data]
+
     # 데이터 통합
     if all_data:
         combined_data = combine_financial_data(all_data)
         return combined_data
-    
+
     return None
 
 def process_pdf_to_json(uploaded_files, save_files=True):
     """PDF 파일을 JSON으로 변환하고 저장"""
-    parser = PDFParser()
-    all_data = []
+    parser = get_parser()
     json_files = []
-    
-    for file in uploaded_files:
-        # st.info(f"PDF를 JSON으로 변환 중: {file.name}")  # Streamlit 의존성 제거
-        print(f"PDF를 JSON으로 변환 중: {file.name}")
-        
-        # 텍스트 추출
-        text = parser.extract_text_from_pdf(file)
-        if text:
-            # 기본 파싱
-            data = parser.parse_financial_data(text)
-            
-            # 거래 내역 추출
-            transactions = parser.extract_transactions(text)
-            data['transactions'] = transactions
-            
-            all_data.append(data)
-            
-            # JSON 파일로 저장
-            if save_files:
-                json_path = parser.save_json_file(data, file.name)
-                if json_path:
-                    json_files.append(json_path)
-                    # st.success(f"JSON 파일 저장 완료: {json_path}")  # Streamlit 의존성 제거
-                    print(f"JSON 파일 저장 완료: {json_path}")
+
+    # 파싱은 병렬, 파일 저장은 순서 보존을 위해 순차 처리
+    # (results는 입력 순서 정렬 — 실패한 파일은 None이라 파일명이 밀리지 않는다)
+    results = _parse_pdfs(parser, uploaded_files)
+    all_data = [data for data in results if data]
+
+    # 배치 내 모든 파일이 같은 생성 시각을 공유 (파일마다 시계 조회 생략)
+    batch_ts = datetime.now().isoformat()
+
+    if save_files:
+        for file, data in zip(uploaded_files, results):
+            if not data:
+                continue
+            json_path = parser.save_json_file(data, file.name, generated_at=batch_ts)
+            if json_path:
+                json_files.append(json_path)
+                # st.success(f"JSON 파일 저장 완료: {json_path}")  # Streamlit 의존성 제거
+                print(f"JSON 파일 저장 완료: {json_path}")
     
     # 통합 데이터도 JSON으로 저장
     if all_data:
         combined_data = combine_financial_data(all_data)
         if save_files:
-            combined_json_path = parser.save_json_file(combined_data, "combined_financial_data")
+            combined_json_path = parser.save_json_file(combined_data, "combined_financial_data",
+                                                       generated_at=batch_ts)
             if combined_json_path:
                 json_files.append(combined_json_path)
                 # st.success(f"통합 JSON 파일 저장 완료: {combined_json_path}")  # Streamlit 의존성 제거
@@ -389,27 +483,34 @@ def combine_financial_data(data_list):
     if not data_list:
         return None
     
-    combined = {
-        'income': sum(d.get('income', 0) for d in data_list) / len(data_list),
-        'expense': sum(d.get('expense', 0) for d in data_list) / len(data_list),
-        'savings': sum(d.get('savings', 0) for d in data_list) / len(data_list),
-        'credit_score': max(d.get('credit_score', 0) for d in data_list),
-        'assets': {
-            'checking': max(d.get('assets', {}).get('checking', 0) for d in data_list),
-            'savings': max(d.get('assets', {}).get('savings', 0) for d in data_list),
-            'investment': max(d.get('assets', {}).get('investment', 0) for d in data_list),
-            'pension': max(d.get('assets', {}).get('pension', 0) for d in data_list),
-            'isa': max(d.get('assets', {}).get('isa', 0) for d in data_list),
-            'government': max(d.get('assets', {}).get('government', 0) for d in data_list)
-        },
-        'transactions': []
-    }
+    # 리스트를 16번 훑는 제너레이터 대신 한 번의 순회로 합계/최댓값을 누적
+    n = len(data_list)
+    income_sum = expense_sum = savings_sum = 0
+    credit_max = 0
+    asset_max = {'checking': 0, 'savings': 0, 'investment': 0,
+                 'pension': 0, 'isa': 0, 'government': 0}
+    transactions = []
     
-    # 모든 거래 내역 통합
     for data in data_list:
-        combined['transactions'].extend(data.get('transactions', []))
+        income_sum += data.get('income', 0)
+        expense_sum += data.get('expense', 0)
+        savings_sum += data.get('savings', 0)
+        credit_max = max(credit_max, data.get('credit_score', 0))
+        assets = data.get('assets', {})
+        for key in asset_max:
+            value = assets.get(key, 0)
+            if value > asset_max[key]:
+                asset_max[key] = value
+        transactions.extend(data.get('transactions', []))
     
-    return combined
+    return {
+        'income': income_sum / n,
+        'expense': expense_sum / n,
+        'savings': savings_sum / n,
+        'credit_score': credit_max,
+        'assets': asset_max,
+        'transactions': transactions
+    }
 
 def preview_json_data(data):
     """JSON 데이터 미리보기"""
@@ -417,7 +518,8 @@ def preview_json_data(data):
         return "데이터가 없습니다."
     
     try:
-        json_str = json.dumps(data, ensure_ascii=False, indent=2)
-        return json_str
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
+        return json.dumps(data, ensure_ascii=False, indent=2)
     except Exception as e:
         return f"JSON 변환 오류: {str(e)}"